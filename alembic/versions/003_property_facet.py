@@ -0,0 +1,53 @@
+"""Add property_facet - per-collection property value counts.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2025-03-03
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "property_facet",
+        sa.Column(
+            "collection_id",
+            sa.UUID(),
+            sa.ForeignKey("collection.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("key", sa.String(255), nullable=False),
+        sa.Column("property_type", sa.String(50), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("document_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    # md5(value): long values must not hit the btree row size limit
+    op.execute(
+        "CREATE UNIQUE INDEX ix_property_facet_collection_key_value "
+        "ON property_facet (collection_id, key, property_type, md5(value))"
+    )
+
+    # Backfill from existing documents
+    op.execute("""
+        INSERT INTO property_facet (collection_id, key, property_type, value, document_count)
+        SELECT pc.collection_id, p.key, p.property_type, p.value, COUNT(DISTINCT p.document_id)
+        FROM property p
+        JOIN document d ON d.id = p.document_id AND d.deleted_at IS NULL
+        JOIN pack pk ON pk.document_id = d.id AND pk.deleted_at IS NULL
+        JOIN pack_collection pc ON pc.pack_id = pk.id
+        GROUP BY pc.collection_id, p.key, p.property_type, p.value
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("property_facet")
@@ -0,0 +1,39 @@
+"""Untyped chunk.embedding for embeddings of any dimension.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2025-03-10
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # No per-dimension HNSW index: the default (vector precision) hybrid search scores every
+    # filtered chunk exactly, so the planner could never use one. Compact and prefix indexes
+    # for configurations that search through one are built by relrag build-indexes.
+    op.execute("ALTER TABLE chunk ALTER COLUMN embedding TYPE vector")
+
+
+def downgrade() -> None:
+    # Partial ANN indexes built since (relrag build-indexes) depend on the untyped column
+    conn = op.get_bind()
+    names = [
+        r[0]
+        for r in conn.exec_driver_sql(
+            "SELECT indexname FROM pg_indexes "
+            "WHERE tablename = 'chunk' AND left(indexname, 19) = 'ix_chunk_embedding_'"
+        )
+    ]
+    for name in names:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute("DELETE FROM chunk WHERE vector_dims(embedding) <> 1536")
+    op.execute("ALTER TABLE chunk ALTER COLUMN embedding TYPE vector(1536)")
@@ -0,0 +1,43 @@
+"""Configuration embedding_precision for halfvec and binary-quantized ANN search.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2025-03-12
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "configuration",
+        sa.Column("embedding_precision", sa.String(20), nullable=False, server_default="vector"),
+    )
+    # Every existing configuration is "vector", so no compact index is needed yet.
+    # relrag build-indexes builds ix_chunk_embedding_half_{d} (2 bytes per dimension) or
+    # ix_chunk_embedding_bit_{d} (1 bit) only for the dimensions a halfvec or bit
+    # configuration selects; chunk.embedding keeps full precision for rescoring.
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    names = [
+        r[0]
+        for r in conn.exec_driver_sql(
+            "SELECT indexname FROM pg_indexes WHERE tablename = 'chunk' "
+            "AND (left(indexname, 24) = 'ix_chunk_embedding_half_' "
+            "OR left(indexname, 23) = 'ix_chunk_embedding_bit_')"
+        )
+    ]
+    for name in names:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.drop_column("configuration", "embedding_precision")
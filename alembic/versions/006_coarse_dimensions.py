@@ -0,0 +1,44 @@
+"""Configuration coarse_dimensions with prefix (subvector) ANN indexes.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2025-03-14
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("configuration", sa.Column("coarse_dimensions", sa.Integer(), nullable=True))
+    op.create_check_constraint(
+        "ck_configuration_coarse_dimensions",
+        "configuration",
+        "coarse_dimensions IS NULL OR (coarse_dimensions > 0 "
+        "AND coarse_dimensions < embedding_dimensions)",
+    )
+    # No configuration has coarse_dimensions yet; the prefix index
+    # ix_chunk_embedding_{d}_prefix_{k} is built by relrag build-indexes once one exists.
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    names = [
+        r[0]
+        for r in conn.exec_driver_sql(
+            "SELECT indexname FROM pg_indexes WHERE tablename = 'chunk' "
+            "AND strpos(indexname, '_prefix_') > 0"
+        )
+    ]
+    for name in names:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.drop_constraint("ck_configuration_coarse_dimensions", "configuration")
+    op.drop_column("configuration", "coarse_dimensions")
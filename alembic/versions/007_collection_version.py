@@ -0,0 +1,28 @@
+"""Collection version counter for search result cache invalidation.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2025-03-18
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "collection",
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("collection", "version")
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""Load generator: concurrency ramp or open-loop target RPS over a mix of API operations.
+
+Closed loop (default): for each concurrency in --concurrency, that many workers issue
+requests back to back for --step-seconds. Open loop (--rps): requests are started on a
+fixed schedule regardless of completions and latency is measured from the scheduled start,
+so queueing delay is not hidden when the service falls behind (coordinated omission).
+
+Each step reports throughput, p50/p95/p99/p99.9 latency and error rate, overall and per
+operation; the first step that misses the SLO or stops scaling is reported as saturation.
+
+Usage:
+    export API_URL=http://localhost:8000 KEYCLOAK_URL=... (same as bench_upload.py)
+    uv run python scripts/bench_load.py --concurrency 1,2,4,8,16,32,64,128,256 --mix search=80,read=15,upload=5
+    uv run python scripts/bench_load.py --rps 10,25,50,100,200 --step-seconds 30
+
+  From bench-runner container:
+    docker compose -f docker-compose.bench.yml --profile bench run --rm bench-runner \\
+      python scripts/bench_load.py --output /results/benchmark_load.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+import httpx
+
+QUERIES = [
+    "benchmark search",
+    "vector index latency",
+    "document chunk embedding",
+    "hybrid ranking filter",
+    "collection permissions",
+]
+OPERATIONS = ("search", "read", "upload")
+
+
+@dataclass
+class Sample:
+    op: str
+    latency: float
+    status: int  # 0 for transport errors and timeouts
+
+
+@dataclass
+class Context:
+    """State shared by workers: client, auth header, seeded ids."""
+
+    client: httpx.AsyncClient
+    headers: dict[str, str]
+    collection_id: str
+    document_ids: list[str]
+    rnd: random.Random = field(default_factory=random.Random)
+
+
+async def get_token(client: httpx.AsyncClient) -> str:
+    keycloak_url = os.environ.get("KEYCLOAK_URL", "http://localhost:8080").rstrip("/")
+    realm = os.environ.get("KEYCLOAK_REALM", "relrag")
+    r = await client.post(
+        f"{keycloak_url}/realms/{realm}/protocol/openid-connect/token",
+        data={
+            "grant_type": "password",
+            "client_id": os.environ.get("KEYCLOAK_CLIENT_ID", "relrag-api"),
+            "client_secret": os.environ.get("KEYCLOAK_CLIENT_SECRET", "relrag-api-secret"),
+            "username": os.environ.get("BENCH_USER", "testuser"),
+            "password": os.environ.get("BENCH_PASSWORD", "testpass"),
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=30.0,
+    )
+    r.raise_for_status()
+    return r.json()["access_token"]
+
+
+async def refresh_auth(ctx: Context) -> None:
+    """New token per step: steps can outlive the access token lifetime."""
+    ctx.headers["Authorization"] = f"Bearer {await get_token(ctx.client)}"
+
+
+def _document(ctx: Context, i: int) -> dict:
+    words = " ".join(ctx.rnd.choice(QUERIES) for _ in range(40))
+    return {
+        "collection_id": ctx.collection_id,
+        "content": f"Load test document {i}. {words}",
+        "properties": {"source": {"value": "bench_load", "type": "string"}},
+    }
+
+
+async def setup(ctx: Context, seed_docs: int) -> None:
+    """Create a configuration and collection and seed documents to search and read."""
+    r = await ctx.client.post(
+        "/v1/configurations",
+        json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        headers=ctx.headers,
+    )
+    r.raise_for_status()
+    r = await ctx.client.post(
+        "/v1/collections", json={"configuration_id": r.json()["id"]}, headers=ctx.headers
+    )
+    r.raise_for_status()
+    ctx.collection_id = r.json()["id"]
+    sem = asyncio.Semaphore(8)
+
+    async def seed(i: int) -> None:
+        async with sem:
+            r = await ctx.client.post("/v1/documents", json=_document(ctx, i), headers=ctx.headers)
+            r.raise_for_status()
+            ctx.document_ids.append(r.json()["id"])
+
+    await asyncio.gather(*(seed(i) for i in range(seed_docs)))
+
+
+async def run_operation(ctx: Context, op: str) -> int:
+    """Issue one request; return its status code."""
+    if op == "search":
+        r = await ctx.client.post(
+            f"/v1/collections/{ctx.collection_id}/search",
+            json={"query": ctx.rnd.choice(QUERIES), "limit": 10},
+            headers=ctx.headers,
+        )
+    elif op == "read":
+        r = await ctx.client.get(
+            f"/v1/documents/{ctx.rnd.choice(ctx.document_ids)}", headers=ctx.headers
+        )
+    else:
+        r = await ctx.client.post(
+            "/v1/documents", json=_document(ctx, ctx.rnd.randrange(10**9)), headers=ctx.headers
+        )
+    return r.status_code
+
+
+async def timed(ctx: Context, op: str, started: float, samples: list[Sample]) -> None:
+    """Run op and record latency from started (the scheduled start in open loop)."""
+    try:
+        status = await run_operation(ctx, op)
+    except httpx.HTTPError:
+        status = 0
+    samples.append(Sample(op, time.perf_counter() - started, status))
+
+
+def pick_op(ctx: Context, mix: dict[str, int]) -> str:
+    return ctx.rnd.choices(list(mix), weights=list(mix.values()))[0]
+
+
+async def closed_loop_step(
+    ctx: Context, mix: dict[str, int], concurrency: int, seconds: float
+) -> list[Sample]:
+    samples: list[Sample] = []
+    deadline = time.perf_counter() + seconds
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            await timed(ctx, pick_op(ctx, mix), time.perf_counter(), samples)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return samples
+
+
+async def open_loop_step(
+    ctx: Context, mix: dict[str, int], rps: float, seconds: float, max_in_flight: int
+) -> tuple[list[Sample], int]:
+    """Start requests every 1/rps seconds; beyond max_in_flight they are dropped (counted)."""
+    samples: list[Sample] = []
+    tasks: set[asyncio.Task] = set()
+    dropped = 0
+    start = time.perf_counter()
+    for i in range(int(rps * seconds)):
+        scheduled = start + i / rps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(tasks) >= max_in_flight:
+            dropped += 1
+            continue
+        task = asyncio.create_task(timed(ctx, pick_op(ctx, mix), scheduled, samples))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks)
+    return samples, dropped
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(p / 100 * len(sorted_values)) - 1)]
+
+
+def summarize(samples: list[Sample], elapsed: float) -> dict:
+    ok = sorted(s.latency * 1000 for s in samples if 200 <= s.status < 300)
+    errors = len(samples) - len(ok)
+    return {
+        "requests": len(samples),
+        "throughput_rps": round(len(ok) / elapsed, 2) if elapsed else 0.0,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "p50_ms": round(percentile(ok, 50), 2),
+        "p95_ms": round(percentile(ok, 95), 2),
+        "p99_ms": round(percentile(ok, 99), 2),
+        "p999_ms": round(percentile(ok, 99.9), 2),
+        "status_codes": dict(Counter(str(s.status) for s in samples)),
+    }
+
+
+def find_saturation(
+    steps: list[dict], slo_p99_ms: float, slo_error_rate: float, min_gain: float, open_loop: bool
+) -> dict | None:
+    """First step that breaks the SLO or stops scaling.
+
+    Closed loop: throughput gained less than min_gain over the previous step.
+    Open loop: throughput fell short of the target RPS by more than min_gain.
+    """
+    previous = None
+    for step in steps:
+        if step["p99_ms"] > slo_p99_ms:
+            return {"step": step["load"], "reason": f"p99 {step['p99_ms']} ms > {slo_p99_ms} ms"}
+        if step["error_rate"] > slo_error_rate:
+            return {
+                "step": step["load"],
+                "reason": f"error rate {step['error_rate']} > {slo_error_rate}",
+            }
+        if open_loop and step["throughput_rps"] < step["load"] * (1 - min_gain):
+            return {
+                "step": step["load"],
+                "reason": f"throughput {step['throughput_rps']} rps below target",
+            }
+        if (
+            not open_loop
+            and previous
+            and step["throughput_rps"] < previous["throughput_rps"] * (1 + min_gain)
+        ):
+            return {
+                "step": step["load"],
+                "reason": f"throughput {step['throughput_rps']} rps vs {previous['throughput_rps']} at the previous step",
+            }
+        previous = step
+    return None
+
+
+async def run(args: argparse.Namespace) -> dict:
+    api_url = os.environ.get("API_URL", "http://localhost:8000").rstrip("/")
+    limits = httpx.Limits(
+        max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight
+    )
+    async with httpx.AsyncClient(base_url=api_url, timeout=args.timeout, limits=limits) as client:
+        ctx = Context(
+            client, {"Content-Type": "application/json"}, "", [], random.Random(args.seed)
+        )
+        await refresh_auth(ctx)
+        print(f"Seeding {args.seed_docs} documents...")
+        await setup(ctx, args.seed_docs)
+
+        open_loop = bool(args.rps)
+        loads = args.rps if open_loop else args.concurrency
+        steps = []
+        for load in loads:
+            await refresh_auth(ctx)
+            started = time.perf_counter()
+            dropped = 0
+            if open_loop:
+                samples, dropped = await open_loop_step(
+                    ctx, args.mix, load, args.step_seconds, args.max_in_flight
+                )
+            else:
+                samples = await closed_loop_step(ctx, args.mix, load, args.step_seconds)
+            elapsed = time.perf_counter() - started
+            by_op: dict[str, list[Sample]] = defaultdict(list)
+            for s in samples:
+                by_op[s.op].append(s)
+            step = {
+                "load": load,
+                **summarize(samples, elapsed),
+                "dropped": dropped,
+                "operations": {op: summarize(ss, elapsed) for op, ss in sorted(by_op.items())},
+            }
+            steps.append(step)
+            print(
+                f"{'rps' if open_loop else 'concurrency'}={load:<6} {step['throughput_rps']:>8.1f} req/s  "
+                f"p50={step['p50_ms']:.0f} p95={step['p95_ms']:.0f} p99={step['p99_ms']:.0f} "
+                f"p99.9={step['p999_ms']:.0f} ms  errors={step['error_rate']:.2%}"
+                + (f"  dropped={dropped}" if dropped else "")
+            )
+            if args.cooldown:
+                await asyncio.sleep(args.cooldown)
+
+    saturation = find_saturation(
+        steps, args.slo_p99_ms, args.slo_error_rate, args.min_gain, open_loop
+    )
+    print(f"Saturation: {saturation or 'not reached'}")
+    return {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "api_url": api_url,
+            "python": platform.python_version(),
+            "mode": "open_loop" if open_loop else "closed_loop",
+            "mix": args.mix,
+            "step_seconds": args.step_seconds,
+            "seed_docs": args.seed_docs,
+            "slo": {"p99_ms": args.slo_p99_ms, "error_rate": args.slo_error_rate},
+        },
+        "steps": steps,
+        "saturation": saturation,
+    }
+
+
+def _csv_numbers(s: str) -> list[float]:
+    return [float(x) if "." in x else int(x) for x in s.split(",") if x]
+
+
+def _mix(s: str) -> dict[str, int]:
+    mix = {}
+    for part in s.split(","):
+        op, _, weight = part.partition("=")
+        if op not in OPERATIONS:
+            raise argparse.ArgumentTypeError(
+                f"unknown operation {op!r}, expected one of {OPERATIONS}"
+            )
+        mix[op] = int(weight or 1)
+    return mix
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Load generator with concurrency ramp or open-loop RPS"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_csv_numbers,
+        default=[1, 2, 4, 8, 16, 32, 64, 128, 256],
+        help="Closed-loop worker counts per step",
+    )
+    parser.add_argument(
+        "--rps",
+        type=_csv_numbers,
+        default=[],
+        help="Open-loop target RPS per step (overrides --concurrency)",
+    )
+    parser.add_argument(
+        "--mix", type=_mix, default={"search": 80, "read": 15, "upload": 5}, help="op=weight,..."
+    )
+    parser.add_argument("--step-seconds", type=float, default=20.0, help="Duration of each step")
+    parser.add_argument("--cooldown", type=float, default=2.0, help="Pause between steps")
+    parser.add_argument(
+        "--seed-docs", type=int, default=200, help="Documents created before the ramp"
+    )
+    parser.add_argument(
+        "--max-in-flight", type=int, default=512, help="Connection and open-loop in-flight cap"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout, seconds")
+    parser.add_argument("--slo-p99-ms", type=float, default=1000.0)
+    parser.add_argument("--slo-error-rate", type=float, default=0.01)
+    parser.add_argument(
+        "--min-gain",
+        type=float,
+        default=0.05,
+        help="Throughput gain below which scaling has stopped",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", type=str, default="docs/benchmark_load.json", help="JSON output path"
+    )
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    out = Path(args.output)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    print(f"Wrote {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
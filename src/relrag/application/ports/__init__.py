@@ -3,12 +3,17 @@
 from relrag.application.ports.chunker import Chunker
 from relrag.application.ports.embedding_provider import EmbeddingProvider
 from relrag.application.ports.permission_checker import PermissionChecker
+from relrag.application.ports.reranker import Reranker, RerankerBusy
+from relrag.application.ports.search_cache import SearchCache
 from relrag.application.ports.unit_of_work import UnitOfWork, UnitOfWorkFactory
 
 __all__ = [
     "Chunker",
     "EmbeddingProvider",
     "PermissionChecker",
+    "Reranker",
+    "RerankerBusy",
+    "SearchCache",
     "UnitOfWork",
     "UnitOfWorkFactory",
 ]
@@ -6,4 +6,4 @@ from typing import Protocol
 class EmbeddingProvider(Protocol):
     """Port for generating text embeddings."""
 
-    async def embed(self, texts: list[str]) -> list[list[float]]: ...
+    async def embed(self, texts: list[str], dimensions: int | None = None) -> list[list[float]]: ...
@@ -10,3 +10,7 @@ class PermissionChecker(Protocol):
     """Port for checking user permissions on collections."""
 
     async def check(self, user_id: str, collection_id: UUID, action: PermissionAction) -> bool: ...
+
+    async def filter_allowed(
+        self, user_id: str, collection_ids: list[UUID], action: PermissionAction
+    ) -> list[UUID]: ...
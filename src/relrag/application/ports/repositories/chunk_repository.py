@@ -24,4 +24,43 @@ class ChunkRepository(Protocol):
         fts_weight: float = 0.3,
         limit: int = 10,
         property_filters: dict[str, object] | None = None,
+        after: tuple[float, UUID] | None = None,
+        group_by_document: bool = False,
+        chunks_per_document: int = 3,
+        embedding_precision: str = "vector",
+        coarse_dimensions: int | None = None,
     ) -> list[dict[str, object]]: ...
+
+    async def search_with_facets(
+        self,
+        collection_id: UUID,
+        query_embedding: list[float],
+        facet_keys: list[str],
+        query_fts: str | None = None,
+        vector_weight: float = 0.7,
+        fts_weight: float = 0.3,
+        limit: int = 10,
+        property_filters: dict[str, object] | None = None,
+        after: tuple[float, UUID] | None = None,
+        group_by_document: bool = False,
+        chunks_per_document: int = 3,
+        embedding_precision: str = "vector",
+        coarse_dimensions: int | None = None,
+    ) -> tuple[list[dict[str, object]], dict[str, dict[str, int]]]: ...
+
+    async def search_collections(
+        self,
+        collection_ids: list[UUID],
+        query_embedding: list[float],
+        query_fts: str | None = None,
+        vector_weight: float = 0.7,
+        fts_weight: float = 0.3,
+        limit: int = 10,
+        property_filters: dict[str, object] | None = None,
+        embedding_precision: str = "vector",
+        coarse_dimensions: int | None = None,
+    ) -> list[dict[str, object]]: ...
+
+    async def search_many(
+        self, collection_id: UUID, queries: list[dict[str, object]]
+    ) -> list[list[dict[str, object]]]: ...
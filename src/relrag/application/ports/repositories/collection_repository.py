@@ -28,3 +28,7 @@ class CollectionRepository(Protocol):
     async def soft_delete(self, collection_id: UUID) -> None: ...
 
     async def hard_delete(self, collection_id: UUID) -> None: ...
+
+    async def get_version(self, collection_id: UUID) -> int | None: ...
+
+    async def bump_version(self, collection_id: UUID) -> None: ...
@@ -13,4 +13,8 @@ class ConfigurationRepository(Protocol):
 
     async def get_by_collection_id(self, collection_id: UUID) -> Configuration | None: ...
 
+    async def get_by_collection_ids(
+        self, collection_ids: list[UUID]
+    ) -> dict[UUID, Configuration]: ...
+
     async def create(self, configuration: Configuration) -> Configuration: ...
@@ -11,6 +11,8 @@ class PackRepository(Protocol):
 
     async def get_by_id(self, pack_id: UUID, include_deleted: bool = False) -> Pack | None: ...
 
+    async def list_collection_ids(self, document_id: UUID) -> list[UUID]: ...
+
     async def list(
         self,
         *,
@@ -29,4 +31,4 @@ class PackRepository(Protocol):
 
     async def hard_delete(self, pack_id: UUID) -> None: ...
 
-    async def add_to_collection(self, pack_id: UUID, collection_id: UUID) -> None: ...
+    async def add_to_collection(self, pack_id: UUID, collection_id: UUID) -> bool: ...
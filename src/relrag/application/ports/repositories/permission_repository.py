@@ -17,6 +17,10 @@ class PermissionRepository(Protocol):
 
     async def get_for_collection(self, collection_id: UUID, subject: str) -> Permission | None: ...
 
+    async def list_allowed_collection_ids(
+        self, subject: str, collection_ids: list[UUID], action: str
+    ) -> list[UUID]: ...
+
     async def create(self, permission: Permission) -> Permission: ...
 
     async def update(self, permission: Permission) -> None: ...
@@ -8,17 +8,25 @@ from relrag.domain.value_objects import PropertyType
 
 
 class PropertySchemaItem:
-    """Key, type and optional distinct values for one property in a collection."""
+    """Key, type and optional distinct values for one property in a collection.
+
+    counts maps each listed value to the number of documents having it;
+    document_count is the number of documents having the key at all.
+    """
 
     def __init__(
         self,
         key: str,
         property_type: PropertyType,
         values: list[str] | None = None,
+        counts: dict[str, int] | None = None,
+        document_count: int = 0,
     ) -> None:
         self.key = key
         self.property_type = property_type
         self.values = values or []
+        self.counts = counts or {}
+        self.document_count = document_count
 
 
 class PropertyRepository(Protocol):
@@ -30,6 +38,6 @@ class PropertyRepository(Protocol):
 
     async def delete_by_document(self, document_id: UUID) -> None: ...
 
-    async def list_schema_by_collection(
-        self, collection_id: UUID
-    ) -> list[PropertySchemaItem]: ...
+    async def list_schema_by_collection(self, collection_id: UUID) -> list[PropertySchemaItem]: ...
+
+    async def add_document_to_facets(self, collection_id: UUID, document_id: UUID) -> None: ...
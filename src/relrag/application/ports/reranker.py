@@ -0,0 +1,13 @@
+"""Reranker port - relevance scoring of (query, passage) pairs."""
+
+from typing import Protocol
+
+
+class RerankerBusy(Exception):
+    """Raised instead of queueing when the reranker has no free capacity."""
+
+
+class Reranker(Protocol):
+    """Port for reranking retrieved passages against the query."""
+
+    async def rerank(self, query: str, texts: list[str]) -> list[float]: ...
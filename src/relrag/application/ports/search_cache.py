@@ -0,0 +1,11 @@
+"""Search cache port - memoized search outputs keyed by query and collection version."""
+
+from typing import Any, Protocol
+
+
+class SearchCache(Protocol):
+    """Port for caching search outputs."""
+
+    async def get(self, key: str) -> Any | None: ...
+
+    async def set(self, key: str, value: Any) -> None: ...
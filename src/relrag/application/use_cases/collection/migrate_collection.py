@@ -48,6 +48,8 @@ class MigrateCollectionUseCase:
             )
             migrated = 0
             now = datetime.now(UTC)
+            # Packs are shared by source hash: re-chunking one changes every linked collection
+            affected = {collection_id}
 
             for pack in packs:
                 doc = await uow.documents.get_by_id(pack.document_id)
@@ -60,7 +62,10 @@ class MigrateCollectionUseCase:
                     strategy=new_config.chunking_strategy,
                 )
                 chunks_text = self._chunker.chunk(doc.content, chunking_config)
-                embeddings = await self._embedding_provider.embed(chunks_text)
+                embeddings = await self._embedding_provider.embed(
+                    chunks_text, dimensions=new_config.embedding_dimensions
+                )
+                new_config.check_embedding_dimensions(embeddings)
 
                 await uow.chunks.delete_by_pack_id(pack.id)
                 new_chunks = [
@@ -74,11 +79,14 @@ class MigrateCollectionUseCase:
                     for i, (text, emb) in enumerate(zip(chunks_text, embeddings, strict=True))
                 ]
                 await uow.chunks.create_batch(new_chunks)
+                affected.update(await uow.packs.list_collection_ids(pack.document_id))
 
                 migrated += 1
 
             collection.configuration_id = new_configuration_id
             collection.updated_at = now
             await uow.collections.update(collection)
+            for affected_id in sorted(affected):
+                await uow.collections.bump_version(affected_id)
 
         return migrated
@@ -0,0 +1,58 @@
+"""Delete document use case."""
+
+from uuid import UUID
+
+from relrag.application.ports import PermissionChecker
+from relrag.domain.exceptions import NotFound, PermissionDenied
+from relrag.domain.value_objects import PermissionAction
+
+
+class DeleteDocumentUseCase:
+    """Soft delete document with its packs and drop its properties from facets."""
+
+    def __init__(
+        self,
+        unit_of_work_factory: type,
+        permission_checker: PermissionChecker,
+    ) -> None:
+        self._uow_factory = unit_of_work_factory
+        self._permission_checker = permission_checker
+
+    async def execute(self, user_id: str, document_id: UUID, collection_id: UUID) -> None:
+        """Delete document that belongs to collection.
+
+        Documents are shared across collections by source hash, so the user needs delete
+        access to every collection the document is linked to, and all of them are bumped.
+        """
+        has_delete = await self._permission_checker.check(
+            user_id, collection_id, PermissionAction.DELETE
+        )
+        if not has_delete:
+            raise PermissionDenied("User does not have delete access to collection")
+
+        async with self._uow_factory() as uow:
+            document = await uow.documents.get_by_id(document_id)
+            if not document:
+                raise NotFound("Document", str(document_id))
+            linked = await uow.packs.list_collection_ids(document_id)
+            if collection_id not in linked:
+                raise NotFound("Document", str(document_id))
+            for linked_id in linked:
+                if linked_id != collection_id and not await self._permission_checker.check(
+                    user_id, linked_id, PermissionAction.DELETE
+                ):
+                    raise PermissionDenied(
+                        "Document is shared with a collection the user cannot delete from"
+                    )
+
+            await uow.properties.delete_by_document(document_id)
+            cursor = None
+            while True:
+                packs, cursor = await uow.packs.list(document_id=document_id, cursor=cursor)
+                for pack in packs:
+                    await uow.packs.soft_delete(pack.id)
+                if not cursor:
+                    break
+            await uow.documents.soft_delete(document_id)
+            for linked_id in linked:
+                await uow.collections.bump_version(linked_id)
@@ -44,10 +44,13 @@ class LoadDocumentUseCase:
                     document_id=existing.id,
                     limit=1,
                 )
-                if packs:
-                    await uow.packs.add_to_collection(
-                        packs[0].id, input_data.collection_id
+                if packs and await uow.packs.add_to_collection(
+                    packs[0].id, input_data.collection_id
+                ):
+                    await uow.properties.add_document_to_facets(
+                        input_data.collection_id, existing.id
                     )
+                    await uow.collections.bump_version(input_data.collection_id)
                 return DocumentOutput(
                     id=existing.id,
                     content=existing.content,
@@ -67,7 +70,10 @@ class LoadDocumentUseCase:
                 strategy=config.chunking_strategy,
             )
             chunks_text = self._chunker.chunk(input_data.content, chunking_config)
-            embeddings = await self._embedding_provider.embed(chunks_text)
+            embeddings = await self._embedding_provider.embed(
+                chunks_text, dimensions=config.embedding_dimensions
+            )
+            config.check_embedding_dimensions(embeddings)
 
             now = datetime.now(UTC)
             doc_id = uuid4()
@@ -115,6 +121,8 @@ class LoadDocumentUseCase:
                 await uow.properties.create_batch(properties)
 
             await uow.packs.add_to_collection(pack.id, input_data.collection_id)
+            await uow.properties.add_document_to_facets(input_data.collection_id, doc_id)
+            await uow.collections.bump_version(input_data.collection_id)
 
         return DocumentOutput(
             id=document.id,
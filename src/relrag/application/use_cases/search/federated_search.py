@@ -0,0 +1,130 @@
+"""Federated search use case - one hybrid search across many collections."""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from relrag.application.ports import EmbeddingProvider, PermissionChecker
+from relrag.application.use_cases.search.hybrid_search import (
+    HybridSearchResult,
+    document_metadata,
+)
+from relrag.domain.exceptions import PermissionDenied, ValidationError
+from relrag.domain.value_objects import EmbeddingPrecision, PermissionAction
+
+
+@dataclass(kw_only=True)
+class FederatedSearchResult(HybridSearchResult):
+    """Search result tagged with the collection it was found in."""
+
+    collection_id: UUID
+
+
+@dataclass
+class FederatedSearchInput:
+    """Input for federated search."""
+
+    collection_ids: list[UUID]
+    query: str
+    vector_weight: float = 0.7
+    fts_weight: float = 0.3
+    limit: int = 10
+    filters: dict[str, Any] | None = None
+
+
+@dataclass
+class FederatedSearchOutput:
+    """Fused results plus collections that were not searched."""
+
+    results: list[FederatedSearchResult]
+    # No read access, no configuration, or embedding dimensions differ from the query vector
+    skipped_collection_ids: list[UUID] = field(default_factory=list)
+
+
+class FederatedSearchUseCase:
+    """Hybrid search over several collections: one permission query, one embedding, one SQL."""
+
+    def __init__(
+        self,
+        unit_of_work_factory: type,
+        permission_checker: PermissionChecker,
+        embedding_provider: EmbeddingProvider,
+    ) -> None:
+        self._uow_factory = unit_of_work_factory
+        self._permission_checker = permission_checker
+        self._embedding_provider = embedding_provider
+
+    async def execute(
+        self, user_id: str, input_data: FederatedSearchInput
+    ) -> FederatedSearchOutput:
+        """Execute federated search."""
+        collection_ids = list(dict.fromkeys(input_data.collection_ids))
+        if not collection_ids:
+            raise ValidationError("collection_ids must not be empty")
+
+        allowed = await self._permission_checker.filter_allowed(
+            user_id, collection_ids, PermissionAction.READ
+        )
+        if not allowed:
+            raise PermissionDenied("User does not have read access to any requested collection")
+
+        async with self._uow_factory() as uow:
+            configs = await uow.configurations.get_by_collection_ids(allowed)
+        # Embed once, at the dimension most of the requested collections use
+        dimension_counts = Counter(
+            configs[cid].embedding_dimensions for cid in allowed if cid in configs
+        )
+        dimensions = dimension_counts.most_common(1)[0][0] if dimension_counts else None
+        query_embedding = await self._embedding_provider.embed(
+            [input_data.query], dimensions=dimensions
+        )
+        embedding = query_embedding[0] if query_embedding else []
+        searchable = [
+            cid
+            for cid in allowed
+            if cid in configs and configs[cid].embedding_dimensions == len(embedding)
+        ]
+        # One fused query: compact/coarse candidates only when all collections agree
+        precisions = {configs[cid].embedding_precision for cid in searchable}
+        precision = precisions.pop() if len(precisions) == 1 else EmbeddingPrecision.VECTOR
+        coarse = {configs[cid].coarse_dimensions for cid in searchable}
+        coarse_dimensions = coarse.pop() if len(coarse) == 1 else None
+
+        rows = []
+        async with self._uow_factory() as uow:
+            if searchable:
+                rows = await uow.chunks.search_collections(
+                    collection_ids=searchable,
+                    query_embedding=embedding,
+                    query_fts=input_data.query,
+                    vector_weight=input_data.vector_weight,
+                    fts_weight=input_data.fts_weight,
+                    limit=input_data.limit,
+                    property_filters=input_data.filters,
+                    embedding_precision=precision.value,
+                    coarse_dimensions=coarse_dimensions,
+                )
+
+        results: list[FederatedSearchResult] = []
+        for r in rows:
+            doc_title, meta = document_metadata(r.get("doc_props"))
+            results.append(
+                FederatedSearchResult(
+                    chunk_id=r["chunk_id"],
+                    pack_id=r["pack_id"],
+                    document_id=r["document_id"],
+                    content=r["content"],
+                    vector_score=r["vector_score"],
+                    fts_score=r["fts_score"],
+                    score=r["score"],
+                    document_title=doc_title,
+                    metadata=meta,
+                    collection_id=r["collection_id"],
+                )
+            )
+        searched = set(searchable)
+        return FederatedSearchOutput(
+            results=results,
+            skipped_collection_ids=[cid for cid in collection_ids if cid not in searched],
+        )
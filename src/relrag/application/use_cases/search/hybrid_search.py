@@ -1,13 +1,30 @@
 """Hybrid search use case - vector + full-text."""
 
-from dataclasses import dataclass
+import asyncio
+import logging
+from dataclasses import dataclass, field
 from typing import Any
 from uuid import UUID
 
-from relrag.application.ports import EmbeddingProvider, PermissionChecker
-from relrag.domain.exceptions import PermissionDenied
+from relrag.application.ports import (
+    EmbeddingProvider,
+    PermissionChecker,
+    Reranker,
+    RerankerBusy,
+    SearchCache,
+)
+from relrag.application.use_cases.search.search_cursor import (
+    decode_search_cursor,
+    embedding_key,
+    encode_search_cursor,
+    search_fingerprint,
+)
+from relrag.domain.entities import Configuration
+from relrag.domain.exceptions import PermissionDenied, ValidationError
 from relrag.domain.value_objects import PermissionAction
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class HybridSearchResult:
@@ -22,6 +39,18 @@ class HybridSearchResult:
     score: float
     document_title: str | None
     metadata: dict[str, str]  # author, created_date, modified_date, page_count, size_mb, etc.
+    rerank_score: float | None = None  # set when the reranking stage ordered the results
+
+
+@dataclass
+class HybridSearchDocumentResult:
+    """Document with its best-scoring chunks (group_by=document)."""
+
+    document_id: UUID
+    score: float  # best chunk score
+    document_title: str | None
+    metadata: dict[str, str]
+    chunks: list[HybridSearchResult]
 
 
 @dataclass
@@ -34,72 +63,348 @@ class HybridSearchInput:
     fts_weight: float = 0.3
     limit: int = 10
     filters: dict[str, Any] | None = None  # key -> { gte?, lte?, one_of?, eq? }
+    facets: list[str] | None = None  # property keys to count values for
+    cursor: str | None = None  # next_cursor of the previous page
+    group_by: str | None = None  # "document" -> top-N documents with their best chunks
+    chunks_per_document: int = 3
+    rerank: bool = False  # reorder the top candidates with the configured reranker
+
+
+@dataclass
+class BatchSearchQuery:
+    """One query of a batch search (same options as HybridSearchInput, no paging)."""
+
+    query: str
+    vector_weight: float = 0.7
+    fts_weight: float = 0.3
+    limit: int = 10
+    filters: dict[str, Any] | None = None
+
+
+@dataclass
+class HybridSearchOutput:
+    """Search results with optional facet counts (key -> value -> document count)."""
+
+    results: list[HybridSearchResult]
+    facets: dict[str, dict[str, int]] = field(default_factory=dict)
+    next_cursor: str | None = None
+    documents: list[HybridSearchDocumentResult] | None = None  # set when grouped by document
+    reranked: bool = False  # False when reranking was not requested, unavailable or over budget
+
+
+def document_metadata(doc_props: dict | None) -> tuple[str | None, dict[str, str]]:
+    """Extract document title and display metadata from document properties."""
+    if not doc_props or not isinstance(doc_props, dict):
+        return None, {}
+    title = doc_props.get("title")
+    if isinstance(title, list):
+        title = title[0] if title else None
+    title_str = str(title).strip() if title else None
+    meta: dict[str, str] = {}
+    for key in ("author", "created_date", "modified_date", "page_count", "file_size_mb"):
+        v = doc_props.get(key)
+        if v is not None and str(v).strip():
+            meta[key] = str(v).strip()
+    return title_str, meta
+
+
+def _index_options(config: Configuration | None) -> dict[str, Any]:
+    """Repository search options for the configuration's compact/coarse candidate index."""
+    if not config:
+        return {}
+    return {
+        "embedding_precision": config.embedding_precision.value,
+        "coarse_dimensions": config.coarse_dimensions,
+    }
+
+
+def _cache_key(input_data: HybridSearchInput, version: int, fingerprint: str) -> str:
+    """Cache key: collection, its data version and every input that shapes the output."""
+    shape = search_fingerprint(
+        fingerprint,
+        input_data.limit,
+        sorted(input_data.facets or []),
+        input_data.cursor,
+        input_data.rerank,
+    )
+    return f"search:{input_data.collection_id}:{version}:{shape}"
+
+
+def _to_result(r: dict) -> HybridSearchResult:
+    """Map a repository search row to HybridSearchResult."""
+    doc_title, meta = document_metadata(r.get("doc_props"))
+    return HybridSearchResult(
+        chunk_id=r["chunk_id"],
+        pack_id=r["pack_id"],
+        document_id=r["document_id"],
+        content=r["content"],
+        vector_score=r["vector_score"],
+        fts_score=r["fts_score"],
+        score=r["score"],
+        document_title=doc_title,
+        metadata=meta,
+    )
 
 
 class HybridSearchUseCase:
-    """Hybrid search: vector similarity + full-text with configurable weights."""
+    """Hybrid search: vector similarity + full-text with configurable weights.
+
+    cursor_cache keeps the query embedding of a page that has a next_cursor, so later
+    pages rank with the same vector (remote embeddings are not bit-for-bit repeatable).
+    When the entry is gone (expired, another worker) the query is embedded again.
+    """
 
     def __init__(
         self,
         unit_of_work_factory: type,
         permission_checker: PermissionChecker,
         embedding_provider: EmbeddingProvider,
+        reranker: Reranker | None = None,
+        rerank_top_k: int = 50,
+        rerank_timeout: float = 0.3,
+        search_cache: SearchCache | None = None,
+        cursor_cache: SearchCache | None = None,
     ) -> None:
         self._uow_factory = unit_of_work_factory
         self._permission_checker = permission_checker
         self._embedding_provider = embedding_provider
+        self._reranker = reranker
+        self._rerank_top_k = rerank_top_k
+        self._rerank_timeout = rerank_timeout
+        self._search_cache = search_cache
+        self._cursor_cache = cursor_cache
 
-    async def execute(
-        self, user_id: str, input_data: HybridSearchInput
-    ) -> list[HybridSearchResult]:
+    async def execute(self, user_id: str, input_data: HybridSearchInput) -> HybridSearchOutput:
         """Execute hybrid search."""
         has_read = await self._permission_checker.check(
             user_id, input_data.collection_id, PermissionAction.READ
         )
         if not has_read:
             raise PermissionDenied("User does not have read access to collection")
+        if input_data.limit < 1:
+            raise ValidationError("limit must be at least 1")
+        if input_data.group_by not in (None, "document"):
+            raise ValidationError("group_by must be 'document'")
+        group_by_document = input_data.group_by == "document"
+        if group_by_document and input_data.chunks_per_document < 1:
+            raise ValidationError("chunks_per_document must be at least 1")
+        if input_data.rerank and (group_by_document or input_data.cursor):
+            raise ValidationError("rerank cannot be combined with group_by or cursor")
+        rerank = input_data.rerank and self._reranker is not None
+        # Reranked results are one page: fetch the top-K candidates instead of limit + 1
+        fetch_limit = max(input_data.limit, self._rerank_top_k) if rerank else input_data.limit + 1
 
-        query_embedding = await self._embedding_provider.embed([input_data.query])
-        embedding = query_embedding[0] if query_embedding else []
+        fingerprint = search_fingerprint(
+            input_data.collection_id,
+            input_data.query,
+            input_data.vector_weight,
+            input_data.fts_weight,
+            input_data.filters,
+            input_data.group_by,
+            input_data.chunks_per_document if group_by_document else None,
+        )
+        after, query_embedding_key = (
+            decode_search_cursor(input_data.cursor, fingerprint)
+            if input_data.cursor
+            else (None, "")
+        )
+
+        use_cache = self._search_cache is not None
+        async with self._uow_factory() as uow:
+            if use_cache:
+                version = await uow.collections.get_version(input_data.collection_id)
+                if version is not None:
+                    cached = await self._search_cache.get(
+                        _cache_key(input_data, version, fingerprint)
+                    )
+                    if cached is not None:
+                        return cached
+            config = await uow.configurations.get_by_collection_id(input_data.collection_id)
+        embedding = None
+        if query_embedding_key and self._cursor_cache is not None:
+            embedding = await self._cursor_cache.get(f"{fingerprint}:{query_embedding_key}")
+        if embedding is None:
+            query_embedding = await self._embedding_provider.embed(
+                [input_data.query], dimensions=config.embedding_dimensions if config else None
+            )
+            embedding = query_embedding[0] if query_embedding else []
+            if config:
+                config.check_embedding_dimensions([embedding])
+        if self._cursor_cache is not None and not rerank:
+            query_embedding_key = query_embedding_key or embedding_key(embedding)
+        index_options = _index_options(config)
+
+        cache_key = None
+        async with self._uow_factory() as uow:
+            if use_cache:
+                # The result is stored under the version read on the connection that searches,
+                # before the search: with replicas the lookup above may have hit another one.
+                # A write committed in between bumps it, so newer data lands under a stale key.
+                version = await uow.collections.get_version(input_data.collection_id)
+                if version is not None:
+                    cache_key = _cache_key(input_data, version, fingerprint)
+            facets: dict[str, dict[str, int]] = {}
+            if input_data.facets:
+                results, facets = await uow.chunks.search_with_facets(
+                    collection_id=input_data.collection_id,
+                    query_embedding=embedding,
+                    facet_keys=input_data.facets,
+                    query_fts=input_data.query,
+                    vector_weight=input_data.vector_weight,
+                    fts_weight=input_data.fts_weight,
+                    limit=fetch_limit,
+                    property_filters=input_data.filters,
+                    after=after,
+                    group_by_document=group_by_document,
+                    chunks_per_document=input_data.chunks_per_document,
+                    **index_options,
+                )
+            else:
+                results = await uow.chunks.search(
+                    collection_id=input_data.collection_id,
+                    query_embedding=embedding,
+                    query_fts=input_data.query,
+                    vector_weight=input_data.vector_weight,
+                    fts_weight=input_data.fts_weight,
+                    limit=fetch_limit,
+                    property_filters=input_data.filters,
+                    after=after,
+                    group_by_document=group_by_document,
+                    chunks_per_document=input_data.chunks_per_document,
+                    **index_options,
+                )
+        if group_by_document:
+            output = self._grouped_output(
+                results, facets, input_data.limit, fingerprint, query_embedding_key
+            )
+        elif rerank:
+            reranked, ok = await self._rerank(input_data.query, [_to_result(r) for r in results])
+            output = HybridSearchOutput(
+                results=reranked[: input_data.limit], facets=facets, reranked=ok
+            )
+        else:
+            next_cursor = None
+            if len(results) > input_data.limit:
+                results = results[: input_data.limit]
+                last = results[-1]
+                next_cursor = encode_search_cursor(
+                    float(last["score"]), last["chunk_id"], fingerprint, query_embedding_key
+                )
+            output = HybridSearchOutput(
+                results=[_to_result(r) for r in results], facets=facets, next_cursor=next_cursor
+            )
+        if self._cursor_cache is not None and output.next_cursor and query_embedding_key:
+            await self._cursor_cache.set(f"{fingerprint}:{query_embedding_key}", embedding)
+        # Do not pin a degraded (rerank bypassed) answer for the cache lifetime
+        if cache_key is not None and not (rerank and not output.reranked):
+            await self._search_cache.set(cache_key, output)
+        return output
+
+    async def _rerank(
+        self, query: str, results: list[HybridSearchResult]
+    ) -> tuple[list[HybridSearchResult], bool]:
+        """Order results by reranker score; keep retrieval order if it fails or is too slow."""
+        if not results:
+            return results, True
+        try:
+            scores = await asyncio.wait_for(
+                self._reranker.rerank(query, [r.content for r in results]),
+                timeout=self._rerank_timeout,
+            )
+        except TimeoutError:
+            logger.warning(
+                "Rerank exceeded %.3fs budget, returning retrieval order", self._rerank_timeout
+            )
+            return results, False
+        except RerankerBusy:
+            logger.warning("Reranker busy, returning retrieval order")
+            return results, False
+        except Exception:
+            logger.exception("Rerank failed, returning retrieval order")
+            return results, False
+        if len(scores) != len(results):
+            logger.warning("Reranker returned %d scores for %d results", len(scores), len(results))
+            return results, False
+        for r, score in zip(results, scores, strict=True):
+            r.rerank_score = float(score)
+        return sorted(results, key=lambda r: r.rerank_score, reverse=True), True
+
+    async def execute_batch(
+        self, user_id: str, collection_id: UUID, queries: list[BatchSearchQuery]
+    ) -> list[list[HybridSearchResult]]:
+        """Search one collection for many queries with one embedding call and one DB round trip."""
+        if not queries:
+            return []
+        has_read = await self._permission_checker.check(
+            user_id, collection_id, PermissionAction.READ
+        )
+        if not has_read:
+            raise PermissionDenied("User does not have read access to collection")
+
+        async with self._uow_factory() as uow:
+            config = await uow.configurations.get_by_collection_id(collection_id)
+        embeddings = await self._embedding_provider.embed(
+            [q.query for q in queries],
+            dimensions=config.embedding_dimensions if config else None,
+        )
+        if len(embeddings) != len(queries):
+            raise ValidationError("Embedding provider returned wrong number of vectors")
+        if config:
+            config.check_embedding_dimensions(embeddings)
+        index_options = _index_options(config)
 
         async with self._uow_factory() as uow:
-            results = await uow.chunks.search(
-                collection_id=input_data.collection_id,
-                query_embedding=embedding,
-                query_fts=input_data.query,
-                vector_weight=input_data.vector_weight,
-                fts_weight=input_data.fts_weight,
-                limit=input_data.limit,
-                property_filters=input_data.filters,
+            batches = await uow.chunks.search_many(
+                collection_id,
+                [
+                    {
+                        "query_embedding": emb,
+                        "query_fts": q.query,
+                        "vector_weight": q.vector_weight,
+                        "fts_weight": q.fts_weight,
+                        "limit": q.limit,
+                        "property_filters": q.filters,
+                        **index_options,
+                    }
+                    for q, emb in zip(queries, embeddings, strict=True)
+                ],
             )
-            def _doc_metadata(doc_props: dict | None) -> tuple[str | None, dict[str, str]]:
-                if not doc_props or not isinstance(doc_props, dict):
-                    return None, {}
-                title = doc_props.get("title")
-                if isinstance(title, list):
-                    title = title[0] if title else None
-                title_str = str(title).strip() if title else None
-                meta: dict[str, str] = {}
-                for key in ("author", "created_date", "modified_date", "page_count", "file_size_mb"):
-                    v = doc_props.get(key)
-                    if v is not None and str(v).strip():
-                        meta[key] = str(v).strip()
-                return title_str, meta
-
-            out: list[HybridSearchResult] = []
-            for r in results:
-                doc_title, meta = _doc_metadata(r.get("doc_props"))
-                out.append(
-                    HybridSearchResult(
-                        chunk_id=r["chunk_id"],
-                        pack_id=r["pack_id"],
-                        document_id=r["document_id"],
-                        content=r["content"],
-                        vector_score=r["vector_score"],
-                        fts_score=r["fts_score"],
-                        score=r["score"],
-                        document_title=doc_title,
-                        metadata=meta,
+        return [[_to_result(r) for r in rows] for rows in batches]
+
+    @staticmethod
+    def _grouped_output(
+        rows: list[dict],
+        facets: dict[str, dict[str, int]],
+        limit: int,
+        fingerprint: str,
+        query_embedding_key: str = "",
+    ) -> HybridSearchOutput:
+        """Assemble documents from rows ordered by (doc_score, document_id) desc, chunk rank."""
+        documents: list[HybridSearchDocumentResult] = []
+        for r in rows:
+            result = _to_result(r)
+            if not documents or documents[-1].document_id != result.document_id:
+                documents.append(
+                    HybridSearchDocumentResult(
+                        document_id=result.document_id,
+                        score=float(r.get("doc_score", result.score)),
+                        document_title=result.document_title,
+                        metadata=result.metadata,
+                        chunks=[],
                     )
                 )
-            return out
+            documents[-1].chunks.append(result)
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            if documents:
+                last_doc = documents[-1]
+                next_cursor = encode_search_cursor(
+                    last_doc.score, last_doc.document_id, fingerprint, query_embedding_key
+                )
+        return HybridSearchOutput(
+            results=[c for d in documents for c in d.chunks],
+            facets=facets,
+            next_cursor=next_cursor,
+            documents=documents,
+        )
@@ -0,0 +1,44 @@
+"""Opaque search cursor - keyset position bound to the query that produced it."""
+
+import base64
+import hashlib
+import json
+import struct
+from uuid import UUID
+
+from relrag.domain.exceptions import ValidationError
+
+
+def search_fingerprint(*parts: object) -> str:
+    """Short stable hash of everything that determines search ordering."""
+    raw = json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+def embedding_key(embedding: list[float]) -> str:
+    """Short stable hash of a query embedding (names it for the pages after the first)."""
+    return hashlib.sha256(struct.pack(f"{len(embedding)}d", *embedding)).hexdigest()[:16]
+
+
+def encode_search_cursor(
+    score: float, item_id: UUID, fingerprint: str, query_embedding_key: str = ""
+) -> str:
+    """Encode keyset position (score, id), query fingerprint and embedding key as urlsafe string."""
+    raw = json.dumps([score, str(item_id), fingerprint, query_embedding_key]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str, fingerprint: str) -> tuple[tuple[float, UUID], str]:
+    """Decode cursor into ((score, id), embedding key).
+
+    Raises ValidationError if malformed or for another query.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        score, item_id, cursor_fingerprint, query_embedding_key = json.loads(raw)
+        position = (float(score), UUID(item_id))
+    except (ValueError, TypeError):
+        raise ValidationError("Invalid cursor") from None
+    if cursor_fingerprint != fingerprint:
+        raise ValidationError("Cursor does not match search parameters")
+    return position, str(query_embedding_key)
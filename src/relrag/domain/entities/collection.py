@@ -15,3 +15,4 @@ class Collection:
     updated_at: datetime
     deleted_at: datetime | None = None
     name: str | None = None
+    version: int = 0  # bumped by every write that can change search results
@@ -3,7 +3,8 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from relrag.domain.value_objects import ChunkingStrategy
+from relrag.domain.exceptions import ValidationError
+from relrag.domain.value_objects import ChunkingStrategy, EmbeddingPrecision
 
 
 @dataclass
@@ -17,3 +18,14 @@ class Configuration:
     chunk_size: int
     chunk_overlap: int
     name: str | None = None
+    embedding_precision: EmbeddingPrecision = EmbeddingPrecision.VECTOR
+    coarse_dimensions: int | None = None  # embedding prefix length for coarse candidate search
+
+    def check_embedding_dimensions(self, embeddings: list[list[float]]) -> None:
+        """Raise ValidationError if any embedding length differs from embedding_dimensions."""
+        for emb in embeddings:
+            if len(emb) != self.embedding_dimensions:
+                raise ValidationError(
+                    f"Embedding has {len(emb)} dimensions, "
+                    f"configuration expects {self.embedding_dimensions}"
+                )
@@ -1,12 +1,14 @@
 """Domain value objects."""
 
 from relrag.domain.value_objects.chunking_strategy import ChunkingStrategy
+from relrag.domain.value_objects.embedding_precision import EmbeddingPrecision
 from relrag.domain.value_objects.permission_action import PermissionAction
 from relrag.domain.value_objects.property_type import PropertyType
 from relrag.domain.value_objects.source_hash import SourceHash
 
 __all__ = [
     "ChunkingStrategy",
+    "EmbeddingPrecision",
     "PermissionAction",
     "PropertyType",
     "SourceHash",
@@ -0,0 +1,11 @@
+"""Embedding precision used for the ANN candidate index."""
+
+from enum import StrEnum
+
+
+class EmbeddingPrecision(StrEnum):
+    """Supported embedding index precisions (full vectors are kept for rescoring)."""
+
+    VECTOR = "vector"
+    HALFVEC = "halfvec"
+    BIT = "bit"
@@ -2,8 +2,6 @@
 
 from dataclasses import dataclass
 
-from keycloak import KeycloakOpenID
-
 
 @dataclass
 class OIDCUser:
@@ -25,17 +23,27 @@ class KeycloakProvider:
         client_id: str,
         client_secret: str = "",
     ) -> None:
-        self._keycloak = KeycloakOpenID(
-            server_url=server_url,
-            realm_name=realm,
-            client_id=client_id,
-            client_secret_key=client_secret,
-        )
+        self._options = {
+            "server_url": server_url,
+            "realm_name": realm,
+            "client_id": client_id,
+            "client_secret_key": client_secret,
+        }
+        self._keycloak = None
+
+    def _client(self):
+        # python-keycloak pulls in requests/jwcrypto; import it on the first token, not at startup
+        if self._keycloak is None:
+            from keycloak import KeycloakOpenID
+
+            self._keycloak = KeycloakOpenID(**self._options)
+        return self._keycloak
 
     def decode_token(self, token: str) -> OIDCUser | None:
         """Decode and validate JWT, return user info or None."""
+        client = self._client()
         try:
-            token_info = self._keycloak.introspect(token)
+            token_info = client.introspect(token)
             if not token_info.get("active"):
                 return None
             return OIDCUser(
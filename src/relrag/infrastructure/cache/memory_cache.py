@@ -0,0 +1,48 @@
+"""In-process LRU search cache with TTL."""
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+from relrag.infrastructure.observability.metrics import SEARCH_CACHE_REQUESTS, Counter
+
+
+class InMemorySearchCache:
+    """Per-process LRU cache; entries expire after ttl_seconds.
+
+    Keys carry the collection version, so writes invalidate by making old keys unreachable;
+    the TTL only bounds how long unreachable entries occupy memory.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 300.0,
+        requests: Counter = SEARCH_CACHE_REQUESTS,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._requests = requests
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        """Return cached value or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._requests.inc(result="miss")
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            self._requests.inc(result="miss")
+            return None
+        self._entries.move_to_end(key)
+        self._requests.inc(result="hit")
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store value, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
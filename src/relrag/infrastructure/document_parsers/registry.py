@@ -1,34 +1,43 @@
 """Registry: select parser by extension/MIME and return normalized ParseResult."""
 
+import importlib
+import time
 from collections.abc import Callable
+from functools import cache
 from pathlib import Path
 
 from relrag.infrastructure.document_parsers.base import ParseResult
-from relrag.infrastructure.document_parsers.docx_parser import parse_docx
-from relrag.infrastructure.document_parsers.epub_parser import parse_epub
-from relrag.infrastructure.document_parsers.pdf_parser import parse_pdf
-from relrag.infrastructure.document_parsers.pptx_parser import parse_pptx
-from relrag.infrastructure.document_parsers.text_parser import (
-    parse_csv,
-    parse_md,
-    parse_tsv,
-    parse_txt,
-)
-from relrag.infrastructure.document_parsers.xlsx_parser import parse_xlsx
-
-# extension (lower) -> parse function
-_PARSERS_BY_EXT: dict[str, Callable[..., ParseResult]] = {
-    "txt": parse_txt,
-    "md": parse_md,
-    "csv": parse_csv,
-    "tsv": parse_tsv,
-    "docx": parse_docx,
-    "pdf": parse_pdf,
-    "xlsx": parse_xlsx,
-    "pptx": parse_pptx,
-    "epub": parse_epub,
+from relrag.infrastructure.observability.metrics import PARSE_DURATION
+from relrag.infrastructure.observability.tracing import tracer
+
+_PACKAGE = "relrag.infrastructure.document_parsers"
+
+# extension (lower) -> (parser module, parse function); modules (pypdf, openpyxl,
+# python-docx, python-pptx, ebooklib) are imported on first use, not at startup
+_PARSERS_BY_EXT: dict[str, tuple[str, str]] = {
+    "txt": ("text_parser", "parse_txt"),
+    "md": ("text_parser", "parse_md"),
+    "csv": ("text_parser", "parse_csv"),
+    "tsv": ("text_parser", "parse_tsv"),
+    "docx": ("docx_parser", "parse_docx"),
+    "pdf": ("pdf_parser", "parse_pdf"),
+    "xlsx": ("xlsx_parser", "parse_xlsx"),
+    "pptx": ("pptx_parser", "parse_pptx"),
+    "epub": ("epub_parser", "parse_epub"),
 }
 
+
+@cache
+def _load_parser(ext: str) -> Callable[..., ParseResult] | None:
+    """Import the parser module for the extension and return its parse function."""
+    entry = _PARSERS_BY_EXT.get(ext)
+    if entry is None:
+        return None
+    module_name, function_name = entry
+    module = importlib.import_module(f"{_PACKAGE}.{module_name}")
+    return getattr(module, function_name)
+
+
 # MIME -> parse function (optional fallback)
 _MIME_TO_EXT: dict[str, str] = {
     "text/plain": "txt",
@@ -47,7 +56,7 @@ def get_parser_for_filename(filename: str | None) -> Callable[..., ParseResult]
     if not filename:
         return None
     ext = Path(filename).suffix.lstrip(".").lower()
-    return _PARSERS_BY_EXT.get(ext)
+    return _load_parser(ext)
 
 
 def get_parser_for_content_type(content_type: str | None) -> Callable[..., ParseResult] | None:
@@ -58,7 +67,7 @@ def get_parser_for_content_type(content_type: str | None) -> Callable[..., Parse
     ext = _MIME_TO_EXT.get(mime)
     if not ext:
         return None
-    return _PARSERS_BY_EXT.get(ext)
+    return _load_parser(ext)
 
 
 def parse_file(
@@ -74,7 +83,16 @@ def parse_file(
     if not parser:
         ext = Path(filename).suffix if filename else content_type or "unknown"
         raise ValueError(f"No parser for file type: {ext}")
-    return parser(data, filename)
+    with tracer.start_as_current_span("parsing.parse") as span:
+        span.set_attribute("relrag.parser", parser.__name__)
+        span.set_attribute("relrag.file_bytes", len(data))
+        started = time.perf_counter()
+        result = parser(data, filename)
+        PARSE_DURATION.observe(
+            time.perf_counter() - started, file_type=parser.__name__.removeprefix("parse_")
+        )
+        span.set_attribute("relrag.text_bytes", len(result.text.encode()) if result.text else 0)
+        return result
 
 
 def supported_extensions() -> list[str]:
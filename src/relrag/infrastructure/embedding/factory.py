@@ -0,0 +1,31 @@
+"""Embedding provider selection from settings."""
+
+from relrag.application.ports import EmbeddingProvider
+from relrag.config import Settings
+
+
+def create_embedding_provider(settings: Settings) -> EmbeddingProvider:
+    """Build the provider named by settings.embedding_provider."""
+    if settings.embedding_provider == "hashing":
+        from relrag.infrastructure.embedding.hashing_provider import HashingEmbeddingProvider
+
+        return HashingEmbeddingProvider(dimensions=settings.hashing_embedding_dimensions)
+    if settings.embedding_provider == "local":
+        from relrag.infrastructure.embedding.local_provider import (
+            SentenceTransformerEmbeddingProvider,
+        )
+
+        return SentenceTransformerEmbeddingProvider(
+            settings.embedding_model,
+            device=settings.local_embedding_device,
+            backend=settings.local_embedding_backend,
+            batch_size=settings.local_embedding_batch_size,
+            max_workers=settings.local_embedding_workers,
+        )
+    from relrag.infrastructure.embedding.openai_provider import OpenAIEmbeddingProvider
+
+    return OpenAIEmbeddingProvider(
+        base_url=settings.embedding_api_url,
+        api_key=settings.embedding_api_key,
+        model=settings.embedding_model,
+    )
@@ -0,0 +1,38 @@
+"""Deterministic hashing embedding provider (no model, no network)."""
+
+import hashlib
+import math
+import re
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class HashingEmbeddingProvider:
+    """Feature-hashing embeddings: stable across runs, for benchmarks and offline tests.
+
+    Each lowercased token is hashed to a bucket and a sign; vectors are L2-normalized, so
+    texts sharing tokens have positive cosine similarity.
+    """
+
+    def __init__(self, dimensions: int = 1536) -> None:
+        self._dimensions = dimensions
+
+    async def embed(self, texts: list[str], dimensions: int | None = None) -> list[list[float]]:
+        """Generate embeddings for texts."""
+        size = dimensions or self._dimensions
+        return [_hash_embedding(text, size) for text in texts]
+
+
+def _hash_embedding(text: str, size: int) -> list[float]:
+    """Signed feature-hashing vector of text tokens, L2-normalized."""
+    vec = [0.0] * size
+    for token in _TOKEN_RE.findall(text.lower()):
+        digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+        h = int.from_bytes(digest, "little")
+        vec[h % size] += 1.0 if (h >> 63) & 1 else -1.0
+    norm = math.sqrt(sum(v * v for v in vec))
+    if norm == 0:
+        # Empty text: fixed unit vector keeps cosine distance defined
+        vec[0] = 1.0
+        return vec
+    return [v / norm for v in vec]
@@ -0,0 +1,74 @@
+"""Local embedding provider - sentence-transformers on CPU (PyTorch or ONNX Runtime)."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+
+class SentenceTransformerEmbeddingProvider:
+    """Runs a sentence-transformers model in-process, off the event loop.
+
+    Requires the optional ``local`` extra (``pip install relrag[local]``). The model is
+    loaded on first use; encode() runs in a dedicated thread pool with batched inference.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        *,
+        device: str = "cpu",
+        backend: str = "torch",
+        batch_size: int = 32,
+        max_workers: int = 1,
+    ) -> None:
+        self._model_name = model
+        self._device = device
+        self._backend = backend
+        self._batch_size = batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="relrag-embed"
+        )
+        self._model: Any = None
+        self._load_lock = threading.Lock()
+
+    async def embed(self, texts: list[str], dimensions: int | None = None) -> list[list[float]]:
+        """Generate embeddings for texts (truncated to dimensions for Matryoshka models)."""
+        if not texts:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._encode, texts, dimensions)
+
+    def _encode(self, texts: list[str], dimensions: int | None) -> list[list[float]]:
+        """Blocking batched inference (runs in the executor)."""
+        model = self._get_model()
+        vectors = model.encode(
+            texts,
+            batch_size=self._batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+            truncate_dim=dimensions,
+        )
+        return vectors.tolist()
+
+    def _get_model(self) -> Any:
+        """Load the model once, thread-safely."""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                    except ImportError as e:
+                        raise ImportError(
+                            "Local embeddings require sentence-transformers: "
+                            "pip install 'relrag[local]'"
+                        ) from e
+                    self._model = SentenceTransformer(
+                        self._model_name, device=self._device, backend=self._backend
+                    )
+        return self._model
+
+    def close(self) -> None:
+        """Stop the inference thread pool."""
+        self._executor.shutdown(wait=False)
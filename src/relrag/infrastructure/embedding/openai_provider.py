@@ -1,6 +1,7 @@
 """OpenAI-compatible embedding provider."""
 
-from openai import AsyncOpenAI
+# Models that return shortened (Matryoshka) embeddings for the dimensions parameter
+DIMENSIONS_MODEL_PREFIXES = ("text-embedding-3",)
 
 
 class OpenAIEmbeddingProvider:
@@ -12,15 +13,29 @@ class OpenAIEmbeddingProvider:
         api_key: str,
         model: str,
     ) -> None:
-        self._client = AsyncOpenAI(base_url=base_url, api_key=api_key)
+        self._base_url = base_url
+        self._api_key = api_key
+        self._client = None
         self._model = model
 
-    async def embed(self, texts: list[str]) -> list[list[float]]:
-        """Generate embeddings for texts."""
+    def _get_client(self):
+        # The OpenAI SDK (httpx, pydantic models) is imported on the first request, not at startup
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(base_url=self._base_url, api_key=self._api_key)
+        return self._client
+
+    async def embed(self, texts: list[str], dimensions: int | None = None) -> list[list[float]]:
+        """Generate embeddings for texts, shortened to dimensions when the model supports it."""
         if not texts:
             return []
-        response = await self._client.embeddings.create(
+        kwargs = {}
+        if dimensions and self._model.startswith(DIMENSIONS_MODEL_PREFIXES):
+            kwargs["dimensions"] = dimensions
+        response = await self._get_client().embeddings.create(
             model=self._model,
             input=texts,
+            **kwargs,
         )
         return [d.embedding for d in response.data]
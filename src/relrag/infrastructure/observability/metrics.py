@@ -0,0 +1,331 @@
+"""Process metrics - counters and histograms rendered in Prometheus text format.
+
+Instruments are module-level and always on (a dict update per observation); GET
+/v1/metrics renders REGISTRY. Pool occupancy is collected from the pool at scrape time.
+"""
+
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from contextvars import ContextVar
+from typing import Any
+
+from psycopg_pool import AsyncConnectionPool
+
+from relrag.application.dto.chunking_config import ChunkingConfig
+from relrag.application.ports import Chunker, EmbeddingProvider
+
+# Histogram upper bounds (seconds) for time spent waiting on a pooled connection
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+CANDIDATE_BUCKETS = (10, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000)
+
+# Pool wait accumulated by the current request (a one-element list shared with child tasks)
+_request_pool_wait: ContextVar[list[float] | None] = ContextVar("request_pool_wait", default=None)
+
+
+def begin_request_pool_wait() -> None:
+    """Start accumulating pool wait for the current request."""
+    _request_pool_wait.set([0.0])
+
+
+def request_pool_wait() -> float:
+    """Seconds the current request has spent waiting for pooled connections."""
+    acc = _request_pool_wait.get()
+    return acc[0] if acc else 0.0
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monotonic counter with optional labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Add amount to the series identified by labels."""
+        key = tuple(str(labels[n]) for n in self.labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value of one series."""
+        return self._values.get(tuple(str(labels[n]) for n in self.labels), 0.0)
+
+    def samples(self) -> Iterable[str]:
+        for key, value in self._values.items():
+            yield f"{self.name}_total{_format_labels(self.labels, key)} {_format_value(value)}"
+
+
+class Histogram:
+    """Cumulative-bucket histogram with optional labels."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self.buckets = buckets
+        # series -> [per-bucket counts (+Inf last), sum, count]
+        self._series: dict[tuple[str, ...], list[Any]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation."""
+        key = tuple(str(labels[n]) for n in self.labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def cumulative(self, **labels: str) -> tuple[list[int], float, int]:
+        """(cumulative bucket counts incl. +Inf, sum, count) of one series."""
+        series = self._series.get(tuple(str(labels[n]) for n in self.labels))
+        if series is None:
+            return [0] * (len(self.buckets) + 1), 0.0, 0
+        running, out = 0, []
+        for c in series[0]:
+            running += c
+            out.append(running)
+        return out, series[1], series[2]
+
+    def samples(self) -> Iterable[str]:
+        for key in self._series:
+            counts, total, count = self.cumulative(**dict(zip(self.labels, key, strict=True)))
+            for bound, c in zip((*self.buckets, math.inf), counts, strict=True):
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labels, key, le)} {c}"
+            labels = _format_labels(self.labels, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    """Metrics plus scrape-time collectors (callables returning exposition lines)."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Counter | Histogram] = {}
+        self._collectors: list[Callable[[], Iterable[str]]] = []
+
+    def register(self, metric: Any) -> Any:
+        """Add a metric (idempotent by name) and return the registered instance."""
+        return self._metrics.setdefault(metric.name, metric)
+
+    def add_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """Add a callable producing ready-made exposition lines at scrape time."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        lines: list[str] = []
+        for m in self._metrics.values():
+            lines.append(f"# HELP {m.name} {m.documentation}")
+            lines.append(f"# TYPE {m.name} {m.kind}")
+            lines.extend(m.samples())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "relrag_http_request_duration_seconds",
+        "HTTP request latency by route template",
+        labels=("method", "route", "status"),
+    )
+)
+EMBEDDING_DURATION = REGISTRY.register(
+    Histogram("relrag_embedding_duration_seconds", "Embedding call latency")
+)
+EMBEDDING_BATCH_SIZE = REGISTRY.register(
+    Histogram("relrag_embedding_batch_size", "Texts per embedding call", buckets=SIZE_BUCKETS)
+)
+CHUNKS_INGESTED = REGISTRY.register(
+    Counter("relrag_chunks_ingested", "Chunks produced for ingestion (loads and migrations)")
+)
+PARSE_DURATION = REGISTRY.register(
+    Histogram(
+        "relrag_parse_duration_seconds", "Document parse time by file type", labels=("file_type",)
+    )
+)
+SEARCH_ROWS = REGISTRY.register(
+    Histogram(
+        "relrag_search_rows_returned",
+        "Rows returned by the search SQL (after LIMIT, before paging/reranking), by search kind",
+        labels=("kind",),
+        buckets=SIZE_BUCKETS,
+    )
+)
+SEARCH_CANDIDATES = REGISTRY.register(
+    Histogram(
+        "relrag_search_candidates",
+        "ANN candidates rescored per two-phase search (halfvec, bit, coarse), by search kind",
+        labels=("kind",),
+        buckets=CANDIDATE_BUCKETS,
+    )
+)
+SEARCH_CACHE_REQUESTS = REGISTRY.register(
+    Counter("relrag_search_cache_requests", "Search cache lookups by result", labels=("result",))
+)
+SEARCH_CURSOR_CACHE_REQUESTS = REGISTRY.register(
+    Counter(
+        "relrag_search_cursor_cache_requests",
+        "Query embedding lookups for next_cursor pages by result (miss = embedded again)",
+        labels=("result",),
+    )
+)
+
+
+POOL_GAUGES = (
+    ("relrag_db_pool_size", "Open pool connections", "size"),
+    ("relrag_db_pool_in_use", "Pool connections checked out", "in_use"),
+    ("relrag_db_pool_waiting", "Requests waiting for a connection", "waiting"),
+)
+
+
+class PoolMetrics:
+    """Pool checkout wait histogram and timeouts; occupancy is read from the pool itself.
+
+    name labels the pool's series ("primary", "replica0", ...).
+    """
+
+    def __init__(
+        self,
+        pool: AsyncConnectionPool,
+        buckets: tuple[float, ...] = POOL_WAIT_BUCKETS,
+        name: str = "primary",
+    ) -> None:
+        self._pool = pool
+        self.name = name
+        self.wait = Histogram(
+            "relrag_db_pool_wait_seconds",
+            "Time waiting for a pooled connection",
+            labels=("pool",),
+            buckets=buckets,
+        )
+        self.timeouts = 0
+
+    @property
+    def wait_count(self) -> int:
+        return self.wait.cumulative(pool=self.name)[2]
+
+    def observe_wait(self, seconds: float) -> None:
+        """Record one checkout and add its wait to the current request."""
+        self.wait.observe(seconds, pool=self.name)
+        acc = _request_pool_wait.get()
+        if acc is not None:
+            acc[0] += seconds
+
+    def observe_timeout(self) -> None:
+        """Record a checkout that gave up waiting (pool exhausted)."""
+        self.timeouts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Current occupancy plus cumulative wait histogram."""
+        stats = self._pool.get_stats()
+        size = stats.get("pool_size", 0)
+        counts, total, count = self.wait.cumulative(pool=self.name)
+        return {
+            "min_size": stats.get("pool_min", 0),
+            "max_size": stats.get("pool_max", 0),
+            "size": size,
+            "in_use": size - stats.get("pool_available", 0),
+            "waiting": stats.get("requests_waiting", 0),
+            "timeouts": self.timeouts,
+            "wait_seconds": {
+                "buckets": {
+                    str(bound): c
+                    for bound, c in zip((*self.wait.buckets, "+Inf"), counts, strict=True)
+                },
+                "sum": total,
+                "count": count,
+            },
+        }
+
+    def collect(self) -> Iterable[str]:
+        """Exposition lines for REGISTRY.add_collector."""
+        return collect_pools([self])
+
+
+def collect_pools(pool_metrics: list[PoolMetrics]) -> Iterable[str]:
+    """Exposition lines for several pools: one family per metric, one series per pool."""
+    snaps = [(_format_labels(("pool",), (m.name,)), m.snapshot()) for m in pool_metrics]
+    for name, doc, key in POOL_GAUGES:
+        yield f"# HELP {name} {doc}"
+        yield f"# TYPE {name} gauge"
+        for labels, snap in snaps:
+            yield f"{name}{labels} {snap[key]}"
+    yield "# HELP relrag_db_pool_timeouts Checkouts that exceeded the wait budget"
+    yield "# TYPE relrag_db_pool_timeouts counter"
+    for labels, snap in snaps:
+        yield f"relrag_db_pool_timeouts_total{labels} {snap['timeouts']}"
+    if pool_metrics:
+        wait = pool_metrics[0].wait
+        yield f"# HELP {wait.name} {wait.documentation}"
+        yield f"# TYPE {wait.name} histogram"
+        for m in pool_metrics:
+            yield from m.wait.samples()
+
+
+class MeteredEmbeddingProvider:
+    """EmbeddingProvider decorator recording call latency and batch size."""
+
+    def __init__(self, provider: EmbeddingProvider) -> None:
+        self._provider = provider
+
+    async def embed(self, texts: list[str], dimensions: int | None = None) -> list[list[float]]:
+        """Embed texts and record the call."""
+        started = time.perf_counter()
+        try:
+            return await self._provider.embed(texts, dimensions=dimensions)
+        finally:
+            EMBEDDING_DURATION.observe(time.perf_counter() - started)
+            EMBEDDING_BATCH_SIZE.observe(len(texts))
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._provider, attr)
+
+
+class MeteredChunker:
+    """Chunker decorator counting produced chunks."""
+
+    def __init__(self, chunker: Chunker) -> None:
+        self._chunker = chunker
+
+    def chunk(self, text: str, config: ChunkingConfig) -> list[str]:
+        """Chunk text and count the chunks."""
+        chunks = self._chunker.chunk(text, config)
+        CHUNKS_INGESTED.inc(len(chunks))
+        return chunks
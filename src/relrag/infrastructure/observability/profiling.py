@@ -0,0 +1,227 @@
+"""Per-request profiling: CPU profile, SQL timings and EXPLAIN ANALYZE of search statements.
+
+A RequestProfile is bound to the request context (contextvar) by ProfilingMiddleware.
+Units of work hand repositories a ProfiledConnection while one is active, so every
+statement is timed; the chunk repository explains its search statement when asked to.
+The CPU profile uses pyinstrument (sampling, async-aware) when installed, otherwise
+cProfile, which also sees other requests running on the event loop meanwhile.
+"""
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from uuid import uuid4
+
+# Statement text kept per query (search SQL is long; parameters are never stored)
+MAX_SQL_LENGTH = 2000
+
+
+@dataclass
+class QueryTiming:
+    """One executed statement."""
+
+    sql: str
+    duration_ms: float
+
+
+@dataclass
+class QueryPlan:
+    """EXPLAIN (ANALYZE, BUFFERS) output for one statement."""
+
+    sql: str
+    plan: str
+
+
+@dataclass
+class RequestProfile:
+    """What was captured for one request."""
+
+    method: str
+    path: str
+    trigger: str  # "header" (requested) or "slow" (over the threshold)
+    explain: bool = False
+    user_id: str | None = None  # who sent the request; only they (or an admin) may read it
+    id: str = field(default_factory=lambda: uuid4().hex)
+    started_at: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    route: str | None = None
+    status: int | None = None
+    duration_ms: float = 0.0
+    queries: list[QueryTiming] = field(default_factory=list)
+    plans: list[QueryPlan] = field(default_factory=list)
+    profiler: str | None = None
+    profile: str | None = None
+
+    def record_query(self, sql: object, duration: float) -> None:
+        self.queries.append(QueryTiming(_sql_text(sql), round(duration * 1000, 3)))
+
+    async def explain_statement(self, conn: object, sql: str, params: object) -> None:
+        """Re-run sql under EXPLAIN (ANALYZE, BUFFERS) on conn and keep the plan."""
+        cur = await conn.execute("EXPLAIN (ANALYZE, BUFFERS) " + sql, params)
+        rows = await cur.fetchall()
+        self.plans.append(QueryPlan(_sql_text(sql), "\n".join(str(r[0]) for r in rows)))
+
+    def summary(self) -> dict:
+        """Listing entry without the statements and reports."""
+        return {
+            "id": self.id,
+            "started_at": self.started_at,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "trigger": self.trigger,
+            "user_id": self.user_id,
+            "query_count": len(self.queries),
+            "query_ms": round(sum(q.duration_ms for q in self.queries), 3),
+        }
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _sql_text(sql: object) -> str:
+    text = sql if isinstance(sql, str) else repr(sql)
+    text = " ".join(text.split())
+    return text if len(text) <= MAX_SQL_LENGTH else text[:MAX_SQL_LENGTH] + "..."
+
+
+_active_profile: ContextVar[RequestProfile | None] = ContextVar(
+    "relrag_active_profile", default=None
+)
+
+
+def active_profile() -> RequestProfile | None:
+    """Profile of the current request, if it is being captured."""
+    return _active_profile.get()
+
+
+def activate_profile(profile: RequestProfile | None) -> Token:
+    return _active_profile.set(profile)
+
+
+def deactivate_profile(token: Token) -> None:
+    _active_profile.reset(token)
+
+
+class ProfiledCursor:
+    """Cursor proxy timing execute() into a profile."""
+
+    def __init__(self, cursor: object, profile: RequestProfile) -> None:
+        self._cursor = cursor
+        self._profile = profile
+
+    async def execute(self, query: object, params: object = None, **kwargs: object) -> object:
+        started = time.perf_counter()
+        try:
+            await self._cursor.execute(query, params, **kwargs)
+        finally:
+            self._profile.record_query(query, time.perf_counter() - started)
+        return self
+
+    async def __aenter__(self) -> "ProfiledCursor":
+        await self._cursor.__aenter__()
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        await self._cursor.__aexit__(*exc)
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._cursor, name)
+
+
+class ProfiledConnection:
+    """Connection proxy timing execute() and cursor execute() into a profile."""
+
+    def __init__(self, conn: object, profile: RequestProfile) -> None:
+        self._conn = conn
+        self._profile = profile
+
+    async def execute(self, query: object, params: object = None, **kwargs: object) -> object:
+        started = time.perf_counter()
+        try:
+            return await self._conn.execute(query, params, **kwargs)
+        finally:
+            self._profile.record_query(query, time.perf_counter() - started)
+
+    def cursor(self, *args: object, **kwargs: object) -> ProfiledCursor:
+        return ProfiledCursor(self._conn.cursor(*args, **kwargs), self._profile)
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._conn, name)
+
+
+# Profiler hooks (cProfile, pyinstrument) are process-wide: one profiled request at a time
+_profiler_lock = threading.Lock()
+
+
+class CpuProfiler:
+    """pyinstrument when installed, else cProfile; start() is False if another is running."""
+
+    def __init__(self) -> None:
+        self.name: str | None = None
+        self._profiler: object | None = None
+
+    def start(self) -> bool:
+        if not _profiler_lock.acquire(blocking=False):
+            return False
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            Profiler = None
+        try:
+            if Profiler is not None:
+                self._profiler = Profiler(async_mode="enabled")
+                self._profiler.start()
+                self.name = "pyinstrument"
+            else:
+                self._profiler = cProfile.Profile()
+                self._profiler.enable()
+                self.name = "cProfile"
+        except (RuntimeError, ValueError):  # another profiling tool is active
+            _profiler_lock.release()
+            self._profiler = None
+            self.name = None
+            return False
+        return True
+
+    def stop(self) -> str | None:
+        """Stop and return the text report."""
+        if self._profiler is None:
+            return None
+        try:
+            if self.name == "pyinstrument":
+                self._profiler.stop()
+                return self._profiler.output_text(unicode=False, color=False)
+            self._profiler.disable()
+        finally:
+            _profiler_lock.release()
+        out = io.StringIO()
+        pstats.Stats(self._profiler, stream=out).sort_stats("cumulative").print_stats(40)
+        return out.getvalue()
+
+
+class ProfileStore:
+    """Most recent profiles, oldest evicted first."""
+
+    def __init__(self, max_size: int = 50) -> None:
+        self._max_size = max_size
+        self._profiles: OrderedDict[str, RequestProfile] = OrderedDict()
+
+    def add(self, profile: RequestProfile) -> None:
+        self._profiles[profile.id] = profile
+        while len(self._profiles) > self._max_size:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> RequestProfile | None:
+        return self._profiles.get(profile_id)
+
+    def list(self) -> list[RequestProfile]:
+        """Newest first."""
+        return list(reversed(self._profiles.values()))
@@ -0,0 +1,143 @@
+"""OpenTelemetry tracing - provider setup and span wrappers for hot-path adapters."""
+
+import functools
+import inspect
+import logging
+from typing import TYPE_CHECKING, Any
+
+from opentelemetry import trace
+
+from relrag.application.dto.chunking_config import ChunkingConfig
+from relrag.application.ports import Chunker, EmbeddingProvider
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace.export import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+tracer = trace.get_tracer("relrag")
+
+
+def configure_tracing(
+    exporter: str,
+    service_name: str = "relrag",
+    otlp_endpoint: str = "",
+    sample_ratio: float = 1.0,
+) -> "SpanExporter | None":
+    """Install a global tracer provider; returns its exporter, None when tracing is off.
+
+    exporter: none, console (stdout), memory (kept in process, for tests and local runs)
+    or otlp (OTLP/HTTP to otlp_endpoint, batched). psycopg is instrumented as well, so
+    each SQL statement gets a span under the repository call that issued it.
+    """
+    if exporter == "none":
+        return None
+    # The SDK is only needed when tracing is on; the API tracer above is a no-op without it
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SimpleSpanProcessor,
+    )
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    span_exporter: SpanExporter
+    if exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        span_exporter = OTLPSpanExporter(endpoint=otlp_endpoint or None)
+        processor = BatchSpanProcessor(span_exporter)
+    elif exporter == "console":
+        span_exporter = ConsoleSpanExporter()
+        processor = SimpleSpanProcessor(span_exporter)
+    elif exporter == "memory":
+        span_exporter = InMemorySpanExporter()
+        processor = SimpleSpanProcessor(span_exporter)
+    else:
+        raise ValueError(f"Unknown tracing exporter: {exporter}")
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+    )
+    provider.add_span_processor(processor)
+    trace.set_tracer_provider(provider)
+    try:
+        from opentelemetry.instrumentation.psycopg import PsycopgInstrumentor
+
+        PsycopgInstrumentor().instrument(enable_commenter=False)
+    except ImportError:
+        logger.warning("opentelemetry-instrumentation-psycopg not installed, SQL spans disabled")
+    return span_exporter
+
+
+def _result_count(result: Any) -> int | None:
+    """Rows in a repository result: list, (list, cursor) page or (list, facets) tuple."""
+    if isinstance(result, list):
+        return len(result)
+    if isinstance(result, tuple) and result and isinstance(result[0], list):
+        return len(result[0])
+    return None
+
+
+class TracedRepository:
+    """Proxy that wraps every coroutine method of a repository in a span."""
+
+    def __init__(self, repository: object, name: str) -> None:
+        self._repository = repository
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        target = getattr(self._repository, attr)
+        if not inspect.iscoroutinefunction(target):
+            return target
+        span_name = f"{self._name}.{attr}"
+
+        @functools.wraps(target)
+        async def traced(*args: Any, **kwargs: Any) -> Any:
+            with tracer.start_as_current_span(
+                span_name, attributes={"db.system": "postgresql"}
+            ) as span:
+                result = await target(*args, **kwargs)
+                count = _result_count(result)
+                if count is not None:
+                    span.set_attribute("relrag.result_count", count)
+                return result
+
+        setattr(self, attr, traced)
+        return traced
+
+
+class TracedEmbeddingProvider:
+    """EmbeddingProvider decorator recording batch size, text bytes and dimensions."""
+
+    def __init__(self, provider: EmbeddingProvider) -> None:
+        self._provider = provider
+
+    async def embed(self, texts: list[str], dimensions: int | None = None) -> list[list[float]]:
+        """Embed texts inside an embedding.embed span."""
+        with tracer.start_as_current_span("embedding.embed") as span:
+            span.set_attribute("relrag.text_count", len(texts))
+            span.set_attribute("relrag.text_bytes", sum(len(t.encode()) for t in texts))
+            if dimensions:
+                span.set_attribute("relrag.dimensions", dimensions)
+            return await self._provider.embed(texts, dimensions=dimensions)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._provider, attr)
+
+
+class TracedChunker:
+    """Chunker decorator recording input size and chunk count."""
+
+    def __init__(self, chunker: Chunker) -> None:
+        self._chunker = chunker
+
+    def chunk(self, text: str, config: ChunkingConfig) -> list[str]:
+        """Chunk text inside a chunking.chunk span."""
+        with tracer.start_as_current_span("chunking.chunk") as span:
+            span.set_attribute("relrag.text_bytes", len(text.encode()))
+            chunks = self._chunker.chunk(text, config)
+            span.set_attribute("relrag.chunk_count", len(chunks))
+            return chunks
@@ -3,6 +3,7 @@
 from uuid import UUID
 
 from relrag.domain.value_objects import PermissionAction
+from relrag.infrastructure.observability.tracing import tracer
 
 
 class RelRAGPermissionChecker:
@@ -13,6 +14,15 @@ class RelRAGPermissionChecker:
 
     async def check(self, user_id: str, collection_id: UUID, action: PermissionAction) -> bool:
         """Check if user has action on collection."""
+        with tracer.start_as_current_span(
+            "permission.check",
+            attributes={"relrag.collection_id": str(collection_id), "relrag.action": action.value},
+        ) as span:
+            allowed = await self._check(user_id, collection_id, action)
+            span.set_attribute("relrag.allowed", allowed)
+            return allowed
+
+    async def _check(self, user_id: str, collection_id: UUID, action: PermissionAction) -> bool:
         async with self._uow_factory() as uow:
             perm = await uow.permissions.get_for_collection(collection_id, user_id)
             if not perm:
@@ -24,3 +34,17 @@ class RelRAGPermissionChecker:
                 actions = role_actions
 
             return action.value in actions
+
+    async def filter_allowed(
+        self, user_id: str, collection_ids: list[UUID], action: PermissionAction
+    ) -> list[UUID]:
+        """Return the subset of collection_ids where user has action (single query)."""
+        if not collection_ids:
+            return []
+        async with self._uow_factory() as uow:
+            allowed = set(
+                await uow.permissions.list_allowed_collection_ids(
+                    user_id, collection_ids, action.value
+                )
+            )
+        return [cid for cid in collection_ids if cid in allowed]
@@ -0,0 +1,96 @@
+"""Partial HNSW index DDL on chunk.embedding for the configurations in use.
+
+Names follow the alembic migrations (004-006); expressions match the ORDER BY
+built by chunk_repository, so the planner can use them. Building an HNSW index over
+existing chunks takes minutes, so it is never done by a request: an administrator runs
+relrag build-indexes (CREATE INDEX CONCURRENTLY) after creating a configuration.
+"""
+
+from psycopg import AsyncConnection
+
+# pgvector HNSW limits: vector up to 2000 dimensions, halfvec up to 4000
+HNSW_MAX_VECTOR_DIMENSIONS = 2000
+HNSW_MAX_HALFVEC_DIMENSIONS = 4000
+
+
+def _index(name: str, expression: str, opclass: str, dimensions: int) -> str:
+    return (
+        f"CREATE INDEX IF NOT EXISTS {name} ON chunk USING hnsw (({expression}) {opclass}) "
+        f"WHERE vector_dims(embedding) = {dimensions}"
+    )
+
+
+def _concurrent(statement: str) -> str:
+    return statement.replace("CREATE INDEX ", "CREATE INDEX CONCURRENTLY ", 1)
+
+
+def ann_index_statements(
+    dimensions: int,
+    precision: str = "vector",
+    coarse_dimensions: int | None = None,
+) -> list[str]:
+    """CREATE INDEX IF NOT EXISTS statements the search SQL expects for a configuration.
+
+    Only the index its ANN pass orders by: the prefix with coarse_dimensions, otherwise
+    the whole embedding, in the configuration's precision. A halfvec or bit configuration
+    gets no full-precision index (chunk.embedding itself stays float32 for rescoring), and
+    a plain vector one gets none: its hybrid search scores every filtered chunk exactly.
+    """
+    d = dimensions
+    k = coarse_dimensions or d
+    suffix = f"{d}_prefix_{k}" if coarse_dimensions else str(d)
+    expression = f"subvector(embedding, 1, {k})" if coarse_dimensions else "embedding"
+    if precision == "bit":
+        return [
+            _index(
+                f"ix_chunk_embedding_bit_{suffix}",
+                f"binary_quantize({expression})::bit({k})",
+                "bit_hamming_ops",
+                d,
+            )
+        ]
+    if precision == "halfvec":
+        if k > HNSW_MAX_HALFVEC_DIMENSIONS:
+            return []
+        return [
+            _index(
+                f"ix_chunk_embedding_half_{suffix}",
+                f"{expression}::halfvec({k})",
+                "halfvec_cosine_ops",
+                d,
+            )
+        ]
+    if not coarse_dimensions or k > HNSW_MAX_VECTOR_DIMENSIONS:
+        return []
+    return [
+        _index(f"ix_chunk_embedding_{suffix}", f"{expression}::vector({k})", "vector_cosine_ops", d)
+    ]
+
+
+async def build_ann_indexes(conn: AsyncConnection, concurrently: bool = True) -> list[str]:
+    """Create the missing indexes of every configuration; returns the statements run.
+
+    With concurrently, conn must be in autocommit mode (CONCURRENTLY cannot run in a
+    transaction); ingest and search keep running while the indexes build.
+    """
+    cur = await conn.execute(
+        "SELECT DISTINCT embedding_dimensions, embedding_precision, coarse_dimensions "
+        "FROM configuration ORDER BY 1, 2, 3"
+    )
+    statements: list[str] = []
+    for dimensions, precision, coarse_dimensions in await cur.fetchall():
+        for statement in ann_index_statements(dimensions, precision, coarse_dimensions):
+            if concurrently:
+                statement = _concurrent(statement)
+            if statement not in statements:
+                statements.append(statement)
+    # An interrupted concurrent build leaves an invalid index that IF NOT EXISTS would skip
+    cur = await conn.execute(
+        "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE NOT i.indisvalid AND left(c.relname, 19) = 'ix_chunk_embedding_'"
+    )
+    for (name,) in await cur.fetchall():
+        await conn.execute(f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS {name}")
+    for statement in statements:
+        await conn.execute(statement)
+    return statements
@@ -3,34 +3,65 @@
 from uuid import UUID
 
 from psycopg import AsyncConnection
+from psycopg.rows import dict_row
 
 from relrag.domain.entities import Chunk
+from relrag.infrastructure.observability.metrics import SEARCH_CANDIDATES, SEARCH_ROWS
+from relrag.infrastructure.observability.profiling import active_profile
+
+# Compact-precision candidates rescored per requested row (at least MIN_RESCORE_CANDIDATES)
+RESCORE_CANDIDATES_FACTOR = 10
+MIN_RESCORE_CANDIDATES = 100
+
+
+def _compact_distance(precision: str, dimensions: int, coarse_dimensions: int | None) -> str:
+    """ORDER BY expression matching a compact partial index (one %s for the query).
+
+    The index is over the whole embedding or, with coarse_dimensions, its leading prefix
+    (subvector), stored as vector, halfvec or binary-quantized bit.
+    """
+    expr = "c.embedding"
+    k = dimensions
+    if coarse_dimensions:
+        k = coarse_dimensions
+        expr = f"subvector(c.embedding, 1, {k})"
+    if precision == "bit":
+        return f"binary_quantize({expr})::bit({k}) <~> binary_quantize(%s::vector({k}))::bit({k})"
+    kind = "halfvec" if precision == "halfvec" else "vector"
+    return f"{expr}::{kind}({k}) <=> %s::{kind}({k})"
 
 
 def _build_property_filter_conditions(
     property_filters: dict[str, object],
 ) -> tuple[list[str], list[object]]:
-    """Build SQL AND conditions and params for property filters. Returns (conditions, params)."""
+    """Build SQL AND conditions and params for property filters. Returns (conditions, params).
+
+    The SQL is canonical for a filter signature (keys in sorted order, one alias per emitted
+    condition, text parameters with explicit casts), so equal signatures produce the same
+    statement text and parameter types and share one prepared statement and plan.
+    """
     conditions: list[str] = []
     params: list[object] = []
-    for i, (key, spec) in enumerate(property_filters.items()):
+    for key in sorted(property_filters):
+        spec = property_filters[key]
         if spec is None:
             continue
         if isinstance(spec, (bool, int, float, str)):
             spec = {"eq": spec}
         if not isinstance(spec, dict):
             continue
-        alias = f"pr{i}"
+        alias = f"pr{len(conditions)}"
+        exists = (
+            f"EXISTS (SELECT 1 FROM property {alias} "
+            f"WHERE {alias}.document_id = p.document_id "
+            f"AND {alias}.key = %s"
+        )
         if "one_of" in spec:
             vals = spec["one_of"]
             if isinstance(vals, list) and vals:
-                conditions.append(
-                    f"EXISTS (SELECT 1 FROM property {alias} "
-                    f"WHERE {alias}.document_id = p.document_id "
-                    f"AND {alias}.key = %s AND {alias}.value = ANY(%s))"
-                )
+                conditions.append(f"{exists} AND {alias}.value = ANY(%s::text[]))")
                 params.append(key)
-                params.append(vals)
+                params.append([str(v) for v in vals])
         elif "gte" in spec or "lte" in spec:
             gte = spec.get("gte")
             lte = spec.get("lte")
@@ -44,34 +75,20 @@ def _build_property_filter_conditions(
                 cast = "::date"
             if gte is not None and lte is not None:
                 conditions.append(
-                    f"EXISTS (SELECT 1 FROM property {alias} "
-                    f"WHERE {alias}.document_id = p.document_id "
-                    f"AND {alias}.key = %s "
-                    f"AND {alias}.value{cast} >= %s AND {alias}.value{cast} <= %s)"
+                    f"{exists} AND {alias}.value{cast} >= %s{cast} "
+                    f"AND {alias}.value{cast} <= %s{cast})"
                 )
-                params.extend([key, gte, lte])
+                params.extend([key, str(gte), str(lte)])
             elif gte is not None:
-                conditions.append(
-                    f"EXISTS (SELECT 1 FROM property {alias} "
-                    f"WHERE {alias}.document_id = p.document_id "
-                    f"AND {alias}.key = %s AND {alias}.value{cast} >= %s)"
-                )
-                params.extend([key, gte])
+                conditions.append(f"{exists} AND {alias}.value{cast} >= %s{cast})")
+                params.extend([key, str(gte)])
             elif lte is not None:
-                conditions.append(
-                    f"EXISTS (SELECT 1 FROM property {alias} "
-                    f"WHERE {alias}.document_id = p.document_id "
-                    f"AND {alias}.key = %s AND {alias}.value{cast} <= %s)"
-                )
-                params.extend([key, lte])
+                conditions.append(f"{exists} AND {alias}.value{cast} <= %s{cast})")
+                params.extend([key, str(lte)])
         elif "eq" in spec:
             val = spec["eq"]
             str_val = "true" if val is True else "false" if val is False else str(val)
-            conditions.append(
-                f"EXISTS (SELECT 1 FROM property {alias} "
-                f"WHERE {alias}.document_id = p.document_id "
-                f"AND {alias}.key = %s AND {alias}.value = %s)"
-            )
+            conditions.append(f"{exists} AND {alias}.value = %s)")
             params.extend([key, str_val])
     return conditions, params
 
@@ -116,49 +133,350 @@ class PostgresChunkRepository:
         fts_weight: float = 0.3,
         limit: int = 10,
         property_filters: dict[str, object] | None = None,
+        after: tuple[float, UUID] | None = None,
+        group_by_document: bool = False,
+        chunks_per_document: int = 3,
+        embedding_precision: str = "vector",
+        coarse_dimensions: int | None = None,
     ) -> list[dict]:
-        """Hybrid search with optional property filters."""
-        where_extra = ""
-        full_params: list[object] = []
-        if property_filters:
-            conds, filter_params = _build_property_filter_conditions(property_filters)
-            if conds:
-                where_extra = " AND " + " AND ".join(conds)
-                full_params.extend(filter_params)
-        query_fts_param = query_fts.strip() if (query_fts and isinstance(query_fts, str)) else ""
-        full_params = [query_embedding, query_fts_param, query_fts_param, collection_id] + full_params + [vector_weight, fts_weight, vector_weight, fts_weight, limit]
-        cur = await self._conn.execute(
-            f"""
-            WITH scored AS (
-                SELECT c.id AS chunk_id, c.pack_id, p.document_id, c.content,
+        """Hybrid search with optional property filters, ordered by (score, chunk_id) desc.
+
+        after is a keyset position: only rows strictly below (score, chunk_id) are returned.
+        With group_by_document, limit and after apply to documents (best chunk score,
+        document_id) and each document contributes up to chunks_per_document chunks.
+        """
+        sql, params = _build_search_query(
+            collection_id,
+            query_embedding,
+            query_fts,
+            vector_weight,
+            fts_weight,
+            limit,
+            property_filters,
+            after=after,
+            group_by_document=group_by_document,
+            chunks_per_document=chunks_per_document,
+            embedding_precision=embedding_precision,
+            coarse_dimensions=coarse_dimensions,
+        )
+        rows = await self._fetch_dicts(sql, params)
+        _observe_search(rows, "collection")
+        return [_search_row_to_dict(r) for r in rows]
+
+    async def search_with_facets(
+        self,
+        collection_id: UUID,
+        query_embedding: list[float],
+        facet_keys: list[str],
+        query_fts: str | None = None,
+        vector_weight: float = 0.7,
+        fts_weight: float = 0.3,
+        limit: int = 10,
+        property_filters: dict[str, object] | None = None,
+        after: tuple[float, UUID] | None = None,
+        group_by_document: bool = False,
+        chunks_per_document: int = 3,
+        embedding_precision: str = "vector",
+        coarse_dimensions: int | None = None,
+    ) -> tuple[list[dict], dict[str, dict[str, int]]]:
+        """Hybrid search plus value -> document count per facet key over all filtered candidates."""
+        sql, params = _build_search_query(
+            collection_id,
+            query_embedding,
+            query_fts,
+            vector_weight,
+            fts_weight,
+            limit,
+            property_filters,
+            facet_keys=facet_keys,
+            after=after,
+            group_by_document=group_by_document,
+            chunks_per_document=chunks_per_document,
+            embedding_precision=embedding_precision,
+            coarse_dimensions=coarse_dimensions,
+        )
+        rows = await self._fetch_dicts(sql, params)
+        _observe_search(rows, "collection")
+        facets = (rows[0]["facets"] if rows else None) or {}
+        return [_search_row_to_dict(r) for r in rows], facets
+
+    async def search_collections(
+        self,
+        collection_ids: list[UUID],
+        query_embedding: list[float],
+        query_fts: str | None = None,
+        vector_weight: float = 0.7,
+        fts_weight: float = 0.3,
+        limit: int = 10,
+        property_filters: dict[str, object] | None = None,
+        embedding_precision: str = "vector",
+        coarse_dimensions: int | None = None,
+    ) -> list[dict]:
+        """Hybrid search fused across collections in one query; rows carry collection_id."""
+        sql, params = _build_search_query(
+            collection_ids,
+            query_embedding,
+            query_fts,
+            vector_weight,
+            fts_weight,
+            limit,
+            property_filters,
+            embedding_precision=embedding_precision,
+            coarse_dimensions=coarse_dimensions,
+        )
+        rows = await self._fetch_dicts(sql, params)
+        _observe_search(rows, "federated")
+        return [_search_row_to_dict(r) for r in rows]
+
+    async def search_many(
+        self, collection_id: UUID, queries: list[dict[str, object]]
+    ) -> list[list[dict]]:
+        """Run several hybrid searches in one pipelined round trip; results keep query order.
+
+        Each query is a dict of search() keyword arguments: query_embedding, query_fts,
+        vector_weight, fts_weight, limit, property_filters, embedding_precision,
+        coarse_dimensions.
+        """
+        cursors = []
+        async with self._conn.pipeline():
+            for q in queries:
+                sql, params = _build_search_query(
+                    collection_id,
+                    q["query_embedding"],
+                    q.get("query_fts"),
+                    q.get("vector_weight", 0.7),
+                    q.get("fts_weight", 0.3),
+                    q.get("limit", 10),
+                    q.get("property_filters"),
+                    embedding_precision=q.get("embedding_precision", "vector"),
+                    coarse_dimensions=q.get("coarse_dimensions"),
+                )
+                cur = self._conn.cursor(row_factory=dict_row)
+                await cur.execute(sql, params)
+                cursors.append(cur)
+        results = []
+        for cur in cursors:
+            rows = await cur.fetchall()
+            _observe_search(rows, "batch")
+            results.append([_search_row_to_dict(r) for r in rows])
+        return results
+
+    async def _fetch_dicts(self, sql: str, params: list[object]) -> list[dict]:
+        """Execute query and return rows as dicts keyed by column name.
+
+        A request profiled on demand also gets the statement's EXPLAIN (ANALYZE, BUFFERS).
+        """
+        cur = self._conn.cursor(row_factory=dict_row)
+        await cur.execute(sql, params)
+        rows = await cur.fetchall()
+        profile = active_profile()
+        if profile is not None and profile.explain:
+            await profile.explain_statement(self._conn, sql, params)
+        return rows
+
+
+def _observe_search(rows: list[dict], kind: str) -> None:
+    """Record returned rows and, for two-phase searches, the ANN candidates rescored."""
+    SEARCH_ROWS.observe(len(rows), kind=kind)
+    if rows and rows[0].get("candidate_count") is not None:
+        SEARCH_CANDIDATES.observe(rows[0]["candidate_count"], kind=kind)
+
+
+def _build_search_query(
+    collection_id: UUID | list[UUID],
+    query_embedding: list[float],
+    query_fts: str | None,
+    vector_weight: float,
+    fts_weight: float,
+    limit: int,
+    property_filters: dict[str, object] | None,
+    facet_keys: list[str] | None = None,
+    after: tuple[float, UUID] | None = None,
+    group_by_document: bool = False,
+    chunks_per_document: int = 3,
+    embedding_precision: str = "vector",
+    coarse_dimensions: int | None = None,
+) -> tuple[str, list[object]]:
+    """Build hybrid search SQL and params.
+
+    Facets, when requested, are counted over every chunk that passed the filters (not
+    only the returned page, nor only the ANN pool of a two-phase search) and attached to
+    each row as one json column.
+    Rows are ordered by (score, chunk_id) desc so that after gives a stable keyset page;
+    grouped by document they are ordered by (doc_score, document_id) desc, then chunk_rank.
+    A list of collection ids searches all of them at once (federated search).
+    Only chunks with the query's dimension are compared. With vector precision every
+    filtered candidate is scored exactly (the hybrid ORDER BY cannot use an ANN index, so
+    none is built). With halfvec or bit precision the candidates are the nearest chunks
+    on that compact partial HNSW index, rescored with the full-precision vector.
+    coarse_dimensions does the same on the leading (Matryoshka) prefix of the embedding.
+    Two-phase rows also carry candidate_count, the number of ANN candidates rescored.
+    """
+    if isinstance(collection_id, list):
+        # A pack linked to several requested collections is still one candidate per chunk
+        collection_join = (
+            "JOIN LATERAL (SELECT pcl.collection_id FROM pack_collection pcl "
+            "WHERE pcl.pack_id = p.id AND pcl.collection_id = ANY(%s) LIMIT 1) pc ON true"
+        )
+    else:
+        collection_join = "JOIN pack_collection pc ON pc.pack_id = p.id AND pc.collection_id = %s"
+    where_extra = ""
+    if query_embedding:
+        where_extra = f" AND vector_dims(c.embedding) = {len(query_embedding)}"
+    filter_params: list[object] = []
+    if property_filters:
+        conds, filter_params = _build_property_filter_conditions(property_filters)
+        if conds:
+            where_extra += " AND " + " AND ".join(conds)
+    query_fts_param = query_fts.strip() if (query_fts and isinstance(query_fts, str)) else ""
+    fts_score = (
+        "CASE WHEN %s != '' THEN ts_rank(to_tsvector('simple', c.content), "
+        "plainto_tsquery('simple', %s)) ELSE 0 END"
+    )
+    params: list[object]
+    candidate_col = ""
+    two_phase = bool(query_embedding) and (
+        embedding_precision != "vector" or bool(coarse_dimensions)
+    )
+    if not two_phase:
+        candidates_cte = f"""
+            candidates AS (
+                SELECT c.id AS chunk_id, c.pack_id, p.document_id, pc.collection_id, c.content,
                        (1 - (c.embedding <=> %s::vector)) AS vector_score,
-                       CASE WHEN %s != '' THEN ts_rank(to_tsvector('simple', c.content), plainto_tsquery('simple', %s)) ELSE 0 END AS fts_score,
-                       pr.doc_props
+                       {fts_score} AS fts_score
                 FROM chunk c
                 JOIN pack p ON p.id = c.pack_id
-                JOIN pack_collection pc ON pc.pack_id = p.id AND pc.collection_id = %s
-                LEFT JOIN LATERAL (SELECT json_object_agg(key, value) AS doc_props FROM property WHERE document_id = p.document_id) pr ON true
+                {collection_join}
                 WHERE p.deleted_at IS NULL{where_extra}
-            )
-            SELECT chunk_id, pack_id, document_id, content, vector_score, fts_score,
-                   (vector_score * %s + fts_score * %s) AS score, doc_props
-            FROM scored
-            ORDER BY (vector_score * %s + fts_score * %s) DESC
-            LIMIT %s
-            """,
-            full_params,
+            )"""
+        params = [query_embedding, query_fts_param, query_fts_param, collection_id]
+        params.extend(filter_params)
+    else:
+        compact_dimensions = coarse_dimensions or len(query_embedding)
+        compact_distance = _compact_distance(
+            embedding_precision, len(query_embedding), coarse_dimensions
         )
-        rows = await cur.fetchall()
-        return [
-            {
-                "chunk_id": r[0],
-                "pack_id": r[1],
-                "document_id": r[2],
-                "content": r[3],
-                "vector_score": float(r[4]),
-                "fts_score": float(r[5]),
-                "score": float(r[6]),
-                "doc_props": r[7],
-            }
-            for r in rows
-        ]
+        pool = max(
+            MIN_RESCORE_CANDIDATES,
+            limit * RESCORE_CANDIDATES_FACTOR * (chunks_per_document if group_by_document else 1),
+        )
+        candidates_cte = f"""
+            ann AS (
+                SELECT c.id, c.pack_id, p.document_id, pc.collection_id, c.content, c.embedding
+                FROM chunk c
+                JOIN pack p ON p.id = c.pack_id
+                {collection_join}
+                WHERE p.deleted_at IS NULL{where_extra}
+                ORDER BY {compact_distance}
+                LIMIT %s
+            ),
+            candidates AS (
+                SELECT c.id AS chunk_id, c.pack_id, c.document_id, c.collection_id, c.content,
+                       (1 - (c.embedding::vector <=> %s::vector)) AS vector_score,
+                       {fts_score} AS fts_score
+                FROM ann c
+            )"""
+        candidate_col = ", (SELECT count(*) FROM ann) AS candidate_count"
+        params = [collection_id, *filter_params, query_embedding[:compact_dimensions], pool]
+        params.extend([query_embedding, query_fts_param, query_fts_param])
+    params.extend([vector_weight, fts_weight])
+    facets_cte = ""
+    facets_col = ""
+    if facet_keys:
+        params.append(list(facet_keys))
+        if two_phase:
+            # candidates are only the ANN pool: count over every chunk passing the filters
+            facet_documents = f"""
+                            SELECT p.document_id
+                            FROM chunk c
+                            JOIN pack p ON p.id = c.pack_id
+                            {collection_join}
+                            WHERE p.deleted_at IS NULL{where_extra}"""
+            params.extend([collection_id, *filter_params])
+        else:
+            facet_documents = "SELECT document_id FROM candidates"
+        facets_cte = f"""
+            facets AS (
+                SELECT json_object_agg(key, vals) AS facets FROM (
+                    SELECT key, json_object_agg(value, cnt) AS vals FROM (
+                        SELECT pr.key, pr.value, COUNT(*) AS cnt
+                        FROM property pr
+                        WHERE pr.key = ANY(%s)
+                          AND pr.document_id IN ({facet_documents})
+                        GROUP BY pr.key, pr.value
+                    ) v GROUP BY key
+                ) k
+            ),"""
+        facets_col = ", (SELECT facets FROM facets) AS facets"
+    if group_by_document:
+        keyset = ""
+        if after is not None:
+            keyset = "AND (r.doc_score, r.document_id) < (%s::float8, %s::uuid)"
+            params.extend([after[0], after[1]])
+        params.extend([limit, chunks_per_document])
+        top_cte = f"""
+            ranked AS (
+                SELECT s.*,
+                       ROW_NUMBER() OVER (PARTITION BY s.document_id ORDER BY s.score DESC, s.chunk_id DESC) AS chunk_rank,
+                       MAX(s.score) OVER (PARTITION BY s.document_id) AS doc_score
+                FROM scored s
+            ),
+            docs AS (
+                SELECT r.document_id FROM ranked r
+                WHERE r.chunk_rank = 1 {keyset}
+                ORDER BY r.doc_score DESC, r.document_id DESC
+                LIMIT %s
+            ),
+            top AS (
+                SELECT r.* FROM ranked r
+                JOIN docs d ON d.document_id = r.document_id
+                WHERE r.chunk_rank <= %s
+            )"""
+        group_cols = ", t.doc_score, t.chunk_rank"
+        order = "t.doc_score DESC, t.document_id DESC, t.chunk_rank"
+    else:
+        keyset = ""
+        if after is not None:
+            keyset = "WHERE (s.score, s.chunk_id) < (%s::float8, %s::uuid)"
+            params.extend([after[0], after[1]])
+        params.append(limit)
+        top_cte = f"""
+            top AS (
+                SELECT * FROM scored s
+                {keyset}
+                ORDER BY s.score DESC, s.chunk_id DESC
+                LIMIT %s
+            )"""
+        group_cols = ""
+        order = "t.score DESC, t.chunk_id DESC"
+    sql = f"""
+            WITH {candidates_cte.strip()},
+            scored AS (
+                SELECT candidates.*, (vector_score * %s + fts_score * %s) AS score
+                FROM candidates
+            ),{facets_cte}{top_cte}
+            SELECT t.chunk_id, t.pack_id, t.document_id, t.collection_id, t.content, t.vector_score, t.fts_score,
+                   t.score{group_cols}, pr.doc_props{facets_col}{candidate_col}
+            FROM top t
+            LEFT JOIN LATERAL (SELECT json_object_agg(key, value) AS doc_props FROM property WHERE document_id = t.document_id) pr ON true
+            ORDER BY {order}
+            """
+    return sql, params
+
+
+def _search_row_to_dict(r: dict) -> dict:
+    """Map a search result row to the repository result dict."""
+    out = {
+        "chunk_id": r["chunk_id"],
+        "pack_id": r["pack_id"],
+        "document_id": r["document_id"],
+        "collection_id": r["collection_id"],
+        "content": r["content"],
+        "vector_score": float(r["vector_score"]),
+        "fts_score": float(r["fts_score"]),
+        "score": float(r["score"]),
+        "doc_props": r["doc_props"],
+    }
+    if "doc_score" in r:
+        out["doc_score"] = float(r["doc_score"])
+    return out
@@ -1,5 +1,7 @@
 """PostgreSQL collection repository implementation."""
 
+from __future__ import annotations
+
 from uuid import UUID
 
 from psycopg import AsyncConnection
@@ -17,7 +19,10 @@ class PostgresCollectionRepository:
         self, collection_id: UUID, include_deleted: bool = False
     ) -> Collection | None:
         """Get collection by id."""
-        q = "SELECT id, configuration_id, created_at, updated_at, deleted_at, name FROM collection WHERE id = %s"
+        q = (
+            "SELECT id, configuration_id, created_at, updated_at, deleted_at, name, version "
+            "FROM collection WHERE id = %s"
+        )
         if not include_deleted:
             q += " AND deleted_at IS NULL"
         cur = await self._conn.execute(q, (collection_id,))
@@ -31,6 +36,7 @@ class PostgresCollectionRepository:
             updated_at=r[3],
             deleted_at=r[4],
             name=r[5],
+            version=r[6],
         )
 
     async def list(
@@ -51,7 +57,7 @@ class PostgresCollectionRepository:
         where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
         params = tuple(_params) + (limit + 1,)
         q = (
-            "SELECT id, configuration_id, created_at, updated_at, deleted_at, name "
+            "SELECT id, configuration_id, created_at, updated_at, deleted_at, name, version "
             f"FROM collection{where} ORDER BY id LIMIT %s"
         )
         cur = await self._conn.execute(q, params)
@@ -64,6 +70,7 @@ class PostgresCollectionRepository:
                 updated_at=r[3],
                 deleted_at=r[4],
                 name=r[5],
+                version=r[6],
             )
             for r in rows[:limit]
         ]
@@ -86,7 +93,8 @@ class PostgresCollectionRepository:
         where = " AND ".join(conditions)
         params = tuple(_params) + (limit + 1,)
         q = (
-            "SELECT DISTINCT c.id, c.configuration_id, c.created_at, c.updated_at, c.deleted_at, c.name "
+            "SELECT DISTINCT c.id, c.configuration_id, c.created_at, c.updated_at, "
+            "c.deleted_at, c.name, c.version "
             "FROM collection c JOIN permission p ON p.collection_id = c.id "
             f"WHERE {where} ORDER BY c.id LIMIT %s"
         )
@@ -100,6 +108,7 @@ class PostgresCollectionRepository:
                 updated_at=r[3],
                 deleted_at=r[4],
                 name=r[5],
+                version=r[6],
             )
             for r in rows[:limit]
         ]
@@ -109,8 +118,9 @@ class PostgresCollectionRepository:
     async def create(self, collection: Collection) -> Collection:
         """Create collection."""
         await self._conn.execute(
-            "INSERT INTO collection (id, configuration_id, created_at, updated_at, deleted_at, name) "
-            "VALUES (%s, %s, %s, %s, %s, %s)",
+            "INSERT INTO collection "
+            "(id, configuration_id, created_at, updated_at, deleted_at, name, version) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s)",
             (
                 collection.id,
                 collection.configuration_id,
@@ -118,6 +128,7 @@ class PostgresCollectionRepository:
                 collection.updated_at,
                 collection.deleted_at,
                 collection.name,
+                collection.version,
             ),
         )
         return collection
@@ -132,7 +143,23 @@ class PostgresCollectionRepository:
     async def soft_delete(self, collection_id: UUID) -> None:
         """Soft delete collection."""
         await self._conn.execute(
-            "UPDATE collection SET deleted_at = NOW() WHERE id = %s",
+            "UPDATE collection SET deleted_at = NOW(), version = version + 1 WHERE id = %s",
+            (collection_id,),
+        )
+
+    async def get_version(self, collection_id: UUID) -> int | None:
+        """Get the collection's search-visible data version."""
+        cur = await self._conn.execute(
+            "SELECT version FROM collection WHERE id = %s AND deleted_at IS NULL",
+            (collection_id,),
+        )
+        r = await cur.fetchone()
+        return r[0] if r else None
+
+    async def bump_version(self, collection_id: UUID) -> None:
+        """Increment the version after a write that changes search results."""
+        await self._conn.execute(
+            "UPDATE collection SET version = version + 1 WHERE id = %s",
             (collection_id,),
         )
 
@@ -1,11 +1,13 @@
 """PostgreSQL configuration repository implementation."""
 
+from __future__ import annotations
+
 from uuid import UUID
 
 from psycopg import AsyncConnection
 
 from relrag.domain.entities import Configuration
-from relrag.domain.value_objects import ChunkingStrategy
+from relrag.domain.value_objects import ChunkingStrategy, EmbeddingPrecision
 
 
 class PostgresConfigurationRepository:
@@ -18,7 +20,8 @@ class PostgresConfigurationRepository:
         """Get configuration by id."""
         cur = await self._conn.execute(
             "SELECT id, chunking_strategy, embedding_model, embedding_dimensions, "
-            "chunk_size, chunk_overlap, name FROM configuration WHERE id = %s",
+            "chunk_size, chunk_overlap, name, embedding_precision, coarse_dimensions "
+            "FROM configuration WHERE id = %s",
             (configuration_id,),
         )
         r = await cur.fetchone()
@@ -32,6 +35,8 @@ class PostgresConfigurationRepository:
             chunk_size=r[4],
             chunk_overlap=r[5],
             name=r[6],
+            embedding_precision=EmbeddingPrecision(r[7]),
+            coarse_dimensions=r[8],
         )
 
     async def list(
@@ -50,7 +55,8 @@ class PostgresConfigurationRepository:
         params = tuple(_params) + (limit + 1,)
         q = (
             "SELECT id, chunking_strategy, embedding_model, embedding_dimensions, "
-            f"chunk_size, chunk_overlap, name FROM configuration{where} ORDER BY id LIMIT %s"
+            "chunk_size, chunk_overlap, name, embedding_precision, coarse_dimensions "
+            f"FROM configuration{where} ORDER BY id LIMIT %s"
         )
         cur = await self._conn.execute(q, params)
         rows = await cur.fetchall()
@@ -63,6 +69,8 @@ class PostgresConfigurationRepository:
                 chunk_size=r[4],
                 chunk_overlap=r[5],
                 name=r[6],
+                embedding_precision=EmbeddingPrecision(r[7]),
+                coarse_dimensions=r[8],
             )
             for r in rows[:limit]
         ]
@@ -73,7 +81,8 @@ class PostgresConfigurationRepository:
         """Get configuration for collection."""
         cur = await self._conn.execute(
             "SELECT c.id, c.chunking_strategy, c.embedding_model, c.embedding_dimensions, "
-            "c.chunk_size, c.chunk_overlap, c.name FROM configuration c "
+            "c.chunk_size, c.chunk_overlap, c.name, c.embedding_precision, c.coarse_dimensions "
+            "FROM configuration c "
             "JOIN collection col ON col.configuration_id = c.id WHERE col.id = %s",
             (collection_id,),
         )
@@ -88,14 +97,43 @@ class PostgresConfigurationRepository:
             chunk_size=r[4],
             chunk_overlap=r[5],
             name=r[6],
+            embedding_precision=EmbeddingPrecision(r[7]),
+            coarse_dimensions=r[8],
+        )
+
+    async def get_by_collection_ids(self, collection_ids: list[UUID]) -> dict[UUID, Configuration]:
+        """Get configurations keyed by collection id (collections without one are omitted)."""
+        if not collection_ids:
+            return {}
+        cur = await self._conn.execute(
+            "SELECT col.id, c.id, c.chunking_strategy, c.embedding_model, c.embedding_dimensions, "
+            "c.chunk_size, c.chunk_overlap, c.name, c.embedding_precision, c.coarse_dimensions "
+            "FROM configuration c "
+            "JOIN collection col ON col.configuration_id = c.id WHERE col.id = ANY(%s)",
+            (collection_ids,),
         )
+        rows = await cur.fetchall()
+        return {
+            r[0]: Configuration(
+                id=r[1],
+                chunking_strategy=ChunkingStrategy(r[2]),
+                embedding_model=r[3],
+                embedding_dimensions=r[4],
+                chunk_size=r[5],
+                chunk_overlap=r[6],
+                name=r[7],
+                embedding_precision=EmbeddingPrecision(r[8]),
+                coarse_dimensions=r[9],
+            )
+            for r in rows
+        }
 
     async def create(self, configuration: Configuration) -> Configuration:
         """Create configuration."""
         await self._conn.execute(
             "INSERT INTO configuration (id, chunking_strategy, embedding_model, "
-            "embedding_dimensions, chunk_size, chunk_overlap, name) "
-            "VALUES (%s, %s, %s, %s, %s, %s, %s)",
+            "embedding_dimensions, chunk_size, chunk_overlap, name, embedding_precision, "
+            "coarse_dimensions) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)",
             (
                 configuration.id,
                 configuration.chunking_strategy.value,
@@ -104,6 +142,8 @@ class PostgresConfigurationRepository:
                 configuration.chunk_size,
                 configuration.chunk_overlap,
                 configuration.name,
+                configuration.embedding_precision.value,
+                configuration.coarse_dimensions,
             ),
         )
         return configuration
@@ -3,19 +3,49 @@
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
+from pgvector.psycopg import register_vector_async  # type: ignore[import-untyped]
+from psycopg import AsyncConnection
 from psycopg_pool import AsyncConnectionPool
 
 
-def create_pool(conninfo: str, min_size: int = 2, max_size: int = 10) -> AsyncConnectionPool:
+def create_pool(
+    conninfo: str,
+    min_size: int = 2,
+    max_size: int = 10,
+    timeout: float = 30.0,
+    max_waiting: int = 0,
+    max_idle: float = 600.0,
+    max_lifetime: float = 3600.0,
+    prepare_threshold: int | None = 2,
+    prepared_max: int = 256,
+) -> AsyncConnectionPool:
     """Create async connection pool.
 
     Pool is created with open=False. Caller must call await pool.open()
     before use (e.g. via PoolLifespanMiddleware in ASGI lifespan).
+    timeout is the checkout wait budget (PoolTimeout when exceeded); max_waiting > 0 rejects
+    checkouts immediately (TooManyRequests) once that many are already queued.
+    A statement executed prepare_threshold times on a connection is prepared server-side,
+    so repeated lookups and canonical search shapes skip parsing and planning.
+    prepare_threshold=None disables prepared statements (PgBouncer in transaction mode).
     """
+
+    async def configure(conn: AsyncConnection) -> None:
+        # Once per physical connection instead of on every checkout
+        await register_vector_async(conn)
+        await conn.commit()
+        conn.prepared_max = prepared_max
+
     return AsyncConnectionPool(
         conninfo=conninfo,
         min_size=min_size,
         max_size=max_size,
+        timeout=timeout,
+        max_waiting=max_waiting,
+        max_idle=max_idle,
+        max_lifetime=max_lifetime,
+        kwargs={"prepare_threshold": prepare_threshold},
+        configure=configure,
         open=False,
     )
 
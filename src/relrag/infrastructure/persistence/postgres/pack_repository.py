@@ -30,6 +30,16 @@ class PostgresPackRepository:
             deleted_at=r[4],
         )
 
+    async def list_collection_ids(self, document_id: UUID) -> list[UUID]:
+        """Collections the document's live packs are linked to (documents are shared by hash)."""
+        cur = await self._conn.execute(
+            "SELECT DISTINCT pc.collection_id FROM pack p "
+            "JOIN pack_collection pc ON pc.pack_id = p.id "
+            "WHERE p.document_id = %s AND p.deleted_at IS NULL ORDER BY pc.collection_id",
+            (document_id,),
+        )
+        return [r[0] for r in await cur.fetchall()]
+
     async def list(
         self,
         *,
@@ -110,10 +120,11 @@ class PostgresPackRepository:
         """Hard delete pack."""
         await self._conn.execute("DELETE FROM pack WHERE id = %s", (pack_id,))
 
-    async def add_to_collection(self, pack_id: UUID, collection_id: UUID) -> None:
-        """Add pack to collection (M:N)."""
-        await self._conn.execute(
+    async def add_to_collection(self, pack_id: UUID, collection_id: UUID) -> bool:
+        """Add pack to collection (M:N). Returns False if pack was already there."""
+        cur = await self._conn.execute(
             "INSERT INTO pack_collection (pack_id, collection_id) VALUES (%s, %s) "
             "ON CONFLICT DO NOTHING",
             (pack_id, collection_id),
         )
+        return cur.rowcount > 0
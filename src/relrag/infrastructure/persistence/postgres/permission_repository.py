@@ -95,6 +95,20 @@ class PostgresPermissionRepository:
             created_by=r[6],
         )
 
+    async def list_allowed_collection_ids(
+        self, subject: str, collection_ids: list[UUID], action: str
+    ) -> list[UUID]:
+        """Collections among collection_ids where subject has action (override or role)."""
+        cur = await self._conn.execute(
+            "SELECT p.collection_id FROM permission p "
+            "WHERE p.subject = %s AND p.collection_id = ANY(%s) AND CASE "
+            "WHEN p.actions_override IS NOT NULL THEN p.actions_override::jsonb ? %s "
+            "ELSE EXISTS (SELECT 1 FROM role_permission rp "
+            "WHERE rp.role_id = p.role_id AND rp.action = %s) END",
+            (subject, collection_ids, action, action),
+        )
+        return [r[0] for r in await cur.fetchall()]
+
     async def create(self, permission: Permission) -> Permission:
         """Create permission."""
         await self._conn.execute(
@@ -10,6 +10,28 @@ from relrag.application.ports.repositories.property_repository import (
 from relrag.domain.entities import Property
 from relrag.domain.value_objects import PropertyType
 
+# Max distinct values returned per string/bool key
+SCHEMA_VALUES_LIMIT = 500
+
+
+def _schema_items_from_facet_rows(
+    rows: list[tuple[str, str, str, int, int]],
+) -> list[PropertySchemaItem]:
+    """Group (key, type, value, count, key_count) rows ordered by key into schema items."""
+    result: list[PropertySchemaItem] = []
+    current: PropertySchemaItem | None = None
+    for key, ptype_str, value, count, key_count in rows:
+        ptype = PropertyType(ptype_str)
+        if current is None or current.key != key or current.property_type != ptype:
+            current = PropertySchemaItem(
+                key=key, property_type=ptype, document_count=int(key_count)
+            )
+            result.append(current)
+        if ptype in (PropertyType.STRING, PropertyType.BOOL):
+            current.values.append(value)
+            current.counts[value] = int(count)
+    return result
+
 
 class PostgresPropertyRepository:
     """Property repository implementation."""
@@ -43,46 +65,61 @@ class PostgresPropertyRepository:
             )
 
     async def delete_by_document(self, document_id: UUID) -> None:
-        """Delete all properties for document."""
+        """Delete all properties for document and drop them from collection facets."""
+        await self._conn.execute(
+            """
+            UPDATE property_facet f SET document_count = f.document_count - 1
+            FROM property p
+            JOIN pack pk ON pk.document_id = p.document_id
+            JOIN pack_collection pc ON pc.pack_id = pk.id
+            WHERE p.document_id = %s AND f.collection_id = pc.collection_id
+              AND f.key = p.key AND f.property_type = p.property_type AND f.value = p.value
+            """,
+            (document_id,),
+        )
+        # Only the facet rows touched above can have dropped to zero
+        await self._conn.execute(
+            """
+            DELETE FROM property_facet f
+            USING property p
+            JOIN pack pk ON pk.document_id = p.document_id
+            JOIN pack_collection pc ON pc.pack_id = pk.id
+            WHERE p.document_id = %s AND f.collection_id = pc.collection_id
+              AND f.key = p.key AND f.property_type = p.property_type AND f.value = p.value
+              AND f.document_count <= 0
+            """,
+            (document_id,),
+        )
         await self._conn.execute(
             "DELETE FROM property WHERE document_id = %s",
             (document_id,),
         )
 
-    async def list_schema_by_collection(
-        self, collection_id: UUID
-    ) -> list[PropertySchemaItem]:
-        """List distinct property keys and types in collection, with sample values for string/bool."""
+    async def add_document_to_facets(self, collection_id: UUID, document_id: UUID) -> None:
+        """Count document properties into the collection facet summary."""
+        await self._conn.execute(
+            "INSERT INTO property_facet (collection_id, key, property_type, value, document_count) "
+            "SELECT %s, key, property_type, value, 1 FROM property WHERE document_id = %s "
+            "ON CONFLICT (collection_id, key, property_type, md5(value)) "
+            "DO UPDATE SET document_count = property_facet.document_count + 1",
+            (collection_id, document_id),
+        )
+
+    async def list_schema_by_collection(self, collection_id: UUID) -> list[PropertySchemaItem]:
+        """List property keys and types in collection with value counts for string/bool."""
         cur = await self._conn.execute(
             """
-            SELECT DISTINCT p.key, p.property_type
-            FROM property p
-            JOIN document d ON d.id = p.document_id
-            JOIN pack pk ON pk.document_id = d.id
-            JOIN pack_collection pc ON pc.pack_id = pk.id AND pc.collection_id = %s
-            WHERE pk.deleted_at IS NULL AND d.deleted_at IS NULL
-            ORDER BY p.key
+            SELECT key, property_type, value, document_count, key_count FROM (
+                SELECT key, property_type, value, document_count,
+                       SUM(document_count) OVER w AS key_count,
+                       ROW_NUMBER() OVER (w ORDER BY value) AS rn
+                FROM property_facet
+                WHERE collection_id = %s AND document_count > 0
+                WINDOW w AS (PARTITION BY key, property_type)
+            ) f
+            WHERE rn = 1 OR (property_type IN ('string', 'bool') AND rn <= %s)
+            ORDER BY key, property_type, value
             """,
-            (collection_id,),
+            (collection_id, SCHEMA_VALUES_LIMIT),
         )
-        rows = await cur.fetchall()
-        result: list[PropertySchemaItem] = []
-        for key, ptype_str in rows:
-            ptype = PropertyType(ptype_str)
-            values: list[str] = []
-            if ptype in (PropertyType.STRING, PropertyType.BOOL):
-                cur2 = await self._conn.execute(
-                    """
-                    SELECT DISTINCT p.value FROM property p
-                    JOIN document d ON d.id = p.document_id
-                    JOIN pack pk ON pk.document_id = d.id
-                    JOIN pack_collection pc ON pc.pack_id = pk.id AND pc.collection_id = %s
-                    WHERE pk.deleted_at IS NULL AND d.deleted_at IS NULL AND p.key = %s
-                    ORDER BY p.value
-                    LIMIT 500
-                    """,
-                    (collection_id, key),
-                )
-                values = [r[0] for r in await cur2.fetchall()]
-            result.append(PropertySchemaItem(key=key, property_type=ptype, values=values))
-        return result
+        return _schema_items_from_facet_rows(await cur.fetchall())
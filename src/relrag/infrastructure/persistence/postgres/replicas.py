@@ -0,0 +1,103 @@
+"""Read replicas - round-robin routing with replication lag checks."""
+
+import itertools
+import logging
+import time
+from typing import Any
+
+from psycopg import AsyncConnection, OperationalError
+from psycopg_pool import AsyncConnectionPool, PoolTimeout, TooManyRequests
+
+from relrag.infrastructure.observability.metrics import PoolMetrics
+
+logger = logging.getLogger(__name__)
+
+# Replay lag in seconds; 0 when the replica has replayed all WAL it received
+# (an idle primary would otherwise look lagging since its last transaction)
+REPLICATION_LAG_SQL = (
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+
+class ReplicaSet:
+    """Replica pools for read-only units of work.
+
+    Replicas are tried round-robin. Each replica's lag is re-measured at most every
+    lag_check_interval seconds on a checked-out connection; a replica lagging more than
+    max_lag_seconds, or failing to hand out a connection within checkout_timeout, is
+    skipped (the latter for unavailable_backoff seconds). None from checkout() means
+    the caller should use the primary. metrics, one per pool, record checkout waits
+    and timeouts.
+    """
+
+    def __init__(
+        self,
+        pools: list[AsyncConnectionPool],
+        max_lag_seconds: float = 5.0,
+        lag_check_interval: float = 1.0,
+        checkout_timeout: float = 1.0,
+        unavailable_backoff: float = 10.0,
+        metrics: list[PoolMetrics] | None = None,
+    ) -> None:
+        self.pools = pools
+        self.metrics = metrics or []
+        self._max_lag = max_lag_seconds
+        self._lag_check_interval = lag_check_interval
+        self._checkout_timeout = checkout_timeout
+        self._backoff = unavailable_backoff
+        self._order = itertools.cycle(range(len(pools)))
+        self._lag: dict[int, tuple[float, float]] = {}  # replica -> (checked_at, lag seconds)
+        self._unavailable_until: dict[int, float] = {}
+
+    async def checkout(self) -> tuple[Any, AsyncConnection] | None:
+        """Return (pool connection context, connection) on an up-to-date replica, or None."""
+        if not self.pools:
+            return None
+        start = next(self._order)
+        for offset in range(len(self.pools)):
+            i = (start + offset) % len(self.pools)
+            now = time.monotonic()
+            if self._unavailable_until.get(i, 0.0) > now:
+                continue
+            checked_at, lag = self._lag.get(i, (float("-inf"), 0.0))
+            fresh = now - checked_at < self._lag_check_interval
+            if fresh and lag > self._max_lag:
+                continue
+            metrics = self.metrics[i] if i < len(self.metrics) else None
+            conn_cm = self.pools[i].connection(timeout=self._checkout_timeout)
+            started = time.perf_counter()
+            try:
+                conn = await conn_cm.__aenter__()
+            except (PoolTimeout, TooManyRequests, OperationalError) as e:
+                if metrics and isinstance(e, (PoolTimeout, TooManyRequests)):
+                    metrics.observe_timeout()
+                logger.warning("Replica %d unavailable, using other servers: %s", i, e)
+                self._unavailable_until[i] = now + self._backoff
+                continue
+            if metrics:
+                metrics.observe_wait(time.perf_counter() - started)
+            if not fresh:
+                try:
+                    lag = await self._measure_lag(i, conn)
+                except BaseException as e:
+                    # Hand the connection back to its pool before giving up on this replica
+                    await conn_cm.__aexit__(type(e), e, e.__traceback__)
+                    if not isinstance(e, OperationalError):
+                        raise
+                    logger.warning("Replica %d lag check failed, using other servers: %s", i, e)
+                    self._unavailable_until[i] = now + self._backoff
+                    continue
+            if lag <= self._max_lag:
+                return conn_cm, conn
+            logger.warning("Replica %d lags %.1fs, using other servers", i, lag)
+            await conn_cm.__aexit__(None, None, None)
+        return None
+
+    async def _measure_lag(self, i: int, conn: AsyncConnection) -> float:
+        cur = await conn.execute(REPLICATION_LAG_SQL)
+        row = await cur.fetchone()
+        await conn.rollback()
+        lag = float(row[0]) if row and row[0] is not None else 0.0
+        self._lag[i] = (time.monotonic(), lag)
+        return lag
@@ -1,11 +1,14 @@
 """PostgreSQL Unit of Work implementation."""
 
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 
-from pgvector.psycopg import register_vector_async  # type: ignore[import-untyped]
-from psycopg_pool import AsyncConnectionPool
+from psycopg_pool import AsyncConnectionPool, PoolTimeout, TooManyRequests
 
+from relrag.infrastructure.observability.metrics import PoolMetrics
+from relrag.infrastructure.observability.profiling import ProfiledConnection, active_profile
+from relrag.infrastructure.observability.tracing import TracedRepository, tracer
 from relrag.infrastructure.persistence.postgres.chunk_repository import (
     PostgresChunkRepository,
 )
@@ -27,33 +30,86 @@ from relrag.infrastructure.persistence.postgres.permission_repository import (
 from relrag.infrastructure.persistence.postgres.property_repository import (
     PostgresPropertyRepository,
 )
+from relrag.infrastructure.persistence.postgres.replicas import ReplicaSet
 from relrag.infrastructure.persistence.postgres.role_repository import (
     PostgresRoleRepository,
 )
 
 
 class PostgresUnitOfWork:
-    """PostgreSQL Unit of Work - one connection, one transaction."""
-
-    def __init__(self, pool: AsyncConnectionPool) -> None:
+    """PostgreSQL Unit of Work - one connection, one transaction.
+
+    A read_only unit of work opens a READ ONLY transaction, so a misrouted write fails
+    instead of reaching the primary. With replicas the connection comes from an
+    up-to-date replica when one is available, otherwise from the primary pool.
+    """
+
+    def __init__(
+        self,
+        pool: AsyncConnectionPool,
+        metrics: PoolMetrics | None = None,
+        replicas: ReplicaSet | None = None,
+        trace_queries: bool = False,
+        read_only: bool = False,
+    ) -> None:
         self._pool = pool
+        self._metrics = metrics
+        self._replicas = replicas
+        self._trace_queries = trace_queries
+        self._read_only = read_only
         self._conn: object | None = None
         self._conn_cm: object | None = None
+        self._replica = False
 
     async def __aenter__(self) -> "PostgresUnitOfWork":
-        self._conn_cm = self._pool.connection()
-        self._conn = await self._conn_cm.__aenter__()
-        await register_vector_async(self._conn)
-        self._documents = PostgresDocumentRepository(self._conn)
-        self._packs = PostgresPackRepository(self._conn)
-        self._chunks = PostgresChunkRepository(self._conn)
-        self._collections = PostgresCollectionRepository(self._conn)
-        self._configurations = PostgresConfigurationRepository(self._conn)
-        self._properties = PostgresPropertyRepository(self._conn)
-        self._permissions = PostgresPermissionRepository(self._conn)
-        self._roles = PostgresRoleRepository(self._conn)
+        if self._trace_queries:
+            with tracer.start_as_current_span("uow.checkout") as span:
+                await self._checkout()
+                span.set_attribute("relrag.replica", self._replica)
+        else:
+            await self._checkout()
+        if self._read_only:
+            try:
+                await self._conn.execute("SET TRANSACTION READ ONLY")
+            except BaseException as e:
+                await self._conn_cm.__aexit__(type(e), e, e.__traceback__)
+                raise
+        self._documents = self._repository(PostgresDocumentRepository, "documents")
+        self._packs = self._repository(PostgresPackRepository, "packs")
+        self._chunks = self._repository(PostgresChunkRepository, "chunks")
+        self._collections = self._repository(PostgresCollectionRepository, "collections")
+        self._configurations = self._repository(PostgresConfigurationRepository, "configurations")
+        self._properties = self._repository(PostgresPropertyRepository, "properties")
+        self._permissions = self._repository(PostgresPermissionRepository, "permissions")
+        self._roles = self._repository(PostgresRoleRepository, "roles")
         return self
 
+    async def _checkout(self) -> None:
+        replica = await self._replicas.checkout() if self._replicas else None
+        self._replica = replica is not None
+        if replica:
+            self._conn_cm, self._conn = replica
+        else:
+            await self._checkout_primary()
+
+    def _repository(self, repository_cls: type, name: str):
+        profile = active_profile()
+        conn = ProfiledConnection(self._conn, profile) if profile else self._conn
+        repository = repository_cls(conn)
+        return TracedRepository(repository, name) if self._trace_queries else repository
+
+    async def _checkout_primary(self) -> None:
+        started = time.perf_counter()
+        self._conn_cm = self._pool.connection()
+        try:
+            self._conn = await self._conn_cm.__aenter__()
+        except (PoolTimeout, TooManyRequests):
+            if self._metrics:
+                self._metrics.observe_timeout()
+            raise
+        if self._metrics:
+            self._metrics.observe_wait(time.perf_counter() - started)
+
     async def __aexit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
         if exc_type and self._conn:
             await self._conn.rollback()
@@ -101,12 +157,22 @@ class PostgresUnitOfWork:
             await self._conn.rollback()
 
 
-def create_uow_factory(pool: AsyncConnectionPool) -> object:
-    """Create UnitOfWork factory (async context manager)."""
+def create_uow_factory(
+    pool: AsyncConnectionPool,
+    metrics: PoolMetrics | None = None,
+    replicas: ReplicaSet | None = None,
+    trace_queries: bool = False,
+    read_only: bool = False,
+) -> object:
+    """Create UnitOfWork factory (async context manager).
+
+    Pass read_only (and replicas, if any) for the search, document and schema reads
+    factory. trace_queries wraps every repository call in a span.
+    """
 
     @asynccontextmanager
     async def factory() -> AsyncIterator[PostgresUnitOfWork]:
-        uow = PostgresUnitOfWork(pool)
+        uow = PostgresUnitOfWork(pool, metrics, replicas, trace_queries, read_only)
         async with uow:
             try:
                 yield uow
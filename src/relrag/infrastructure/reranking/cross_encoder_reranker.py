@@ -0,0 +1,83 @@
+"""Local cross-encoder reranker (sentence-transformers CrossEncoder on CPU)."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from relrag.application.ports import RerankerBusy
+
+
+class CrossEncoderReranker:
+    """Scores (query, passage) pairs with a cross-encoder, off the event loop.
+
+    Requires the optional ``local`` extra. The model is loaded by warmup() (at startup)
+    or on first use. A running prediction cannot be cancelled, so when every worker is
+    busy rerank() raises RerankerBusy instead of queueing behind predictions whose
+    callers may already have given up.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        *,
+        device: str = "cpu",
+        batch_size: int = 32,
+        max_workers: int = 1,
+    ) -> None:
+        self._model_name = model
+        self._device = device
+        self._batch_size = batch_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="relrag-rerank"
+        )
+        self._model: Any = None
+        self._load_lock = threading.Lock()
+        # Released when the thread job finishes, not when an awaiting caller times out
+        self._slots = threading.BoundedSemaphore(max_workers)
+
+    async def rerank(self, query: str, texts: list[str]) -> list[float]:
+        """Relevance score per text (higher is more relevant)."""
+        if not texts:
+            return []
+        if not self._slots.acquire(blocking=False):
+            raise RerankerBusy("All reranker workers are busy")
+        try:
+            future = self._executor.submit(self._predict, query, texts)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+    async def warmup(self) -> None:
+        """Load the model and run one prediction so the first request is not slowed."""
+        await asyncio.wrap_future(self._executor.submit(self._predict, "warmup", ["warmup"]))
+
+    def _predict(self, query: str, texts: list[str]) -> list[float]:
+        """Blocking batched inference (runs in the executor)."""
+        scores = self._get_model().predict(
+            [(query, t) for t in texts],
+            batch_size=self._batch_size,
+            show_progress_bar=False,
+        )
+        return [float(s) for s in scores]
+
+    def _get_model(self) -> Any:
+        """Load the model once, thread-safely."""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    try:
+                        from sentence_transformers import CrossEncoder
+                    except ImportError as e:
+                        raise ImportError(
+                            "Cross-encoder reranking requires sentence-transformers: "
+                            "pip install 'relrag[local]'"
+                        ) from e
+                    self._model = CrossEncoder(self._model_name, device=self._device)
+        return self._model
+
+    def close(self) -> None:
+        """Stop the inference thread pool."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,26 @@
+"""Reranker selection from settings."""
+
+from relrag.application.ports import Reranker
+from relrag.config import Settings
+
+
+def create_reranker(settings: Settings) -> Reranker | None:
+    """Build the reranker named by settings.reranker (None when disabled)."""
+    if settings.reranker == "cross-encoder":
+        from relrag.infrastructure.reranking.cross_encoder_reranker import CrossEncoderReranker
+
+        return CrossEncoderReranker(
+            settings.reranker_model,
+            device=settings.local_embedding_device,
+            batch_size=settings.local_embedding_batch_size,
+        )
+    if settings.reranker == "http":
+        from relrag.infrastructure.reranking.http_reranker import HttpReranker
+
+        return HttpReranker(
+            settings.reranker_url,
+            api_key=settings.reranker_api_key,
+            model=settings.reranker_model,
+            texts_field=settings.reranker_texts_field,
+        )
+    return None
@@ -0,0 +1,46 @@
+"""HTTP reranker - Cohere/Jina/TEI-compatible /rerank API."""
+
+import httpx
+
+
+class HttpReranker:
+    """Calls a rerank endpoint: POST {model, query, texts} -> results[index, score].
+
+    texts_field names the list of texts: "texts" for Hugging Face TEI, "documents" for
+    Cohere/Jina-style APIs.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        api_key: str = "",
+        model: str = "",
+        timeout: float = 5.0,
+        texts_field: str = "texts",
+    ) -> None:
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._client = httpx.AsyncClient(headers=headers, timeout=timeout)
+        self._url = url
+        self._model = model
+        self._texts_field = texts_field
+
+    async def rerank(self, query: str, texts: list[str]) -> list[float]:
+        """Relevance score per text, in input order."""
+        if not texts:
+            return []
+        body: dict[str, object] = {"query": query, self._texts_field: texts}
+        if self._model:
+            body["model"] = self._model
+        response = await self._client.post(self._url, json=body)
+        response.raise_for_status()
+        data = response.json()
+        results = data["results"] if isinstance(data, dict) else data
+        scores = [0.0] * len(texts)
+        for item in results:
+            score = item.get("relevance_score", item.get("score"))
+            scores[int(item["index"])] = float(score)
+        return scores
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._client.aclose()
@@ -3,6 +3,7 @@
 import falcon.asgi
 from falcon.asgi import App
 
+from relrag.interfaces.api.media import install_json_handler
 from relrag.interfaces.api.resources.collections import CollectionResource, CollectionsResource
 from relrag.interfaces.api.resources.configurations import ConfigurationsResource
 from relrag.interfaces.api.resources.documents import DocumentResource, DocumentsResource
@@ -21,6 +22,7 @@ def create_app(
 ) -> App:
     """Create Falcon ASGI app with routes."""
     app = falcon.asgi.App()
+    install_json_handler(app)
     app.add_route("/v1/health", health_resource)
     app.add_route("/v1/health/ready", health_resource, suffix="ready")
     app.add_route("/v1/documents", documents_resource)
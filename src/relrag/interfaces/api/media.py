@@ -0,0 +1,22 @@
+"""JSON media handler backed by orjson."""
+
+import falcon
+import orjson
+from falcon.asgi import App
+from falcon.media import JSONHandler
+
+# UUID, datetime, enum and dataclass values serialize natively; non-str dict keys
+# (e.g. int facet values) are stringified like json.dumps does
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj: object) -> bytes:
+    """Serialize to UTF-8 JSON bytes."""
+    return orjson.dumps(obj, option=_DUMPS_OPTIONS)
+
+
+def install_json_handler(app: App) -> None:
+    """Use orjson for JSON request and response media."""
+    handler = JSONHandler(dumps=dumps, loads=orjson.loads)
+    app.req_options.media_handlers[falcon.MEDIA_JSON] = handler
+    app.resp_options.media_handlers[falcon.MEDIA_JSON] = handler
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 
 import falcon.asgi
 
+from relrag.infrastructure.observability.tracing import tracer
+
 
 @dataclass
 class RequestUser:
@@ -12,6 +14,7 @@ class RequestUser:
     user_id: str
     email: str | None = None
     username: str | None = None
+    roles: tuple[str, ...] = ()
 
 
 class AuthMiddleware:
@@ -20,20 +23,21 @@ class AuthMiddleware:
     def __init__(self, keycloak_provider=None) -> None:
         self._keycloak = keycloak_provider
 
-    async def process_request(
-        self, req: falcon.asgi.Request, resp: falcon.asgi.Response
-    ) -> None:
+    async def process_request(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
         """Extract user from Authorization header."""
         auth = req.get_header("Authorization")
         if auth and auth.startswith("Bearer "):
             token = auth[7:]
             if self._keycloak:
-                user = self._keycloak.decode_token(token)
+                with tracer.start_as_current_span("auth.decode_token") as span:
+                    user = self._keycloak.decode_token(token)
+                    span.set_attribute("relrag.authenticated", user is not None)
                 if user:
                     req.context.user = RequestUser(
                         user_id=user.user_id,
                         email=user.email,
                         username=user.username,
+                        roles=tuple(user.realm_roles),
                     )
                     return
             req.context.user = None
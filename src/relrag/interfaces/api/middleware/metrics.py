@@ -0,0 +1,33 @@
+"""Metrics middleware - request latency histogram per route."""
+
+import time
+
+import falcon.asgi
+
+from relrag.infrastructure.observability.metrics import REQUEST_DURATION
+
+
+class MetricsMiddleware:
+    """Observes relrag_http_request_duration_seconds{method, route, status}."""
+
+    async def process_request(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Remember when the request started."""
+        req.context.metrics_started = time.perf_counter()
+
+    async def process_response(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+        resource: object,
+        req_succeeded: bool,
+    ) -> None:
+        """Record latency labelled by route template (bounded cardinality)."""
+        started = req.context.get("metrics_started")
+        if started is None:
+            return
+        REQUEST_DURATION.observe(
+            time.perf_counter() - started,
+            method=req.method,
+            route=req.uri_template or "unmatched",
+            status=str(resp.status_code),
+        )
@@ -6,19 +6,17 @@ from psycopg_pool import AsyncConnectionPool
 
 
 class PoolLifespanMiddleware:
-    """Middleware that opens the connection pool on startup and closes on shutdown."""
+    """Middleware that opens the connection pools on startup and closes on shutdown."""
 
-    def __init__(self, pool: AsyncConnectionPool) -> None:
-        self._pool = pool
+    def __init__(self, pool: AsyncConnectionPool, *replica_pools: AsyncConnectionPool) -> None:
+        self._pools = (pool, *replica_pools)
 
-    async def process_startup(
-        self, scope: dict[str, Any], event: dict[str, Any]
-    ) -> None:
-        """Open pool when ASGI server starts."""
-        await self._pool.open()
+    async def process_startup(self, scope: dict[str, Any], event: dict[str, Any]) -> None:
+        """Open pools when ASGI server starts."""
+        for pool in self._pools:
+            await pool.open()
 
-    async def process_shutdown(
-        self, scope: dict[str, Any], event: dict[str, Any]
-    ) -> None:
-        """Close pool when ASGI server shuts down."""
-        await self._pool.close()
+    async def process_shutdown(self, scope: dict[str, Any], event: dict[str, Any]) -> None:
+        """Close pools when ASGI server shuts down."""
+        for pool in self._pools:
+            await pool.close()
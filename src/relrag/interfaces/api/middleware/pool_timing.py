@@ -0,0 +1,26 @@
+"""Pool timing middleware - reports per-request connection pool wait."""
+
+import falcon.asgi
+
+from relrag.infrastructure.observability.metrics import (
+    begin_request_pool_wait,
+    request_pool_wait,
+)
+
+
+class PoolTimingMiddleware:
+    """Adds Server-Timing: db-pool;dur=<ms> with the request's total pool checkout wait."""
+
+    async def process_request(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Start accumulating pool wait for this request."""
+        begin_request_pool_wait()
+
+    async def process_response(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+        resource: object,
+        req_succeeded: bool,
+    ) -> None:
+        """Expose the accumulated wait to clients and proxies."""
+        resp.append_header("Server-Timing", f"db-pool;dur={request_pool_wait() * 1000:.1f}")
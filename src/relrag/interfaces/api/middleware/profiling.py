@@ -0,0 +1,100 @@
+"""Profiling middleware - on-demand request profiles and slow request capture."""
+
+import hmac
+import time
+
+import falcon.asgi
+
+from relrag.infrastructure.observability.profiling import (
+    CpuProfiler,
+    ProfileStore,
+    RequestProfile,
+    activate_profile,
+    deactivate_profile,
+)
+
+PROFILE_HEADER = "X-RelRAG-Profile"
+PROFILE_ID_HEADER = "X-RelRAG-Profile-Id"
+DEBUG_TOKEN_HEADER = "X-RelRAG-Debug-Token"
+
+
+def is_debug_admin(req: falcon.asgi.Request, admin_role: str, debug_token: str) -> bool:
+    """True for users with admin_role and requests carrying debug_token (after auth)."""
+    token = req.get_header(DEBUG_TOKEN_HEADER)
+    if debug_token and token and hmac.compare_digest(token, debug_token):
+        return True
+    user = getattr(req.context, "user", None)
+    return admin_role in getattr(user, "roles", ())
+
+
+class ProfilingMiddleware:
+    """Captures request profiles into a ProfileStore.
+
+    Runs after AuthMiddleware. With header_enabled, a request from a user with admin_role
+    or carrying debug_token in X-RelRAG-Debug-Token and sent with X-RelRAG-Profile: 1
+    gets a CPU profile, SQL timings and EXPLAIN (ANALYZE, BUFFERS) of its search
+    statements; the header is ignored for everyone else. With slow_request_ms,
+    SQL timings of every request are collected and kept when it takes longer than that.
+    The response carries X-RelRAG-Profile-Id when a profile was stored.
+    """
+
+    def __init__(
+        self,
+        store: ProfileStore,
+        header_enabled: bool = False,
+        slow_request_ms: float = 0.0,
+        admin_role: str = "relrag-admin",
+        debug_token: str = "",
+    ) -> None:
+        self._store = store
+        self._header_enabled = header_enabled
+        self._slow_request_ms = slow_request_ms
+        self._admin_role = admin_role
+        self._debug_token = debug_token
+
+    async def process_request(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Bind a profile to the request when it is requested or slow capture is on."""
+        requested = (
+            self._header_enabled
+            and (req.get_header(PROFILE_HEADER) or "").lower() in ("1", "true")
+            and is_debug_admin(req, self._admin_role, self._debug_token)
+        )
+        if not requested and self._slow_request_ms <= 0:
+            return
+        profile = RequestProfile(
+            method=req.method,
+            path=req.path,
+            trigger="header" if requested else "slow",
+            explain=requested,
+        )
+        req.context.profile = profile
+        req.context.profile_started = time.perf_counter()
+        req.context.profile_token = activate_profile(profile)
+        if requested:
+            profiler = CpuProfiler()
+            req.context.cpu_profiler = profiler if profiler.start() else None
+
+    async def process_response(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+        resource: object,
+        req_succeeded: bool,
+    ) -> None:
+        """Finish the profile and store it if requested or over the threshold."""
+        profile = req.context.get("profile")
+        if profile is None:
+            return
+        deactivate_profile(req.context.profile_token)
+        profiler = req.context.get("cpu_profiler")
+        if profiler is not None:
+            profile.profile = profiler.stop()
+            profile.profiler = profiler.name
+        profile.duration_ms = round((time.perf_counter() - req.context.profile_started) * 1000, 3)
+        profile.route = req.uri_template
+        user = req.context.get("user")
+        profile.user_id = user.user_id if user else None
+        profile.status = resp.status_code
+        if profile.trigger == "header" or profile.duration_ms >= self._slow_request_ms:
+            self._store.add(profile)
+            resp.set_header(PROFILE_ID_HEADER, profile.id)
@@ -0,0 +1,53 @@
+"""Tracing middleware - one server span per HTTP request."""
+
+import falcon.asgi
+from opentelemetry import context, trace
+from opentelemetry.propagate import extract
+
+from relrag.infrastructure.observability.tracing import tracer
+
+
+class TracingMiddleware:
+    """Starts a span for each request (parent taken from traceparent) and ends it on response."""
+
+    async def process_request(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Open the request span and make it current for the responder."""
+        span = tracer.start_span(
+            f"{req.method} {req.path}",
+            context=extract(req.headers),
+            kind=trace.SpanKind.SERVER,
+            attributes={"http.request.method": req.method, "url.path": req.path},
+        )
+        req.context.trace_span = span
+        req.context.trace_token = context.attach(trace.set_span_in_context(span))
+
+    async def process_resource(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+        resource: object,
+        params: dict,
+    ) -> None:
+        """Name the span after the route template once routing is done."""
+        span = req.context.get("trace_span")
+        if span is not None and req.uri_template:
+            span.update_name(f"{req.method} {req.uri_template}")
+            span.set_attribute("http.route", req.uri_template)
+
+    async def process_response(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+        resource: object,
+        req_succeeded: bool,
+    ) -> None:
+        """Record the status and end the span."""
+        span = req.context.get("trace_span")
+        if span is None:
+            return
+        status = resp.status_code
+        span.set_attribute("http.response.status_code", status)
+        if status >= 500:
+            span.set_status(trace.StatusCode.ERROR)
+        span.end()
+        context.detach(req.context.trace_token)
@@ -0,0 +1,15 @@
+"""Warmup middleware - loads local models on startup, before the first request."""
+
+from typing import Any
+
+
+class WarmupMiddleware:
+    """Awaits warmup() of each component when the ASGI server starts."""
+
+    def __init__(self, *components: Any) -> None:
+        self._components = components
+
+    async def process_startup(self, scope: dict[str, Any], event: dict[str, Any]) -> None:
+        """Warm up components (model load plus one inference each)."""
+        for component in self._components:
+            await component.warmup()
@@ -0,0 +1,97 @@
+"""Batch search API resource."""
+
+from uuid import UUID
+
+import falcon.asgi
+
+from relrag.application.use_cases.search.hybrid_search import (
+    BatchSearchQuery,
+    HybridSearchUseCase,
+)
+from relrag.domain.exceptions import PermissionDenied, ValidationError
+from relrag.interfaces.api.resources.search import LIMIT_ERROR, result_media, search_limit
+
+# Max queries per batch search request
+MAX_BATCH_QUERIES = 100
+
+
+class BatchSearchResource:
+    """POST /v1/collections/{id}/search/batch - many hybrid searches in one request."""
+
+    def __init__(self, hybrid_search: HybridSearchUseCase) -> None:
+        self._hybrid_search = hybrid_search
+
+    async def on_post(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+        collection_id: str,
+    ) -> None:
+        """Execute batch search."""
+        user = getattr(req.context, "user", None)
+        if not user:
+            resp.status = falcon.HTTP_401
+            resp.media = {"error": "Unauthorized"}
+            return
+
+        try:
+            coll_id = UUID(collection_id)
+        except ValueError:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": "Invalid collection ID"}
+            return
+
+        try:
+            body = await req.get_media()
+            raw_queries = body.get("queries")
+        except Exception:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": "Invalid request body"}
+            return
+        if not isinstance(raw_queries, list) or not raw_queries:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": "queries is required"}
+            return
+        if len(raw_queries) > MAX_BATCH_QUERIES:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": f"At most {MAX_BATCH_QUERIES} queries per request"}
+            return
+
+        # Validate every query before any is searched; errors name the offending index
+        queries = []
+        for i, q in enumerate(raw_queries):
+            if not isinstance(q, dict):
+                resp.status = falcon.HTTP_400
+                resp.media = {"error": f"queries[{i}]: must be an object"}
+                return
+            limit = search_limit(q.get("limit", 10))
+            if limit is None:
+                resp.status = falcon.HTTP_400
+                resp.media = {"error": f"queries[{i}]: {LIMIT_ERROR}"}
+                return
+            filters = q.get("filters")
+            queries.append(
+                BatchSearchQuery(
+                    query=q.get("query", ""),
+                    vector_weight=q.get("vector_weight", 0.7),
+                    fts_weight=q.get("fts_weight", 0.3),
+                    limit=limit,
+                    filters=filters if isinstance(filters, dict) else None,
+                )
+            )
+
+        try:
+            batches = await self._hybrid_search.execute_batch(user.user_id, coll_id, queries)
+            resp.media = {
+                "results": [
+                    {"query": q.query, "results": [result_media(r) for r in results]}
+                    for q, results in zip(queries, batches, strict=True)
+                ]
+            }
+            resp.status = falcon.HTTP_200
+        except PermissionDenied:
+            resp.status = falcon.HTTP_403
+            resp.media = {"error": "Permission denied"}
+        except ValidationError as e:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": str(e)}
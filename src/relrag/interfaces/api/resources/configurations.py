@@ -5,15 +5,21 @@ from uuid import uuid4
 import falcon.asgi
 
 from relrag.domain.entities import Configuration
-from relrag.domain.value_objects import ChunkingStrategy
+from relrag.domain.value_objects import ChunkingStrategy, EmbeddingPrecision
+from relrag.infrastructure.persistence.postgres.ann_indexes import HNSW_MAX_HALFVEC_DIMENSIONS
 from relrag.interfaces.api.resources.models import DEFAULT_MODEL_DIMENSIONS
 
 
 class ConfigurationsResource:
-    """GET/POST /v1/configurations - list and create configurations."""
+    """GET/POST /v1/configurations - list and create configurations.
 
-    def __init__(self, unit_of_work_factory: type) -> None:
+    Creating one is limited to admin_role: its ANN indexes are built offline by an
+    administrator (relrag build-indexes), not by the request.
+    """
+
+    def __init__(self, unit_of_work_factory: type, admin_role: str = "admin") -> None:
         self._uow_factory = unit_of_work_factory
+        self._admin_role = admin_role
 
     async def on_get(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
         """List configurations with cursor pagination."""
@@ -37,6 +43,8 @@ class ConfigurationsResource:
                     "embedding_dimensions": c.embedding_dimensions,
                     "chunk_size": c.chunk_size,
                     "chunk_overlap": c.chunk_overlap,
+                    "embedding_precision": c.embedding_precision.value,
+                    "coarse_dimensions": c.coarse_dimensions,
                 }
                 for c in configs
             ],
@@ -45,7 +53,17 @@ class ConfigurationsResource:
         resp.status = falcon.HTTP_200
 
     async def on_post(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
-        """Create configuration for collections."""
+        """Create configuration for collections (admin role only)."""
+        user = getattr(req.context, "user", None)
+        if not user:
+            resp.status = falcon.HTTP_401
+            resp.media = {"error": "Unauthorized"}
+            return
+        if self._admin_role not in getattr(user, "roles", ()):
+            resp.status = falcon.HTTP_403
+            resp.media = {"error": "Permission denied"}
+            return
+
         try:
             body = await req.get_media()
             chunking_strategy = ChunkingStrategy(body.get("chunking_strategy", "recursive"))
@@ -56,9 +74,18 @@ class ConfigurationsResource:
                 if dim_raw is not None
                 else DEFAULT_MODEL_DIMENSIONS.get(embedding_model, 1536)
             )
+            if not 0 < embedding_dimensions <= HNSW_MAX_HALFVEC_DIMENSIONS:
+                raise ValueError(
+                    f"embedding_dimensions must be between 1 and {HNSW_MAX_HALFVEC_DIMENSIONS}"
+                )
             chunk_size = body.get("chunk_size", 512)
             chunk_overlap = body.get("chunk_overlap", 50)
             name = (body.get("name") or "").strip() or None
+            embedding_precision = EmbeddingPrecision(body.get("embedding_precision", "vector"))
+            coarse_raw = body.get("coarse_dimensions")
+            coarse_dimensions = int(coarse_raw) if coarse_raw is not None else None
+            if coarse_dimensions is not None and not 0 < coarse_dimensions < embedding_dimensions:
+                raise ValueError("coarse_dimensions must be between 1 and embedding_dimensions - 1")
         except (KeyError, ValueError) as e:
             resp.status = falcon.HTTP_400
             resp.media = {"error": str(e)}
@@ -72,6 +99,8 @@ class ConfigurationsResource:
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
             name=name,
+            embedding_precision=embedding_precision,
+            coarse_dimensions=coarse_dimensions,
         )
 
         async with self._uow_factory() as uow:
@@ -85,5 +114,7 @@ class ConfigurationsResource:
             "embedding_dimensions": config.embedding_dimensions,
             "chunk_size": config.chunk_size,
             "chunk_overlap": config.chunk_overlap,
+            "embedding_precision": config.embedding_precision.value,
+            "coarse_dimensions": config.coarse_dimensions,
         }
         resp.status = falcon.HTTP_201
@@ -0,0 +1,70 @@
+"""Debug endpoints - captured request profiles."""
+
+import falcon.asgi
+
+from relrag.infrastructure.observability.profiling import ProfileStore, RequestProfile
+from relrag.interfaces.api.middleware.profiling import is_debug_admin
+
+
+class ProfilesResource:
+    """GET /v1/debug/profiles and /v1/debug/profiles/{profile_id}.
+
+    Profiles hold SQL text and plans, so anonymous users get 403 and authenticated users
+    see only their own. Users with admin_role and requests carrying debug_token in
+    X-RelRAG-Debug-Token see every profile.
+    """
+
+    def __init__(
+        self,
+        store: ProfileStore,
+        admin_role: str = "relrag-admin",
+        debug_token: str = "",
+    ) -> None:
+        self._store = store
+        self._admin_role = admin_role
+        self._debug_token = debug_token
+
+    async def on_get(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """GET /v1/debug/profiles - stored profiles, newest first (without reports)."""
+        if not self._authorize(req, resp):
+            return
+        profiles = [p for p in self._store.list() if self._can_read(req, p)]
+        resp.media = {"profiles": [p.summary() for p in profiles]}
+        resp.status = falcon.HTTP_200
+
+    async def on_get_profile(
+        self, req: falcon.asgi.Request, resp: falcon.asgi.Response, profile_id: str
+    ) -> None:
+        """GET /v1/debug/profiles/{profile_id} - SQL timings, plans and CPU profile."""
+        if not self._authorize(req, resp):
+            return
+        profile = self._store.get(profile_id)
+        if profile is None or not self._can_read(req, profile):
+            resp.status = falcon.HTTP_404
+            resp.media = {"error": "Profile not found"}
+            return
+        resp.media = profile.to_dict()
+        resp.status = falcon.HTTP_200
+
+    def _authorize(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> bool:
+        if self._is_admin(req):
+            return True
+        user = getattr(req.context, "user", None)
+        if not user:
+            resp.status = falcon.HTTP_401
+            resp.media = {"error": "Unauthorized"}
+            return False
+        if user.user_id == "anonymous":
+            resp.status = falcon.HTTP_403
+            resp.media = {"error": "Permission denied"}
+            return False
+        return True
+
+    def _can_read(self, req: falcon.asgi.Request, profile: RequestProfile) -> bool:
+        if self._is_admin(req):
+            return True
+        user = getattr(req.context, "user", None)
+        return user is not None and profile.user_id == user.user_id
+
+    def _is_admin(self, req: falcon.asgi.Request) -> bool:
+        return is_debug_admin(req, self._admin_role, self._debug_token)
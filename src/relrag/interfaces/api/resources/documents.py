@@ -1,6 +1,5 @@
 """Document API resources."""
 
-import json
 import re
 from urllib.parse import unquote_to_bytes
 from uuid import UUID
@@ -8,10 +7,12 @@ from uuid import UUID
 import falcon.asgi
 
 from relrag.application.dto.document_dto import DocumentCreateInput, DocumentOutput
+from relrag.application.use_cases.document.delete_document import DeleteDocumentUseCase
 from relrag.application.use_cases.document.get_document import GetDocumentUseCase
 from relrag.application.use_cases.document.load_document import LoadDocumentUseCase
 from relrag.domain.exceptions import NotFound, PermissionDenied, ValidationError
 from relrag.infrastructure.document_parsers import parse_file
+from relrag.interfaces.api.media import dumps
 
 # RFC 5987: filename*=charset''percent-encoded (two single quotes)
 _FILENAME_STAR_RFC5987 = re.compile(r"([\w-]+)''(.+)")
@@ -78,8 +79,7 @@ def _get_part_filename(part: object, fallback_index: int) -> str:
 
 def _sse_event(event: str, data: dict) -> bytes:
     """Format one Server-Sent Event (event + data)."""
-    payload = json.dumps(data, ensure_ascii=False)
-    return f"event: {event}\ndata: {payload}\n\n".encode("utf-8")
+    return b"event: %s\ndata: %s\n\n" % (event.encode("utf-8"), dumps(data))
 
 
 class DocumentsResource:
@@ -332,10 +332,13 @@ class DocumentsStreamResource:
 
 
 class DocumentResource:
-    """GET /v1/documents/{id} - get document (requires collection_id query param)."""
+    """GET/DELETE /v1/documents/{id} - get or delete document (requires collection_id query param)."""
 
-    def __init__(self, get_document: GetDocumentUseCase) -> None:
+    def __init__(
+        self, get_document: GetDocumentUseCase, delete_document: DeleteDocumentUseCase
+    ) -> None:
         self._get_document = get_document
+        self._delete_document = delete_document
 
     async def on_get(
         self,
@@ -375,6 +378,43 @@ class DocumentResource:
             resp.status = falcon.HTTP_403
             resp.media = {"error": "Permission denied"}
 
+    async def on_delete(
+        self,
+        req: falcon.asgi.Request,
+        resp: falcon.asgi.Response,
+        document_id: str,
+    ) -> None:
+        """Soft delete document (requires delete access to every collection sharing it)."""
+        user = getattr(req.context, "user", None)
+        if not user:
+            resp.status = falcon.HTTP_401
+            resp.media = {"error": "Unauthorized"}
+            return
+
+        collection_id_str = req.get_param("collection_id")
+        if not collection_id_str:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": "collection_id query parameter required"}
+            return
+
+        try:
+            doc_id = UUID(document_id)
+            coll_id = UUID(collection_id_str)
+        except ValueError:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": "Invalid UUID"}
+            return
+
+        try:
+            await self._delete_document.execute(user.user_id, doc_id, coll_id)
+            resp.status = falcon.HTTP_204
+        except NotFound:
+            resp.status = falcon.HTTP_404
+            resp.media = {"error": "Document not found"}
+        except PermissionDenied:
+            resp.status = falcon.HTTP_403
+            resp.media = {"error": "Permission denied"}
+
 
 def _document_to_dict(d: DocumentOutput) -> dict:
     return {
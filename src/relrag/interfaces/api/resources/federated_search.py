@@ -0,0 +1,86 @@
+"""Federated search API resource."""
+
+from uuid import UUID
+
+import falcon.asgi
+
+from relrag.application.use_cases.search.federated_search import (
+    FederatedSearchInput,
+    FederatedSearchUseCase,
+)
+from relrag.domain.exceptions import PermissionDenied, ValidationError
+from relrag.interfaces.api.resources.search import LIMIT_ERROR, result_media, search_limit
+
+# Max collections per federated search request
+MAX_FEDERATED_COLLECTIONS = 100
+
+
+class FederatedSearchResource:
+    """POST /v1/search - hybrid search across many collections."""
+
+    def __init__(self, federated_search: FederatedSearchUseCase) -> None:
+        self._federated_search = federated_search
+
+    async def on_post(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """Execute federated search."""
+        user = getattr(req.context, "user", None)
+        if not user:
+            resp.status = falcon.HTTP_401
+            resp.media = {"error": "Unauthorized"}
+            return
+
+        try:
+            body = await req.get_media()
+            query = body.get("query", "")
+            vector_weight = body.get("vector_weight", 0.7)
+            fts_weight = body.get("fts_weight", 0.3)
+            limit = search_limit(body.get("limit", 10))
+            filters = body.get("filters")
+            raw_ids = body.get("collection_ids")
+        except Exception:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": "Invalid request body"}
+            return
+        if limit is None:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": LIMIT_ERROR}
+            return
+
+        if not isinstance(raw_ids, list) or not raw_ids:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": "collection_ids is required"}
+            return
+        if len(raw_ids) > MAX_FEDERATED_COLLECTIONS:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": f"At most {MAX_FEDERATED_COLLECTIONS} collections per request"}
+            return
+        try:
+            collection_ids = [UUID(str(cid)) for cid in raw_ids]
+        except ValueError:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": "Invalid collection ID"}
+            return
+
+        try:
+            output = await self._federated_search.execute(
+                user.user_id,
+                FederatedSearchInput(
+                    collection_ids=collection_ids,
+                    query=query,
+                    vector_weight=vector_weight,
+                    fts_weight=fts_weight,
+                    limit=limit,
+                    filters=filters if isinstance(filters, dict) else None,
+                ),
+            )
+            resp.media = {
+                "results": [result_media(r, r.collection_id) for r in output.results],
+                "skipped_collection_ids": [str(cid) for cid in output.skipped_collection_ids],
+            }
+            resp.status = falcon.HTTP_200
+        except PermissionDenied:
+            resp.status = falcon.HTTP_403
+            resp.media = {"error": "Permission denied"}
+        except ValidationError as e:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": str(e)}
@@ -2,10 +2,20 @@
 
 import falcon.asgi
 
+from relrag.infrastructure.observability.metrics import PoolMetrics
+
 
 class HealthResource:
     """Health and readiness endpoints."""
 
+    def __init__(
+        self,
+        pool_metrics: PoolMetrics | None = None,
+        replica_metrics: list[PoolMetrics] | None = None,
+    ) -> None:
+        self._pool_metrics = pool_metrics
+        self._replica_metrics = replica_metrics or []
+
     async def on_get(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
         """GET /v1/health - liveness."""
         resp.media = {"status": "ok"}
@@ -15,3 +25,18 @@ class HealthResource:
         """GET /v1/health/ready - readiness (DB, Keycloak)."""
         resp.media = {"status": "ready"}
         resp.status = falcon.HTTP_200
+
+    async def on_get_pool(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """GET /v1/health/pool - connection pool occupancy and checkout wait histogram.
+
+        Replica pools, if any, are listed under "replicas" by name.
+        """
+        if self._pool_metrics is None:
+            resp.status = falcon.HTTP_404
+            resp.media = {"error": "Pool metrics are not enabled"}
+            return
+        snapshot = self._pool_metrics.snapshot()
+        if self._replica_metrics:
+            snapshot["replicas"] = {m.name: m.snapshot() for m in self._replica_metrics}
+        resp.media = snapshot
+        resp.status = falcon.HTTP_200
@@ -0,0 +1,25 @@
+"""Resource built on its first request."""
+
+from collections.abc import Callable
+
+import falcon.asgi
+
+
+class LazyResource:
+    """POST-only resource whose factory runs on the first request.
+
+    Keeps the modules of rarely used endpoints (batch and federated search) out of
+    startup; the factory imports them and returns the real resource.
+    """
+
+    def __init__(self, factory: Callable[[], object]) -> None:
+        self._factory = factory
+        self._resource: object | None = None
+
+    async def on_post(
+        self, req: falcon.asgi.Request, resp: falcon.asgi.Response, **params: str
+    ) -> None:
+        """Delegate to the real resource, building it first if needed."""
+        if self._resource is None:
+            self._resource = self._factory()
+        await self._resource.on_post(req, resp, **params)
@@ -0,0 +1,18 @@
+"""Metrics endpoint - Prometheus text exposition."""
+
+import falcon.asgi
+
+from relrag.infrastructure.observability.metrics import MetricsRegistry
+
+
+class MetricsResource:
+    """GET /v1/metrics for Prometheus scraping."""
+
+    def __init__(self, registry: MetricsRegistry) -> None:
+        self._registry = registry
+
+    async def on_get(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        """GET /v1/metrics - all process metrics."""
+        resp.content_type = "text/plain; version=0.0.4; charset=utf-8"
+        resp.text = self._registry.render()
+        resp.status = falcon.HTTP_200
@@ -5,7 +5,7 @@ from uuid import UUID
 import falcon.asgi
 
 from relrag.application.use_cases.collection.migrate_collection import MigrateCollectionUseCase
-from relrag.domain.exceptions import NotFound, PermissionDenied
+from relrag.domain.exceptions import NotFound, PermissionDenied, ValidationError
 
 
 class MigrateResource:
@@ -52,3 +52,6 @@ class MigrateResource:
         except NotFound as e:
             resp.status = falcon.HTTP_404
             resp.media = {"error": str(e)}
+        except ValidationError as e:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": str(e)}
@@ -32,7 +32,7 @@ class PropertySchemaResource:
         resp: falcon.asgi.Response,
         collection_id: str,
     ) -> None:
-        """Return property keys, types and distinct values for the collection."""
+        """Return property keys, types, distinct values and document counts for the collection."""
         user = getattr(req.context, "user", None)
         if not user:
             resp.status = falcon.HTTP_401
@@ -60,6 +60,8 @@ class PropertySchemaResource:
                     "label": PROPERTY_KEY_LABELS.get(item.key, item.key),
                     "type": item.property_type.value,
                     "values": item.values,
+                    "counts": item.counts,
+                    "document_count": item.document_count,
                 }
                 for item in schema
             ],
@@ -1,4 +1,4 @@
-"""Search API resource."""
+"""Search API resource and helpers shared by the batch and federated search resources."""
 
 from uuid import UUID
 
@@ -6,9 +6,55 @@ import falcon.asgi
 
 from relrag.application.use_cases.search.hybrid_search import (
     HybridSearchInput,
+    HybridSearchResult,
     HybridSearchUseCase,
 )
-from relrag.domain.exceptions import PermissionDenied
+from relrag.domain.exceptions import PermissionDenied, ValidationError
+
+# Max property keys counted per search request
+MAX_FACET_KEYS = 20
+# Max chunks returned per document in group_by=document mode
+MAX_CHUNKS_PER_DOCUMENT = 20
+# Max results (or documents) per search
+MAX_SEARCH_LIMIT = 100
+LIMIT_ERROR = f"limit must be an integer between 1 and {MAX_SEARCH_LIMIT}"
+
+
+def search_limit(raw: object) -> int | None:
+    """Return raw as a result limit in 1..MAX_SEARCH_LIMIT, or None if it is not one."""
+    try:
+        limit = int(raw)
+    except (TypeError, ValueError):
+        return None
+    return limit if 1 <= limit <= MAX_SEARCH_LIMIT else None
+
+
+def _facet_keys(raw: object) -> list[str] | None:
+    """Return requested facet keys (list of non-empty strings) or None."""
+    if not isinstance(raw, list):
+        return None
+    keys = [k for k in raw if isinstance(k, str) and k]
+    return keys[:MAX_FACET_KEYS] or None
+
+
+def result_media(r: HybridSearchResult, collection_id: UUID | None = None) -> dict:
+    """Serialize one chunk result (UUIDs are left to the JSON handler)."""
+    out = {
+        "chunk_id": r.chunk_id,
+        "pack_id": r.pack_id,
+        "document_id": r.document_id,
+        "content": r.content,
+        "vector_score": round(r.vector_score, 6),
+        "fts_score": round(r.fts_score, 6),
+        "score": round(r.score, 6),
+        "document_title": r.document_title,
+        "metadata": r.metadata,
+    }
+    if r.rerank_score is not None:
+        out["rerank_score"] = round(r.rerank_score, 6)
+    if collection_id is not None:
+        out["collection_id"] = collection_id
+    return out
 
 
 class SearchResource:
@@ -35,12 +81,23 @@ class SearchResource:
             query = body.get("query", "")
             vector_weight = body.get("vector_weight", 0.7)
             fts_weight = body.get("fts_weight", 0.3)
-            limit = body.get("limit", 10)
+            limit = search_limit(body.get("limit", 10))
             filters = body.get("filters")
+            facet_keys = _facet_keys(body.get("facets"))
+            cursor = body.get("cursor")
+            group_by = body.get("group_by")
+            chunks_per_document = min(
+                int(body.get("chunks_per_document", 3)), MAX_CHUNKS_PER_DOCUMENT
+            )
+            rerank = bool(body.get("rerank", False))
         except Exception:
             resp.status = falcon.HTTP_400
             resp.media = {"error": "Invalid request body"}
             return
+        if limit is None:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": LIMIT_ERROR}
+            return
 
         try:
             coll_id = UUID(collection_id)
@@ -50,7 +107,7 @@ class SearchResource:
             return
 
         try:
-            results = await self._hybrid_search.execute(
+            output = await self._hybrid_search.execute(
                 user.user_id,
                 HybridSearchInput(
                     collection_id=coll_id,
@@ -59,25 +116,40 @@ class SearchResource:
                     fts_weight=fts_weight,
                     limit=limit,
                     filters=filters if isinstance(filters, dict) else None,
+                    facets=facet_keys,
+                    cursor=cursor if isinstance(cursor, str) and cursor else None,
+                    group_by=group_by if isinstance(group_by, str) and group_by else None,
+                    chunks_per_document=chunks_per_document,
+                    rerank=rerank,
                 ),
             )
-            resp.media = {
-                "results": [
-                    {
-                        "chunk_id": str(r.chunk_id),
-                        "pack_id": str(r.pack_id),
-                        "document_id": str(r.document_id),
-                        "content": r.content,
-                        "vector_score": round(r.vector_score, 6),
-                        "fts_score": round(r.fts_score, 6),
-                        "score": round(r.score, 6),
-                        "document_title": r.document_title,
-                        "metadata": r.metadata,
-                    }
-                    for r in results
-                ],
-            }
+            if output.documents is not None:
+                resp.media = {
+                    "documents": [
+                        {
+                            "document_id": d.document_id,
+                            "score": round(d.score, 6),
+                            "document_title": d.document_title,
+                            "metadata": d.metadata,
+                            "chunks": [result_media(c) for c in d.chunks],
+                        }
+                        for d in output.documents
+                    ],
+                    "next_cursor": output.next_cursor,
+                }
+            else:
+                resp.media = {
+                    "results": [result_media(r) for r in output.results],
+                    "next_cursor": output.next_cursor,
+                }
+            if facet_keys:
+                resp.media["facets"] = output.facets
+            if rerank:
+                resp.media["reranked"] = output.reranked
             resp.status = falcon.HTTP_200
         except PermissionDenied:
             resp.status = falcon.HTTP_403
             resp.media = {"error": "Permission denied"}
+        except ValidationError as e:
+            resp.status = falcon.HTTP_400
+            resp.media = {"error": str(e)}
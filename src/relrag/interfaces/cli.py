@@ -0,0 +1,139 @@
+"""Command line interface: relrag serve, relrag build-indexes."""
+
+import argparse
+import logging
+import os
+
+from relrag import __version__
+from relrag.config import Settings, get_settings
+
+# Each worker imports this and builds its own app (connection pools are not shared across forks)
+APP_FACTORY = "relrag.main:create_relrag_app"
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (affinity/cpuset aware where the OS reports it)."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def uvicorn_options(args: argparse.Namespace, settings: Settings) -> dict:
+    """Keyword arguments for uvicorn.run from CLI flags, falling back to settings."""
+    workers = args.workers if args.workers is not None else settings.server_workers
+    if workers <= 0:
+        workers = available_cpus()
+    options = {
+        "factory": True,
+        "host": args.host or settings.server_host,
+        "port": args.port or settings.server_port,
+        "workers": 1 if args.reload else workers,
+        "loop": args.loop or settings.server_loop,
+        "http": args.http or settings.server_http,
+        "timeout_graceful_shutdown": settings.server_graceful_shutdown_seconds,
+        "timeout_keep_alive": settings.server_keepalive_seconds,
+        "backlog": settings.server_backlog,
+        "proxy_headers": True,
+        "forwarded_allow_ips": settings.server_forwarded_allow_ips,
+        "log_level": settings.log_level.lower(),
+        "access_log": settings.server_access_log,
+        "reload": args.reload,
+    }
+    if settings.server_limit_concurrency > 0:
+        options["limit_concurrency"] = settings.server_limit_concurrency
+    return options
+
+
+def per_worker_warnings(workers: int, settings: Settings) -> list[str]:
+    """State that is kept per process and so is split between several workers."""
+    if workers <= 1:
+        return []
+    warnings = [
+        f"/v1/metrics reports one of {workers} workers per scrape: counters and histograms "
+        "are per process, scrape each worker separately or run one worker per container"
+    ]
+    if settings.profiling_enabled or settings.profiling_slow_request_ms > 0:
+        warnings.append(
+            f"profiles are stored per worker: with {workers} workers /v1/debug/profiles "
+            "lists one worker's profiles and a profile id may return 404, profile with --workers 1"
+        )
+    return warnings
+
+
+def serve(args: argparse.Namespace) -> None:
+    """Run the API under uvicorn (multi-process when workers > 1)."""
+    import uvicorn
+
+    settings = get_settings()
+    options = uvicorn_options(args, settings)
+    for warning in per_worker_warnings(options["workers"], settings):
+        logger.warning(warning)
+    uvicorn.run(APP_FACTORY, **options)
+
+
+def build_indexes(args: argparse.Namespace) -> None:
+    """Build the ANN indexes of every configuration without blocking writes."""
+    import asyncio
+
+    from psycopg import AsyncConnection
+
+    from relrag.infrastructure.persistence.postgres.ann_indexes import build_ann_indexes
+
+    async def run() -> list[str]:
+        url = args.database_url or get_settings().database_url
+        async with await AsyncConnection.connect(url, autocommit=True) as conn:
+            return await build_ann_indexes(conn, concurrently=True)
+
+    for statement in asyncio.run(run()):
+        print(statement)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="relrag", description="RelRAG API server")
+    parser.add_argument("--version", action="version", version=f"RelRAG v{__version__}")
+    commands = parser.add_subparsers(dest="command")
+
+    serve_parser = commands.add_parser("serve", help="Run the HTTP API")
+    serve_parser.add_argument("--host", default=None, help="Bind address (SERVER_HOST)")
+    serve_parser.add_argument("--port", type=int, default=None, help="Bind port (SERVER_PORT)")
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes, 0 = one per available CPU (SERVER_WORKERS)",
+    )
+    serve_parser.add_argument(
+        "--loop",
+        choices=["auto", "asyncio", "uvloop"],
+        default=None,
+        help="Event loop (SERVER_LOOP)",
+    )
+    serve_parser.add_argument(
+        "--http",
+        choices=["auto", "h11", "httptools"],
+        default=None,
+        help="HTTP parser (SERVER_HTTP)",
+    )
+    serve_parser.add_argument(
+        "--reload", action="store_true", help="Reload on code changes (one worker)"
+    )
+    serve_parser.set_defaults(handler=serve)
+
+    indexes_parser = commands.add_parser(
+        "build-indexes",
+        help="Create missing ANN indexes for all configurations (CREATE INDEX CONCURRENTLY)",
+    )
+    indexes_parser.add_argument("--database-url", default=None, help="DATABASE_URL override")
+    indexes_parser.set_defaults(handler=build_indexes)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI entry point."""
+    args = build_parser().parse_args(argv)
+    if args.command is None:
+        print(f"RelRAG v{__version__}")
+        return
+    args.handler(args)
@@ -3,10 +3,11 @@
 import sys
 
 import falcon.asgi
+from psycopg_pool import PoolTimeout, TooManyRequests
 
-from relrag import __version__
 from relrag.application.use_cases.collection.create_collection import CreateCollectionUseCase
 from relrag.application.use_cases.collection.migrate_collection import MigrateCollectionUseCase
+from relrag.application.use_cases.document.delete_document import DeleteDocumentUseCase
 from relrag.application.use_cases.document.get_document import GetDocumentUseCase
 from relrag.application.use_cases.document.load_document import LoadDocumentUseCase
 from relrag.application.use_cases.permission.assign_permission import AssignPermissionUseCase
@@ -14,16 +15,34 @@ from relrag.application.use_cases.permission.revoke_permission import RevokePerm
 from relrag.application.use_cases.search.hybrid_search import HybridSearchUseCase
 from relrag.config import get_settings
 from relrag.infrastructure.auth.keycloak_provider import KeycloakProvider
+from relrag.infrastructure.cache.memory_cache import InMemorySearchCache
 from relrag.infrastructure.chunking.recursive_chunker import RecursiveChunker
-from relrag.infrastructure.embedding.openai_provider import OpenAIEmbeddingProvider
+from relrag.infrastructure.embedding.factory import create_embedding_provider
+from relrag.infrastructure.observability.metrics import (
+    REGISTRY,
+    SEARCH_CURSOR_CACHE_REQUESTS,
+    MeteredChunker,
+    MeteredEmbeddingProvider,
+    PoolMetrics,
+    collect_pools,
+)
+from relrag.infrastructure.observability.tracing import (
+    TracedChunker,
+    TracedEmbeddingProvider,
+    configure_tracing,
+)
 from relrag.infrastructure.permission.permission_checker import RelRAGPermissionChecker
 from relrag.infrastructure.persistence.postgres.connection import create_pool
+from relrag.infrastructure.persistence.postgres.replicas import ReplicaSet
 from relrag.infrastructure.persistence.postgres.unit_of_work import (
     create_uow_factory,
 )
+from relrag.interfaces.api.media import install_json_handler
 from relrag.interfaces.api.middleware.auth import AuthMiddleware
 from relrag.interfaces.api.middleware.cors import CORSMiddleware
+from relrag.interfaces.api.middleware.metrics import MetricsMiddleware
 from relrag.interfaces.api.middleware.pool_lifespan import PoolLifespanMiddleware
+from relrag.interfaces.api.middleware.pool_timing import PoolTimingMiddleware
 from relrag.interfaces.api.resources.collections import CollectionResource, CollectionsResource
 from relrag.interfaces.api.resources.configurations import ConfigurationsResource
 from relrag.interfaces.api.resources.models import ModelsResource
@@ -33,25 +52,74 @@ from relrag.interfaces.api.resources.documents import (
     DocumentsStreamResource,
 )
 from relrag.interfaces.api.resources.health import HealthResource
+from relrag.interfaces.api.resources.metrics import MetricsResource
 from relrag.interfaces.api.resources.migrate import MigrateResource
 from relrag.interfaces.api.resources.permissions import (
     PermissionRevokeResource,
     PermissionsResource,
 )
 from relrag.interfaces.api.resources.property_schema import PropertySchemaResource
+from relrag.interfaces.api.resources.lazy import LazyResource
 from relrag.interfaces.api.resources.search import SearchResource
 
 
 def main() -> None:
-    """CLI entry point."""
-    print(f"RelRAG v{__version__}")
+    """CLI entry point (relrag serve, relrag --version)."""
+    from relrag.interfaces.cli import main as cli_main
+
+    cli_main()
 
 
 def create_relrag_app():
     """Composition root - build Falcon app with all dependencies."""
     settings = get_settings()
-    pool = create_pool(settings.database_url)
-    uow_factory = create_uow_factory(pool)
+    # Before the pools exist, so that psycopg instrumentation sees every connection
+    tracing = (
+        configure_tracing(
+            settings.tracing_exporter,
+            service_name=settings.tracing_service_name,
+            otlp_endpoint=settings.tracing_otlp_endpoint,
+            sample_ratio=settings.tracing_sample_ratio,
+        )
+        is not None
+    )
+    pool_options = {
+        "min_size": settings.database_pool_min_size,
+        "max_size": settings.database_pool_max_size,
+        "timeout": settings.database_pool_timeout,
+        "max_waiting": settings.database_pool_max_waiting,
+        "max_idle": settings.database_pool_max_idle,
+        "max_lifetime": settings.database_pool_max_lifetime,
+        "prepare_threshold": (
+            settings.database_prepare_threshold if settings.database_prepared_statements else None
+        ),
+        "prepared_max": settings.database_prepared_max,
+    }
+    pool = create_pool(settings.database_url, **pool_options)
+    replica_pools = [
+        create_pool(url.strip(), **pool_options)
+        for url in settings.database_replica_urls.split(",")
+        if url.strip()
+    ]
+    pool_metrics = PoolMetrics(pool)
+    replica_metrics = [PoolMetrics(p, name=f"replica{i}") for i, p in enumerate(replica_pools)]
+    REGISTRY.add_collector(lambda: collect_pools([pool_metrics, *replica_metrics]))
+    uow_factory = create_uow_factory(pool, pool_metrics, trace_queries=tracing)
+    # Read-only requests go to replicas when configured (lag-checked, primary fallback)
+    # in READ ONLY transactions
+    read_uow_factory = create_uow_factory(
+        pool,
+        pool_metrics,
+        ReplicaSet(
+            replica_pools,
+            max_lag_seconds=settings.database_replica_max_lag_seconds,
+            metrics=replica_metrics,
+        )
+        if replica_pools
+        else None,
+        trace_queries=tracing,
+        read_only=True,
+    )
 
     keycloak = (
         KeycloakProvider(
@@ -65,12 +133,13 @@ def create_relrag_app():
     )
 
     permission_checker = RelRAGPermissionChecker(uow_factory)
-    embedding_provider = OpenAIEmbeddingProvider(
-        base_url=settings.embedding_api_url,
-        api_key=settings.embedding_api_key,
-        model=settings.embedding_model,
-    )
+    embedding_provider = create_embedding_provider(settings)
     chunker = RecursiveChunker()
+    embedding_provider = MeteredEmbeddingProvider(embedding_provider)
+    chunker = MeteredChunker(chunker)
+    if tracing:
+        embedding_provider = TracedEmbeddingProvider(embedding_provider)
+        chunker = TracedChunker(chunker)
 
     load_document = LoadDocumentUseCase(
         unit_of_work_factory=uow_factory,
@@ -79,6 +148,10 @@ def create_relrag_app():
         embedding_provider=embedding_provider,
     )
     get_document = GetDocumentUseCase(
+        unit_of_work_factory=read_uow_factory,
+        permission_checker=permission_checker,
+    )
+    delete_document = DeleteDocumentUseCase(
         unit_of_work_factory=uow_factory,
         permission_checker=permission_checker,
     )
@@ -99,49 +172,133 @@ def create_relrag_app():
         unit_of_work_factory=uow_factory,
         permission_checker=permission_checker,
     )
+    reranker = None
+    if settings.reranker != "none":
+        from relrag.infrastructure.reranking.factory import create_reranker
+
+        reranker = create_reranker(settings)
     hybrid_search = HybridSearchUseCase(
-        unit_of_work_factory=uow_factory,
+        unit_of_work_factory=read_uow_factory,
         permission_checker=permission_checker,
         embedding_provider=embedding_provider,
+        reranker=reranker,
+        rerank_top_k=settings.rerank_top_k,
+        rerank_timeout=settings.rerank_timeout_ms / 1000,
+        search_cache=(
+            InMemorySearchCache(settings.search_cache_size, settings.search_cache_ttl_seconds)
+            if settings.search_cache_size > 0
+            else None
+        ),
+        cursor_cache=(
+            InMemorySearchCache(
+                settings.search_cursor_cache_size,
+                settings.search_cursor_ttl_seconds,
+                requests=SEARCH_CURSOR_CACHE_REQUESTS,
+            )
+            if settings.search_cursor_cache_size > 0
+            else None
+        ),
     )
 
+    # Batch and federated search modules load on their first request
+    def batch_search_resource() -> object:
+        from relrag.interfaces.api.resources.batch_search import BatchSearchResource
+
+        return BatchSearchResource(hybrid_search)
+
+    def federated_search_resource() -> object:
+        from relrag.application.use_cases.search.federated_search import FederatedSearchUseCase
+        from relrag.interfaces.api.resources.federated_search import FederatedSearchResource
+
+        return FederatedSearchResource(
+            FederatedSearchUseCase(
+                unit_of_work_factory=read_uow_factory,
+                permission_checker=permission_checker,
+                embedding_provider=embedding_provider,
+            )
+        )
+
     documents_resource = DocumentsResource(load_document)
     documents_stream_resource = DocumentsStreamResource(load_document)
-    document_resource = DocumentResource(get_document)
-    collections_resource = CollectionsResource(create_collection, uow_factory)
-    collection_resource = CollectionResource(uow_factory, permission_checker)
+    document_resource = DocumentResource(get_document, delete_document)
+    collections_resource = CollectionsResource(create_collection, read_uow_factory)
+    collection_resource = CollectionResource(read_uow_factory, permission_checker)
     migrate_resource = MigrateResource(migrate_collection)
-    permissions_resource = PermissionsResource(
-        uow_factory, permission_checker, assign_permission
-    )
+    permissions_resource = PermissionsResource(uow_factory, permission_checker, assign_permission)
     permission_revoke_resource = PermissionRevokeResource(revoke_permission)
-    configurations_resource = ConfigurationsResource(uow_factory)
+    configurations_resource = ConfigurationsResource(
+        uow_factory, admin_role=settings.keycloak_admin_role
+    )
     models_resource = ModelsResource()
     search_resource = SearchResource(hybrid_search)
-    property_schema_resource = PropertySchemaResource(uow_factory, permission_checker)
-    health_resource = HealthResource()
+    property_schema_resource = PropertySchemaResource(read_uow_factory, permission_checker)
+    health_resource = HealthResource(pool_metrics, replica_metrics)
+    metrics_resource = MetricsResource(REGISTRY)
+    cors_origins = [o.strip() for o in settings.cors_origins.split(",") if o.strip()]
+    middleware: list[object] = []
+    if tracing:
+        from relrag.interfaces.api.middleware.tracing import TracingMiddleware
 
-    cors_origins = [
-        o.strip() for o in settings.cors_origins.split(",") if o.strip()
+        middleware.append(TracingMiddleware())
+    middleware += [
+        MetricsMiddleware(),
+        CORSMiddleware(cors_origins),
+        PoolLifespanMiddleware(pool, *replica_pools),
     ]
-    app = falcon.asgi.App(
-        middleware=[
-            CORSMiddleware(cors_origins),
-            PoolLifespanMiddleware(pool),
-            AuthMiddleware(keycloak),
-        ],
-    )
+    # Local models load before serving, so the first requests do not miss the rerank budget
+    warmup = [c for c in (reranker,) if hasattr(c, "warmup")]
+    if warmup:
+        from relrag.interfaces.api.middleware.warmup import WarmupMiddleware
+
+        middleware.append(WarmupMiddleware(*warmup))
+    middleware += [PoolTimingMiddleware(), AuthMiddleware(keycloak)]
+    profiling = settings.profiling_enabled or settings.profiling_slow_request_ms > 0
+    if profiling:
+        from relrag.infrastructure.observability.profiling import ProfileStore
+        from relrag.interfaces.api.middleware.profiling import ProfilingMiddleware
+        from relrag.interfaces.api.resources.debug import ProfilesResource
+
+        profile_store = ProfileStore(settings.profiling_store_size)
+        # After auth: the profile header is honoured only for admins and the debug token
+        middleware.append(
+            ProfilingMiddleware(
+                profile_store,
+                header_enabled=settings.profiling_enabled,
+                slow_request_ms=settings.profiling_slow_request_ms,
+                admin_role=settings.profiling_admin_role,
+                debug_token=settings.profiling_debug_token,
+            )
+        )
+    app = falcon.asgi.App(middleware=middleware)
+    install_json_handler(app)
 
     async def log_exception(req, resp, ex, params):
         import traceback
+
         traceback.print_exception(type(ex), ex, ex.__traceback__, file=sys.stderr)
         resp.status = falcon.HTTP_500
         resp.media = {"title": "500 Internal Server Error"}
 
+    async def pool_exhausted(req, resp, ex, params):
+        resp.status = falcon.HTTP_503
+        resp.set_header("Retry-After", "1")
+        resp.media = {"error": "Database connection pool exhausted, retry later"}
+
     app.add_error_handler(Exception, log_exception)
+    app.add_error_handler((PoolTimeout, TooManyRequests), pool_exhausted)
     app.add_route("/v1/health", health_resource)
     app.add_route("/v1/health/ready", health_resource, suffix="ready")
+    app.add_route("/v1/health/pool", health_resource, suffix="pool")
+    app.add_route("/v1/metrics", metrics_resource)
     app.add_route("/v1/models", models_resource)
+    if profiling:
+        profiles_resource = ProfilesResource(
+            profile_store,
+            admin_role=settings.profiling_admin_role,
+            debug_token=settings.profiling_debug_token,
+        )
+        app.add_route("/v1/debug/profiles", profiles_resource)
+        app.add_route("/v1/debug/profiles/{profile_id}", profiles_resource, suffix="profile")
     app.add_route("/v1/documents/stream", documents_stream_resource)
     app.add_route("/v1/documents", documents_resource)
     app.add_route("/v1/documents/{document_id}", document_resource)
@@ -155,6 +312,10 @@ def create_relrag_app():
     )
     app.add_route("/v1/configurations", configurations_resource)
     app.add_route("/v1/collections/{collection_id}/search", search_resource)
+    app.add_route(
+        "/v1/collections/{collection_id}/search/batch", LazyResource(batch_search_resource)
+    )
+    app.add_route("/v1/search", LazyResource(federated_search_resource))
     app.add_route(
         "/v1/collections/{collection_id}/property-schema",
         property_schema_resource,
@@ -163,9 +324,8 @@ def create_relrag_app():
     return app
 
 
-async def run_server() -> None:
-    """Run uvicorn server."""
-    import uvicorn
+def run_server() -> None:
+    """Run the API with server settings from the environment (same as relrag serve)."""
+    from relrag.interfaces.cli import main as cli_main
 
-    app = create_relrag_app()
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    cli_main(["serve"])
@@ -9,10 +9,12 @@ import pytest
 
 from relrag.application.use_cases.collection.create_collection import CreateCollectionUseCase
 from relrag.application.use_cases.collection.migrate_collection import MigrateCollectionUseCase
+from relrag.application.use_cases.document.delete_document import DeleteDocumentUseCase
 from relrag.application.use_cases.document.get_document import GetDocumentUseCase
 from relrag.application.use_cases.document.load_document import LoadDocumentUseCase
 from relrag.application.use_cases.permission.assign_permission import AssignPermissionUseCase
 from relrag.application.use_cases.permission.revoke_permission import RevokePermissionUseCase
+from relrag.application.use_cases.search.federated_search import FederatedSearchUseCase
 from relrag.application.use_cases.search.hybrid_search import HybridSearchUseCase
 from relrag.domain.entities import Configuration, Role
 from relrag.domain.value_objects import ChunkingStrategy
@@ -22,10 +24,13 @@ from tests.conftest import FakeUnitOfWork, mock_embedding_provider, mock_permiss
 
 # Test user with admin privileges (used by AuthBypassMiddleware in API tests)
 TEST_ADMIN_USER_ID = "test-user-1"
+# Debug token accepted by the profiles resource in API tests
+TEST_DEBUG_TOKEN = "test-debug-token"
 
 
 class _TestUser:
     user_id = TEST_ADMIN_USER_ID
+    roles = ("admin",)
 
 
 class AuthBypassMiddleware:
@@ -78,37 +83,76 @@ def app(uow_factory, mock_permission_checker, mock_embedding_provider):
         unit_of_work_factory=uow_factory,
         permission_checker=mock_permission_checker,
     )
+    delete_document = DeleteDocumentUseCase(
+        unit_of_work_factory=uow_factory,
+        permission_checker=mock_permission_checker,
+    )
     hybrid_search = HybridSearchUseCase(
         unit_of_work_factory=uow_factory,
         permission_checker=mock_permission_checker,
         embedding_provider=mock_embedding_provider,
     )
+    federated_search = FederatedSearchUseCase(
+        unit_of_work_factory=uow_factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+    )
 
+    from relrag.infrastructure.observability.metrics import REGISTRY
+    from relrag.infrastructure.observability.profiling import ProfileStore
+    from relrag.interfaces.api.media import install_json_handler
+    from relrag.interfaces.api.middleware.metrics import MetricsMiddleware
+    from relrag.interfaces.api.middleware.profiling import ProfilingMiddleware
     from relrag.interfaces.api.resources.collections import (
         CollectionResource,
         CollectionsResource,
     )
     from relrag.interfaces.api.resources.configurations import ConfigurationsResource
+    from relrag.interfaces.api.resources.debug import ProfilesResource
     from relrag.interfaces.api.resources.documents import (
-    DocumentResource,
-    DocumentsResource,
-    DocumentsStreamResource,
-)
+        DocumentResource,
+        DocumentsResource,
+        DocumentsStreamResource,
+    )
     from relrag.interfaces.api.resources.health import HealthResource
+    from relrag.interfaces.api.resources.metrics import MetricsResource
     from relrag.interfaces.api.resources.migrate import MigrateResource
     from relrag.interfaces.api.resources.models import ModelsResource
     from relrag.interfaces.api.resources.permissions import (
         PermissionRevokeResource,
         PermissionsResource,
     )
+    from relrag.interfaces.api.resources.property_schema import PropertySchemaResource
+    from relrag.interfaces.api.resources.batch_search import BatchSearchResource
+    from relrag.interfaces.api.resources.federated_search import FederatedSearchResource
+    from relrag.interfaces.api.resources.lazy import LazyResource
     from relrag.interfaces.api.resources.search import SearchResource
 
-    app = falcon.asgi.App(middleware=[AuthBypassMiddleware()])
+    profile_store = ProfileStore()
+    app = falcon.asgi.App(
+        middleware=[
+            MetricsMiddleware(),
+            AuthBypassMiddleware(),
+            ProfilingMiddleware(
+                profile_store,
+                header_enabled=True,
+                admin_role="admin",
+                debug_token=TEST_DEBUG_TOKEN,
+            ),
+        ]
+    )
+    install_json_handler(app)
     app.add_route("/v1/health", HealthResource())
+    app.add_route("/v1/metrics", MetricsResource(REGISTRY))
+    profiles_resource = ProfilesResource(profile_store, debug_token=TEST_DEBUG_TOKEN)
+    app.add_route("/v1/debug/profiles", profiles_resource)
+    app.add_route("/v1/debug/profiles/{profile_id}", profiles_resource, suffix="profile")
     app.add_route("/v1/configurations", ConfigurationsResource(uow_factory))
     app.add_route("/v1/models", ModelsResource())
     app.add_route("/v1/collections", CollectionsResource(create_collection, uow_factory))
-    app.add_route("/v1/collections/{collection_id}", CollectionResource(uow_factory, mock_permission_checker))
+    app.add_route(
+        "/v1/collections/{collection_id}", CollectionResource(uow_factory, mock_permission_checker)
+    )
     app.add_route("/v1/collections/{collection_id}/migrate", MigrateResource(migrate_collection))
     app.add_route(
         "/v1/collections/{collection_id}/permissions",
@@ -120,8 +164,17 @@ def app(uow_factory, mock_permission_checker, mock_embedding_provider):
     )
     app.add_route("/v1/documents/stream", DocumentsStreamResource(load_document))
     app.add_route("/v1/documents", DocumentsResource(load_document))
-    app.add_route("/v1/documents/{document_id}", DocumentResource(get_document))
+    app.add_route("/v1/documents/{document_id}", DocumentResource(get_document, delete_document))
     app.add_route("/v1/collections/{collection_id}/search", SearchResource(hybrid_search))
+    app.add_route(
+        "/v1/collections/{collection_id}/search/batch",
+        LazyResource(lambda: BatchSearchResource(hybrid_search)),
+    )
+    app.add_route("/v1/search", FederatedSearchResource(federated_search))
+    app.add_route(
+        "/v1/collections/{collection_id}/property-schema",
+        PropertySchemaResource(uow_factory, mock_permission_checker),
+    )
     return app
 
 
@@ -129,4 +182,5 @@ def app(uow_factory, mock_permission_checker, mock_embedding_provider):
 def client(app):
     """Falcon ASGI test client."""
     from falcon.testing import TestClient
+
     return TestClient(app)
@@ -32,7 +32,26 @@ class TestDecodeFilename:
 
     def test_decode_filename_mojibake_utf8_as_latin1(self) -> None:
         # UTF-8 bytes for "Документ" were decoded as Latin-1
-        mojibake = bytes([0xD0, 0x94, 0xD0, 0xBE, 0xD0, 0xBA, 0xD1, 0x83, 0xD0, 0xBC, 0xD0, 0xB5, 0xD0, 0xBD, 0xD1, 0x82]).decode("latin-1")
+        mojibake = bytes(
+            [
+                0xD0,
+                0x94,
+                0xD0,
+                0xBE,
+                0xD0,
+                0xBA,
+                0xD1,
+                0x83,
+                0xD0,
+                0xBC,
+                0xD0,
+                0xB5,
+                0xD0,
+                0xBD,
+                0xD1,
+                0x82,
+            ]
+        ).decode("latin-1")
         assert _decode_filename(mojibake) == "Документ"
 
 
@@ -84,6 +103,117 @@ class TestHealth:
         assert r.json["status"] == "ok"
 
 
+class TestMetrics:
+    def test_metrics_exposition(self, client: TestClient) -> None:
+        client.simulate_get("/v1/health")
+        r = client.simulate_get("/v1/metrics")
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE relrag_http_request_duration_seconds histogram" in r.text
+        assert (
+            'relrag_http_request_duration_seconds_count{method="GET",route="/v1/health",'
+            'status="200"}'
+        ) in r.text
+
+
+class TestProfiling:
+    def test_requested_profile_is_stored(self, client: TestClient) -> None:
+        r = client.simulate_get("/v1/health", headers={"X-RelRAG-Profile": "1"})
+        profile_id = r.headers["x-relrag-profile-id"]
+
+        r = client.simulate_get("/v1/debug/profiles")
+        assert r.status_code == 200
+        assert r.json["profiles"][0]["id"] == profile_id
+        assert r.json["profiles"][0]["route"] == "/v1/health"
+        assert r.json["profiles"][0]["user_id"] == "test-user-1"
+
+        r = client.simulate_get(f"/v1/debug/profiles/{profile_id}")
+        assert r.status_code == 200
+        assert r.json["trigger"] == "header"
+        assert r.json["status"] == 200
+        assert r.json["profile"]
+
+    def test_unprofiled_request_is_not_stored(self, client: TestClient) -> None:
+        r = client.simulate_get("/v1/health")
+        assert "x-relrag-profile-id" not in r.headers
+        assert client.simulate_get("/v1/debug/profiles").json["profiles"] == []
+
+    def test_unknown_profile_404(self, client: TestClient) -> None:
+        r = client.simulate_get("/v1/debug/profiles/missing")
+        assert r.status_code == 404
+        assert r.json["error"] == "Profile not found"
+
+    def test_other_users_profile_hidden(self) -> None:
+        import falcon.asgi
+        from tests.api.conftest import TEST_DEBUG_TOKEN, AuthBypassMiddleware
+
+        from relrag.infrastructure.observability.profiling import ProfileStore, RequestProfile
+        from relrag.interfaces.api.resources.debug import ProfilesResource
+
+        store = ProfileStore()
+        profile = RequestProfile(method="GET", path="/v1/health", trigger="slow", user_id="other")
+        store.add(profile)
+        app = falcon.asgi.App(middleware=[AuthBypassMiddleware()])
+        app.add_route("/v1/debug/profiles", ProfilesResource(store, debug_token=TEST_DEBUG_TOKEN))
+        app.add_route(
+            "/v1/debug/profiles/{profile_id}",
+            ProfilesResource(store, debug_token=TEST_DEBUG_TOKEN),
+            suffix="profile",
+        )
+        client = TestClient(app)
+
+        assert client.simulate_get("/v1/debug/profiles").json["profiles"] == []
+        assert client.simulate_get(f"/v1/debug/profiles/{profile.id}").status_code == 404
+
+        headers = {"X-RelRAG-Debug-Token": TEST_DEBUG_TOKEN}
+        r = client.simulate_get("/v1/debug/profiles", headers=headers)
+        assert [p["id"] for p in r.json["profiles"]] == [profile.id]
+        r = client.simulate_get(f"/v1/debug/profiles/{profile.id}", headers=headers)
+        assert r.status_code == 200
+
+        r = client.simulate_get("/v1/debug/profiles", headers={"X-RelRAG-Debug-Token": "wrong"})
+        assert r.json["profiles"] == []
+
+    def test_profile_header_needs_admin_or_debug_token(self) -> None:
+        import falcon.asgi
+        from tests.api.conftest import TEST_DEBUG_TOKEN
+
+        from relrag.infrastructure.observability.profiling import ProfileStore
+        from relrag.interfaces.api.middleware.auth import AuthMiddleware
+        from relrag.interfaces.api.middleware.profiling import ProfilingMiddleware
+        from relrag.interfaces.api.resources.health import HealthResource
+
+        store = ProfileStore()
+        app = falcon.asgi.App(
+            middleware=[
+                AuthMiddleware(),
+                ProfilingMiddleware(store, header_enabled=True, debug_token=TEST_DEBUG_TOKEN),
+            ]
+        )
+        app.add_route("/v1/health", HealthResource())
+        client = TestClient(app)
+
+        r = client.simulate_get("/v1/health", headers={"X-RelRAG-Profile": "1"})
+        assert "x-relrag-profile-id" not in r.headers
+        assert store.list() == []
+
+        headers = {"X-RelRAG-Profile": "1", "X-RelRAG-Debug-Token": TEST_DEBUG_TOKEN}
+        r = client.simulate_get("/v1/health", headers=headers)
+        assert store.get(r.headers["x-relrag-profile-id"]).user_id == "anonymous"
+
+    def test_anonymous_forbidden(self) -> None:
+        import falcon.asgi
+
+        from relrag.infrastructure.observability.profiling import ProfileStore
+        from relrag.interfaces.api.middleware.auth import AuthMiddleware
+        from relrag.interfaces.api.resources.debug import ProfilesResource
+
+        app = falcon.asgi.App(middleware=[AuthMiddleware()])
+        app.add_route("/v1/debug/profiles", ProfilesResource(ProfileStore()))
+        r = TestClient(app).simulate_get("/v1/debug/profiles")
+        assert r.status_code == 403
+
+
 class TestConfigurations:
     def test_get_configurations_empty(self, client: TestClient) -> None:
         r = client.simulate_get("/v1/configurations")
@@ -117,6 +247,51 @@ class TestConfigurations:
         assert r.status_code == 201
         assert r.json["embedding_dimensions"] == 1024
 
+    def test_post_configuration_embedding_precision(self, client: TestClient) -> None:
+        r = client.simulate_post("/v1/configurations", json={"chunk_size": 256})
+        assert r.json["embedding_precision"] == "vector"
+        r = client.simulate_post(
+            "/v1/configurations", json={"chunk_size": 256, "embedding_precision": "halfvec"}
+        )
+        assert r.status_code == 201
+        assert r.json["embedding_precision"] == "halfvec"
+        r = client.simulate_post(
+            "/v1/configurations", json={"chunk_size": 256, "embedding_precision": "int4"}
+        )
+        assert r.status_code == 400
+
+    def test_post_configuration_coarse_dimensions(self, client: TestClient) -> None:
+        r = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-large", "coarse_dimensions": 256},
+        )
+        assert r.status_code == 201
+        assert r.json["coarse_dimensions"] == 256
+        r = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "coarse_dimensions": 1536},
+        )
+        assert r.status_code == 400
+
+    @pytest.mark.parametrize("dimensions", [0, -1, 4001, "wide"])
+    def test_post_configuration_invalid_dimensions(self, client: TestClient, dimensions) -> None:
+        r = client.simulate_post(
+            "/v1/configurations", json={"embedding_dimensions": dimensions, "chunk_size": 256}
+        )
+        assert r.status_code == 400
+        assert "error" in r.json
+
+    def test_post_configuration_requires_admin_role(self) -> None:
+        import falcon.asgi
+
+        from relrag.interfaces.api.middleware.auth import AuthMiddleware
+        from relrag.interfaces.api.resources.configurations import ConfigurationsResource
+
+        app = falcon.asgi.App(middleware=[AuthMiddleware()])
+        app.add_route("/v1/configurations", ConfigurationsResource(None))
+        r = TestClient(app).simulate_post("/v1/configurations", json={"chunk_size": 256})
+        assert r.status_code == 403
+
 
 class TestModels:
     def test_get_models(self, client: TestClient) -> None:
@@ -205,6 +380,32 @@ class TestDocuments:
         assert "id" in r.json
         assert r.json["content"] == "Test document content"
 
+    def test_delete_document(self, client: TestClient) -> None:
+        cr = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        )
+        coll_id = client.simulate_post(
+            "/v1/collections", json={"configuration_id": cr.json["id"]}
+        ).json["id"]
+        doc_id = client.simulate_post(
+            "/v1/documents",
+            json={
+                "collection_id": coll_id,
+                "content": "To be deleted",
+                "properties": {"author": {"value": "Alice", "type": "string"}},
+            },
+        ).json["id"]
+
+        r = client.simulate_delete(f"/v1/documents/{doc_id}", params={"collection_id": coll_id})
+        assert r.status_code == 204
+        schema = client.simulate_get(f"/v1/collections/{coll_id}/property-schema")
+        assert schema.json["properties"] == []
+        r = client.simulate_delete(f"/v1/documents/{doc_id}", params={"collection_id": coll_id})
+        assert r.status_code == 404
+        r = client.simulate_delete(f"/v1/documents/{doc_id}")
+        assert r.status_code == 400
+
     def test_post_documents_stream_multipart(self, client: TestClient) -> None:
         """POST /v1/documents/stream returns SSE progress and done events."""
         cr = client.simulate_post(
@@ -220,10 +421,10 @@ class TestDocuments:
         boundary = "----TestBoundary"
         body = (
             f"--{boundary}\r\n"
-            "Content-Disposition: form-data; name=\"collection_id\"\r\n\r\n"
+            'Content-Disposition: form-data; name="collection_id"\r\n\r\n'
             f"{coll_id}\r\n"
             f"--{boundary}\r\n"
-            "Content-Disposition: form-data; name=\"files\"; filename=\"test.txt\"\r\n"
+            'Content-Disposition: form-data; name="files"; filename="test.txt"\r\n'
             "Content-Type: text/plain\r\n\r\n"
             "Hello stream upload\r\n"
             f"--{boundary}--\r\n"
@@ -259,7 +460,7 @@ class TestDocuments:
         # Use filename*=UTF-8'' for "Документ.txt" (RFC 5987)
         body = (
             f"--{boundary}\r\n"
-            "Content-Disposition: form-data; name=\"collection_id\"\r\n\r\n"
+            'Content-Disposition: form-data; name="collection_id"\r\n\r\n'
             f"{coll_id}\r\n"
             f"--{boundary}\r\n"
             "Content-Disposition: form-data; name=\"files\"; filename*=UTF-8''%D0%94%D0%BE%D0%BA%D1%83%D0%BC%D0%B5%D0%BD%D1%82.txt\r\n"
@@ -342,6 +543,105 @@ class TestSearch:
         )
         assert r.status_code == 200
         assert "results" in r.json
+        assert "facets" not in r.json
+        assert r.json["next_cursor"] is None
+
+    def test_search_invalid_cursor(self, client: TestClient) -> None:
+        cr = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        )
+        coll_id = client.simulate_post(
+            "/v1/collections",
+            json={"configuration_id": cr.json["id"]},
+        ).json["id"]
+
+        r = client.simulate_post(
+            f"/v1/collections/{coll_id}/search",
+            json={"query": "search", "cursor": "not-a-cursor"},
+        )
+        assert r.status_code == 400
+
+    def test_search_invalid_limit(self, client: TestClient) -> None:
+        cr = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        )
+        coll_id = client.simulate_post(
+            "/v1/collections",
+            json={"configuration_id": cr.json["id"]},
+        ).json["id"]
+
+        for limit in (0, -1, "ten"):
+            r = client.simulate_post(
+                f"/v1/collections/{coll_id}/search",
+                json={"query": "search", "limit": limit},
+            )
+            assert r.status_code == 400
+
+    def test_search_with_facets(self, client: TestClient) -> None:
+        cr = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        )
+        coll_id = client.simulate_post(
+            "/v1/collections",
+            json={"configuration_id": cr.json["id"]},
+        ).json["id"]
+
+        r = client.simulate_post(
+            f"/v1/collections/{coll_id}/search",
+            json={"query": "search", "facets": ["author", 42, ""]},
+        )
+        assert r.status_code == 200
+        assert r.json["facets"] == {}
+
+    def test_search_group_by_document(self, client: TestClient) -> None:
+        cr = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        )
+        coll_id = client.simulate_post(
+            "/v1/collections",
+            json={"configuration_id": cr.json["id"]},
+        ).json["id"]
+
+        r = client.simulate_post(
+            f"/v1/collections/{coll_id}/search",
+            json={"query": "search", "group_by": "document", "chunks_per_document": 2},
+        )
+        assert r.status_code == 200
+        assert r.json["documents"] == []
+        assert "results" not in r.json
+
+        r = client.simulate_post(
+            f"/v1/collections/{coll_id}/search",
+            json={"query": "search", "group_by": "pack"},
+        )
+        assert r.status_code == 400
+
+    def test_search_rerank_without_reranker(self, client: TestClient) -> None:
+        cr = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        )
+        coll_id = client.simulate_post(
+            "/v1/collections",
+            json={"configuration_id": cr.json["id"]},
+        ).json["id"]
+
+        r = client.simulate_post(
+            f"/v1/collections/{coll_id}/search",
+            json={"query": "search", "rerank": True},
+        )
+        assert r.status_code == 200
+        assert r.json["reranked"] is False
+
+        r = client.simulate_post(
+            f"/v1/collections/{coll_id}/search",
+            json={"query": "search", "rerank": True, "group_by": "document"},
+        )
+        assert r.status_code == 400
 
     def test_search_invalid_collection_id(self, client: TestClient) -> None:
         r = client.simulate_post(
@@ -351,6 +651,115 @@ class TestSearch:
         assert r.status_code == 400
 
 
+class TestBatchSearch:
+    def test_batch_search(self, client: TestClient) -> None:
+        cr = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        )
+        coll_id = client.simulate_post(
+            "/v1/collections", json={"configuration_id": cr.json["id"]}
+        ).json["id"]
+
+        r = client.simulate_post(
+            f"/v1/collections/{coll_id}/search/batch",
+            json={"queries": [{"query": "a"}, {"query": "b", "limit": 3}]},
+        )
+        assert r.status_code == 200
+        assert [q["query"] for q in r.json["results"]] == ["a", "b"]
+
+    def test_batch_search_requires_queries(self, client: TestClient) -> None:
+        r = client.simulate_post(
+            f"/v1/collections/{uuid4()}/search/batch",
+            json={"queries": []},
+        )
+        assert r.status_code == 400
+
+    def test_batch_search_reports_invalid_query_index(self, client: TestClient) -> None:
+        url = f"/v1/collections/{uuid4()}/search/batch"
+        r = client.simulate_post(
+            url, json={"queries": [{"query": "a"}, {"query": "b", "limit": 0}]}
+        )
+        assert r.status_code == 400
+        assert r.json["error"] == "queries[1]: limit must be an integer between 1 and 100"
+
+        r = client.simulate_post(url, json={"queries": [{"query": "a"}, "b"]})
+        assert r.status_code == 400
+        assert r.json["error"] == "queries[1]: must be an object"
+
+        r = client.simulate_post(
+            "/v1/collections/not-a-uuid/search/batch", json={"queries": [{"query": "a"}]}
+        )
+        assert r.json["error"] == "Invalid collection ID"
+
+
+class TestFederatedSearch:
+    def test_federated_search(self, client: TestClient) -> None:
+        cr = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        )
+        coll_ids = [
+            client.simulate_post("/v1/collections", json={"configuration_id": cr.json["id"]}).json[
+                "id"
+            ]
+            for _ in range(2)
+        ]
+
+        r = client.simulate_post("/v1/search", json={"query": "x", "collection_ids": coll_ids})
+        assert r.status_code == 200
+        assert r.json["results"] == []
+        assert r.json["skipped_collection_ids"] == []
+
+    def test_federated_search_validation(self, client: TestClient) -> None:
+        r = client.simulate_post("/v1/search", json={"query": "x"})
+        assert r.status_code == 400
+        r = client.simulate_post("/v1/search", json={"query": "x", "collection_ids": ["bad"]})
+        assert r.status_code == 400
+
+    def test_federated_search_invalid_limit(self, client: TestClient) -> None:
+        for limit in (0, -1, 101, "many", None):
+            r = client.simulate_post(
+                "/v1/search",
+                json={"query": "x", "collection_ids": [str(uuid4())], "limit": limit},
+            )
+            assert r.status_code == 400
+            assert r.json["error"] == "limit must be an integer between 1 and 100"
+
+
+class TestPropertySchema:
+    def test_property_schema_counts(self, client: TestClient) -> None:
+        cr = client.simulate_post(
+            "/v1/configurations",
+            json={"embedding_model": "text-embedding-3-small", "chunk_size": 512},
+        )
+        coll_id = client.simulate_post(
+            "/v1/collections",
+            json={"configuration_id": cr.json["id"]},
+        ).json["id"]
+        for i, author in enumerate(["Alice", "Bob", "Alice"]):
+            client.simulate_post(
+                "/v1/documents",
+                json={
+                    "collection_id": coll_id,
+                    "content": f"Document {i}",
+                    "properties": {"author": {"value": author, "type": "string"}},
+                },
+            )
+
+        r = client.simulate_get(f"/v1/collections/{coll_id}/property-schema")
+        assert r.status_code == 200
+        (prop,) = r.json["properties"]
+        assert prop["key"] == "author"
+        assert prop["values"] == ["Alice", "Bob"]
+        assert prop["counts"] == {"Alice": 2, "Bob": 1}
+        assert prop["document_count"] == 3
+
+    def test_property_schema_invalid_collection_id(self, client: TestClient) -> None:
+        r = client.simulate_get("/v1/collections/not-a-uuid/property-schema")
+        assert r.status_code == 400
+
+
 class TestMigrate:
     def test_migrate_collection(self, client: TestClient) -> None:
         cr = client.simulate_post(
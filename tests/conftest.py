@@ -107,6 +107,15 @@ class FakePackRepository:
             return None
         return pack
 
+    async def list_collection_ids(self, document_id: UUID) -> list[UUID]:
+        ids = {
+            c
+            for p in self._by_id.values()
+            if p.document_id == document_id and p.deleted_at is None
+            for c in self._pack_collections.get(p.id, set())
+        }
+        return sorted(ids)
+
     async def list(
         self,
         *,
@@ -161,8 +170,12 @@ class FakePackRepository:
         self._by_id.pop(pack_id, None)
         self._pack_collections.pop(pack_id, None)
 
-    async def add_to_collection(self, pack_id: UUID, collection_id: UUID) -> None:
-        self._pack_collections.setdefault(pack_id, set()).add(collection_id)
+    async def add_to_collection(self, pack_id: UUID, collection_id: UUID) -> bool:
+        collections = self._pack_collections.setdefault(pack_id, set())
+        if collection_id in collections:
+            return False
+        collections.add(collection_id)
+        return True
 
 
 class FakeChunkRepository:
@@ -172,11 +185,17 @@ class FakeChunkRepository:
         self._by_id: dict[UUID, Chunk] = {}
         self._by_pack: dict[UUID, list[Chunk]] = {}
         self._search_results: list[dict] = []
+        self._search_facets: dict[str, dict[str, int]] = {}
+        self.search_many_calls = 0
 
     def set_search_results(self, results: list[dict]) -> None:
         """Set predefined search results for testing."""
         self._search_results = results
 
+    def set_search_facets(self, facets: dict[str, dict[str, int]]) -> None:
+        """Set predefined facet counts for testing."""
+        self._search_facets = facets
+
     async def create_batch(self, chunks: list[Chunk]) -> list[Chunk]:
         for c in chunks:
             self._by_id[c.id] = c
@@ -204,8 +223,81 @@ class FakeChunkRepository:
         fts_weight: float = 0.3,
         limit: int = 10,
         property_filters: dict[str, str] | None = None,
+        after: tuple[float, UUID] | None = None,
+        group_by_document: bool = False,
+        chunks_per_document: int = 3,
+        embedding_precision: str = "vector",
+        coarse_dimensions: int | None = None,
+    ) -> list[dict]:
+        return self._page(limit, after, group_by_document, chunks_per_document)
+
+    def _page(
+        self,
+        limit: int,
+        after: tuple[float, UUID] | None,
+        group_by_document: bool = False,
+        chunks_per_document: int = 3,
+    ) -> list[dict]:
+        rows = sorted(
+            self._search_results, key=lambda r: (r["score"], r["chunk_id"]), reverse=True
+        )
+        if not group_by_document:
+            if after is not None:
+                rows = [r for r in rows if (r["score"], r["chunk_id"]) < after]
+            return rows[:limit]
+        by_doc: dict[UUID, list[dict]] = {}
+        for r in rows:
+            by_doc.setdefault(r["document_id"], []).append(r)
+        docs = sorted(
+            ((chunks[0]["score"], doc_id) for doc_id, chunks in by_doc.items()), reverse=True
+        )
+        if after is not None:
+            docs = [d for d in docs if d < after]
+        return [
+            {**r, "doc_score": doc_score}
+            for doc_score, doc_id in docs[:limit]
+            for r in by_doc[doc_id][:chunks_per_document]
+        ]
+
+    async def search_with_facets(
+        self,
+        collection_id: UUID,
+        query_embedding: list[float],
+        facet_keys: list[str],
+        query_fts: str | None = None,
+        vector_weight: float = 0.7,
+        fts_weight: float = 0.3,
+        limit: int = 10,
+        property_filters: dict[str, str] | None = None,
+        after: tuple[float, UUID] | None = None,
+        group_by_document: bool = False,
+        chunks_per_document: int = 3,
+        embedding_precision: str = "vector",
+        coarse_dimensions: int | None = None,
+    ) -> tuple[list[dict], dict[str, dict[str, int]]]:
+        facets = {k: v for k, v in self._search_facets.items() if k in facet_keys}
+        return self._page(limit, after, group_by_document, chunks_per_document), facets
+
+    async def search_collections(
+        self,
+        collection_ids: list[UUID],
+        query_embedding: list[float],
+        query_fts: str | None = None,
+        vector_weight: float = 0.7,
+        fts_weight: float = 0.3,
+        limit: int = 10,
+        property_filters: dict[str, str] | None = None,
+        embedding_precision: str = "vector",
+        coarse_dimensions: int | None = None,
     ) -> list[dict]:
-        return self._search_results[:limit]
+        rows = self._page(len(self._search_results), None)
+        return [r for r in rows if r.get("collection_id") in collection_ids][:limit]
+
+    async def search_many(
+        self, collection_id: UUID, queries: list[dict[str, object]]
+    ) -> list[list[dict]]:
+        self.search_many_calls += 1
+        return [self._page(int(q.get("limit", 10)), None) for q in queries]
 
 
 class FakeConfigurationRepository:
@@ -228,6 +320,16 @@ class FakeConfigurationRepository:
                 return self._by_id.get(coll.configuration_id)
         return None
 
+    async def get_by_collection_ids(
+        self, collection_ids: list[UUID]
+    ) -> dict[UUID, Configuration]:
+        out: dict[UUID, Configuration] = {}
+        for cid in collection_ids:
+            config = await self.get_by_collection_id(cid)
+            if config:
+                out[cid] = config
+        return out
+
     async def list(
         self,
         *,
@@ -323,22 +425,46 @@ class FakeCollectionRepository:
             from dataclasses import replace
 
             self._by_id[collection_id] = replace(
-                coll, deleted_at=datetime.now(UTC)
+                coll, deleted_at=datetime.now(UTC), version=coll.version + 1
             )
 
     async def hard_delete(self, collection_id: UUID) -> None:
         self._by_id.pop(collection_id, None)
 
+    async def get_version(self, collection_id: UUID) -> int | None:
+        coll = await self.get_by_id(collection_id)
+        return coll.version if coll else None
+
+    async def bump_version(self, collection_id: UUID) -> None:
+        coll = self._by_id.get(collection_id)
+        if coll:
+            coll.version += 1
+
 
 class FakePermissionRepository:
     """In-memory permission repository."""
 
-    def __init__(self) -> None:
+    def __init__(self, roles_repo: FakeRoleRepository | None = None) -> None:
         self._by_id: dict[UUID, Permission] = {}
+        self._roles_repo = roles_repo
 
     async def get_by_id(self, permission_id: UUID) -> Permission | None:
         return self._by_id.get(permission_id)
 
+    async def list_allowed_collection_ids(
+        self, subject: str, collection_ids: list[UUID], action: str
+    ) -> list[UUID]:
+        allowed = []
+        for p in self._by_id.values():
+            if p.subject != subject or p.collection_id not in collection_ids:
+                continue
+            actions = p.actions_override
+            if actions is None and self._roles_repo:
+                actions = await self._roles_repo.get_actions_for_role(p.role_id)
+            if action in (actions or []):
+                allowed.append(p.collection_id)
+        return allowed
+
     async def list_by_collection(self, collection_id: UUID) -> list[Permission]:
         return [
             p
@@ -401,10 +527,13 @@ class FakeRoleRepository:
 
 
 class FakePropertyRepository:
-    """In-memory property repository."""
+    """In-memory property repository with per-collection facet counts."""
 
     def __init__(self) -> None:
         self._store: list[Property] = []
+        # collection_id -> (key, type, value) -> document count
+        self._facets: dict[UUID, dict[tuple[str, str, str], int]] = {}
+        self._facet_documents: dict[UUID, set[UUID]] = {}  # collection_id -> counted documents
 
     async def list_by_document(self, document_id: UUID) -> list[Property]:
         return [p for p in self._store if p.document_id == document_id]
@@ -413,8 +542,44 @@ class FakePropertyRepository:
         self._store.extend(properties)
 
     async def delete_by_document(self, document_id: UUID) -> None:
+        for collection_id, documents in self._facet_documents.items():
+            if document_id not in documents:
+                continue
+            documents.discard(document_id)
+            facets = self._facets[collection_id]
+            for p in self._store:
+                if p.document_id == document_id:
+                    fk = (p.key, p.property_type.value, p.value)
+                    facets[fk] -= 1
+                    if facets[fk] <= 0:
+                        del facets[fk]
         self._store = [p for p in self._store if p.document_id != document_id]
 
+    async def add_document_to_facets(self, collection_id: UUID, document_id: UUID) -> None:
+        self._facet_documents.setdefault(collection_id, set()).add(document_id)
+        facets = self._facets.setdefault(collection_id, {})
+        for p in self._store:
+            if p.document_id == document_id:
+                fk = (p.key, p.property_type.value, p.value)
+                facets[fk] = facets.get(fk, 0) + 1
+
+    async def list_schema_by_collection(self, collection_id: UUID) -> list:
+        from relrag.application.ports.repositories.property_repository import (
+            PropertySchemaItem,
+        )
+        from relrag.domain.value_objects import PropertyType
+
+        items: dict[tuple[str, str], PropertySchemaItem] = {}
+        for (key, ptype, value), count in sorted(self._facets.get(collection_id, {}).items()):
+            item = items.setdefault(
+                (key, ptype), PropertySchemaItem(key=key, property_type=PropertyType(ptype))
+            )
+            item.document_count += count
+            if ptype in ("string", "bool"):
+                item.values.append(value)
+                item.counts[value] = count
+        return list(items.values())
+
 
 # --- Fake UnitOfWork ---
 
@@ -430,8 +595,8 @@ class FakeUnitOfWork:
         self.configurations = FakeConfigurationRepository(
             collections_repo=self.collections
         )
-        self.permissions = FakePermissionRepository()
         self.roles = FakeRoleRepository()
+        self.permissions = FakePermissionRepository(roles_repo=self.roles)
         self.properties = FakePropertyRepository()
 
     async def commit(self) -> None:
@@ -474,8 +639,12 @@ def mock_permission_checker():
     """AsyncMock for PermissionChecker - returns True by default."""
     from unittest.mock import AsyncMock
 
+    async def _filter_allowed(user_id, collection_ids, action):
+        return list(collection_ids)
+
     mock = AsyncMock()
     mock.check.return_value = True
+    mock.filter_allowed = AsyncMock(side_effect=_filter_allowed)
     return mock
 
 
@@ -483,8 +652,8 @@ def mock_permission_checker():
 def mock_embedding_provider():
     """AsyncMock for EmbeddingProvider - returns fixed vectors per text."""
 
-    async def _embed(texts: list[str]) -> list[list[float]]:
-        return [[0.1] * 1536 for _ in texts]
+    async def _embed(texts: list[str], dimensions: int | None = None) -> list[list[float]]:
+        return [[0.1] * (dimensions or 1536) for _ in texts]
 
     from unittest.mock import AsyncMock
 
@@ -0,0 +1,95 @@
+"""Unit tests for per-configuration ANN index DDL."""
+
+from uuid import uuid4
+
+import pytest
+
+from relrag.domain.entities import Configuration
+from relrag.domain.value_objects import ChunkingStrategy, EmbeddingPrecision
+from relrag.infrastructure.persistence.postgres.ann_indexes import (
+    ann_index_statements,
+    build_ann_indexes,
+)
+from relrag.infrastructure.persistence.postgres.chunk_repository import _compact_distance
+from relrag.infrastructure.persistence.postgres.configuration_repository import (
+    PostgresConfigurationRepository,
+)
+
+
+def test_full_precision_builds_no_index() -> None:
+    # The exact hybrid ORDER BY never uses an ANN index
+    assert ann_index_statements(1536) == []
+    assert ann_index_statements(3072) == []
+
+
+@pytest.mark.parametrize(
+    ("precision", "name"),
+    [("halfvec", "ix_chunk_embedding_half_3072 "), ("bit", "ix_chunk_embedding_bit_3072 ")],
+)
+def test_compact_precision_builds_no_full_precision_index(precision: str, name: str) -> None:
+    statements = ann_index_statements(3072, precision)
+    assert len(statements) == 1
+    assert name in statements[0]
+
+
+def test_coarse_configuration_builds_prefix_index_only() -> None:
+    statements = ann_index_statements(1024, "halfvec", 256)
+    assert len(statements) == 1
+    assert "ix_chunk_embedding_half_1024_prefix_256 " in statements[0]
+
+
+@pytest.mark.parametrize("precision", ["vector", "halfvec", "bit"])
+def test_prefix_index_matches_coarse_search_expression(precision: str) -> None:
+    prefix = ann_index_statements(1024, precision, 256)[-1]
+    assert "_prefix_256 " in prefix
+    assert "WHERE vector_dims(embedding) = 1024" in prefix
+    # ORDER BY left operand of the coarse pass, without the table alias
+    expression = _compact_distance(precision, 1024, 256).split(" <")[0].replace("c.", "")
+    assert f"(({expression}) " in prefix
+
+
+class _RecordingConnection:
+    def __init__(self, rows: list[list[tuple]] | None = None) -> None:
+        self.executed: list[str] = []
+        self._rows = list(rows or [])
+
+    async def execute(self, query, params=None):
+        self.executed.append(query)
+        return self
+
+    async def fetchall(self):
+        return self._rows.pop(0) if self._rows else []
+
+
+@pytest.mark.asyncio
+async def test_configuration_create_runs_no_ddl() -> None:
+    conn = _RecordingConnection()
+    config = Configuration(
+        id=uuid4(),
+        chunking_strategy=ChunkingStrategy.RECURSIVE,
+        embedding_model="text-embedding-3-large",
+        embedding_dimensions=1024,
+        chunk_size=512,
+        chunk_overlap=50,
+        embedding_precision=EmbeddingPrecision.HALFVEC,
+        coarse_dimensions=128,
+    )
+    await PostgresConfigurationRepository(conn).create(config)
+
+    assert len(conn.executed) == 1
+    assert conn.executed[0].startswith("INSERT INTO configuration")
+
+
+@pytest.mark.asyncio
+async def test_build_ann_indexes_runs_concurrently_for_every_configuration() -> None:
+    configurations = [(1024, "halfvec", 128), (1024, "halfvec", 128), (1536, "bit", None)]
+    conn = _RecordingConnection([configurations, [("ix_chunk_embedding_bit_1536",)]])
+
+    statements = await build_ann_indexes(conn)
+
+    expected = ann_index_statements(1024, "halfvec", 128) + ann_index_statements(1536, "bit")
+    assert statements == [
+        s.replace("CREATE INDEX ", "CREATE INDEX CONCURRENTLY ") for s in expected
+    ]
+    assert "DROP INDEX CONCURRENTLY IF EXISTS ix_chunk_embedding_bit_1536" in conn.executed
+    assert conn.executed[-len(statements) :] == statements
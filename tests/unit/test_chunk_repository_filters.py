@@ -1,7 +1,12 @@
-"""Unit tests for chunk_repository._build_property_filter_conditions."""
+"""Unit tests for chunk_repository SQL builders."""
 
+from uuid import uuid4
+
+from relrag.infrastructure.observability.metrics import SEARCH_CANDIDATES
 from relrag.infrastructure.persistence.postgres.chunk_repository import (
     _build_property_filter_conditions,
+    _build_search_query,
+    _observe_search,
 )
 
 
@@ -19,106 +24,276 @@ class TestBuildPropertyFilterConditions:
         assert params == []
 
     def test_one_of_list(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "status": {"one_of": ["a", "b"]},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "status": {"one_of": ["a", "b"]},
+            }
+        )
         assert len(conditions) == 1
         assert "EXISTS" in conditions[0]
-        assert "ANY(%s)" in conditions[0]
+        assert "ANY(%s::text[])" in conditions[0]
         assert params == ["status", ["a", "b"]]
 
     def test_one_of_empty_list_skipped(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "x": {"one_of": []},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "x": {"one_of": []},
+            }
+        )
         assert conditions == []
         assert params == []
 
     def test_one_of_non_list_skipped(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "x": {"one_of": "not a list"},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "x": {"one_of": "not a list"},
+            }
+        )
         assert conditions == []
         assert params == []
 
     def test_gte_and_lte_numeric(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "num": {"gte": 10, "lte": 20},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "num": {"gte": 10, "lte": 20},
+            }
+        )
         assert len(conditions) == 1
         assert "::numeric" in conditions[0]
-        assert ">= %s" in conditions[0]
-        assert "<= %s" in conditions[0]
-        assert params == ["num", 10, 20]
+        assert ">= %s::numeric" in conditions[0]
+        assert "<= %s::numeric" in conditions[0]
+        assert params == ["num", "10", "20"]
 
     def test_gte_only(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "n": {"gte": 5},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "n": {"gte": 5},
+            }
+        )
         assert len(conditions) == 1
         assert ">= %s" in conditions[0]
-        assert params == ["n", 5]
+        assert params == ["n", "5"]
 
     def test_lte_only(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "n": {"lte": 100},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "n": {"lte": 100},
+            }
+        )
         assert len(conditions) == 1
         assert "<= %s" in conditions[0]
-        assert params == ["n", 100]
+        assert params == ["n", "100"]
 
     def test_gte_lte_date_cast(self) -> None:
         # value that can't be float -> ::date
-        conditions, params = _build_property_filter_conditions({
-            "d": {"gte": "2020-01-01", "lte": "2020-12-31"},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "d": {"gte": "2020-01-01", "lte": "2020-12-31"},
+            }
+        )
         assert len(conditions) == 1
         assert "::date" in conditions[0]
         assert params == ["d", "2020-01-01", "2020-12-31"]
 
     def test_eq_string(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "k": {"eq": "v"},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "k": {"eq": "v"},
+            }
+        )
         assert len(conditions) == 1
         assert "value = %s" in conditions[0]
         assert params == ["k", "v"]
 
     def test_eq_bool_true(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "flag": {"eq": True},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "flag": {"eq": True},
+            }
+        )
         assert params == ["flag", "true"]
 
     def test_eq_bool_false(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "flag": {"eq": False},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "flag": {"eq": False},
+            }
+        )
         assert params == ["flag", "false"]
 
     def test_primitive_as_eq(self) -> None:
         # bool, int, float, str as spec -> treated as {"eq": value}
-        conditions, params = _build_property_filter_conditions({
-            "a": True,
-            "b": 42,
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "a": True,
+                "b": 42,
+            }
+        )
         assert len(conditions) == 2
         assert params == ["a", "true", "b", "42"]
 
     def test_non_dict_spec_skipped(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "x": 123,  # becomes eq
-            "y": [1, 2],  # not dict, not primitive -> skipped after isinstance(spec, dict) fails
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "x": 123,  # becomes eq
+                "y": [
+                    1,
+                    2,
+                ],  # not dict, not primitive -> skipped after isinstance(spec, dict) fails
+            }
+        )
         # x -> eq 42; y -> list is not dict so skipped
         assert len(conditions) == 1
         assert params == ["x", "123"]
 
     def test_multiple_filters(self) -> None:
-        conditions, params = _build_property_filter_conditions({
-            "status": {"one_of": ["open"]},
-            "count": {"gte": 1, "lte": 10},
-            "name": {"eq": "test"},
-        })
+        conditions, params = _build_property_filter_conditions(
+            {
+                "status": {"one_of": ["open"]},
+                "count": {"gte": 1, "lte": 10},
+                "name": {"eq": "test"},
+            }
+        )
         assert len(conditions) == 3
         assert len(params) == 7  # status + [open], count + 1 + 10, name + test
+
+    def test_canonical_shape(self) -> None:
+        # Same filter signature in any key order / with skipped keys -> same SQL text
+        a_conds, a_params = _build_property_filter_conditions(
+            {
+                "status": {"one_of": [1, 2]},
+                "count": {"gte": 1},
+            }
+        )
+        b_conds, b_params = _build_property_filter_conditions(
+            {
+                "skip": None,
+                "count": {"gte": 2.5},
+                "status": {"one_of": ["x"]},
+            }
+        )
+        assert a_conds == b_conds
+        assert "pr0" in a_conds[0] and "pr1" in a_conds[1]
+        assert a_params == ["count", "1", "status", ["1", "2"]]
+        assert b_params == ["count", "2.5", "status", ["x"]]
+
+
+class TestBuildSearchQuery:
+    """Tests for _build_search_query."""
+
+    def test_without_facets(self) -> None:
+        coll_id = uuid4()
+        sql, params = _build_search_query(coll_id, [0.1], "hello", 0.7, 0.3, 5, None)
+        assert "facets" not in sql
+        assert params == [[0.1], "hello", "hello", coll_id, 0.7, 0.3, 5]
+
+    def test_filters_params_before_weights(self) -> None:
+        coll_id = uuid4()
+        sql, params = _build_search_query(coll_id, [0.1], None, 0.7, 0.3, 5, {"lang": {"eq": "en"}})
+        assert "EXISTS" in sql
+        assert params == [[0.1], "", "", coll_id, "lang", "en", 0.7, 0.3, 5]
+
+    def test_facets_counted_over_filtered_candidates(self) -> None:
+        coll_id = uuid4()
+        sql, params = _build_search_query(
+            coll_id, [0.1], "q", 0.7, 0.3, 5, {"lang": "en"}, facet_keys=["author"]
+        )
+        assert "facets AS" in sql
+        assert "SELECT document_id FROM candidates" in sql
+        assert params == [[0.1], "q", "q", coll_id, "lang", "en", 0.7, 0.3, ["author"], 5]
+
+    def test_two_phase_facets_not_limited_to_ann_pool(self) -> None:
+        coll_id = uuid4()
+        emb = [0.1] * 1536
+        sql, params = _build_search_query(
+            coll_id,
+            emb,
+            "q",
+            0.7,
+            0.3,
+            5,
+            {"lang": "en"},
+            facet_keys=["author"],
+            embedding_precision="halfvec",
+        )
+        facets = sql[sql.index("facets AS") : sql.index("top AS")]
+        assert "candidates" not in facets
+        assert "LIMIT" not in facets
+        assert "vector_dims(c.embedding) = 1536" in facets
+        # ANN candidates, rescoring, weights, then the facet keys and the facet filter
+        assert params[:10] == [coll_id, "lang", "en", emb, 100, emb, "q", "q", 0.7, 0.3]
+        assert params[10:] == [["author"], coll_id, "lang", "en", 5]
+
+    def test_keyset_after(self) -> None:
+        coll_id = uuid4()
+        chunk_id = uuid4()
+        sql, params = _build_search_query(
+            coll_id, [0.1], "q", 0.7, 0.3, 5, None, after=(0.5, chunk_id)
+        )
+        assert "(s.score, s.chunk_id) < (%s::float8, %s::uuid)" in sql
+        assert params[-3:] == [0.5, chunk_id, 5]
+
+    def test_group_by_document(self) -> None:
+        coll_id = uuid4()
+        doc_id = uuid4()
+        sql, params = _build_search_query(
+            coll_id,
+            [0.1],
+            "q",
+            0.7,
+            0.3,
+            5,
+            None,
+            after=(0.5, doc_id),
+            group_by_document=True,
+            chunks_per_document=2,
+        )
+        assert "PARTITION BY s.document_id" in sql
+        assert "(r.doc_score, r.document_id) < (%s::float8, %s::uuid)" in sql
+        assert "t.doc_score DESC, t.document_id DESC, t.chunk_rank" in sql
+        assert params[-4:] == [0.5, doc_id, 5, 2]
+
+    def test_full_precision_scores_exactly_by_dimension(self) -> None:
+        sql, _ = _build_search_query(uuid4(), [0.1] * 3072, "q", 0.7, 0.3, 5, None)
+        assert "c.embedding <=> %s::vector" in sql
+        assert "vector_dims(c.embedding) = 3072" in sql
+        assert "halfvec" not in sql
+
+    def test_compact_precision_rescores_candidates(self) -> None:
+        coll_id = uuid4()
+        emb = [0.1] * 1536
+        sql, params = _build_search_query(
+            coll_id, emb, "q", 0.7, 0.3, 5, None, embedding_precision="halfvec"
+        )
+        assert "ORDER BY c.embedding::halfvec(1536) <=> %s::halfvec(1536)" in sql
+        assert "(1 - (c.embedding::vector <=> %s::vector)) AS vector_score" in sql
+        assert params[:6] == [coll_id, emb, 100, emb, "q", "q"]
+        sql, params = _build_search_query(
+            coll_id, emb, "q", 0.7, 0.3, 20, None, embedding_precision="bit"
+        )
+        assert "binary_quantize(c.embedding)::bit(1536) <~>" in sql
+        assert params[2] == 200
+
+    def test_coarse_prefix_candidates(self) -> None:
+        coll_id = uuid4()
+        emb = [0.1] * 1536
+        sql, params = _build_search_query(
+            coll_id, emb, "q", 0.7, 0.3, 5, None, coarse_dimensions=256
+        )
+        assert "ORDER BY subvector(c.embedding, 1, 256)::vector(256) <=> %s::vector(256)" in sql
+        assert params[1] == emb[:256]
+        assert params[3] == emb
+
+    def test_two_phase_rows_carry_candidate_count(self) -> None:
+        emb = [0.1] * 1536
+        sql, _ = _build_search_query(
+            uuid4(), emb, "q", 0.7, 0.3, 5, None, embedding_precision="bit"
+        )
+        assert "(SELECT count(*) FROM ann) AS candidate_count" in sql
+        sql, _ = _build_search_query(uuid4(), emb, "q", 0.7, 0.3, 5, None)
+        assert "candidate_count" not in sql
+
+        before = SEARCH_CANDIDATES.cumulative(kind="batch")[2]
+        _observe_search([{"candidate_count": 37}, {"candidate_count": 37}], "batch")
+        _observe_search([{}], "batch")  # exact search: no candidate count
+        assert SEARCH_CANDIDATES.cumulative(kind="batch")[2] == before + 1
@@ -0,0 +1,64 @@
+"""Unit tests for the relrag CLI."""
+
+import pytest
+
+from relrag.config import Settings
+from relrag.interfaces import cli
+
+
+def _serve_args(*argv: str):
+    return cli.build_parser().parse_args(["serve", *argv])
+
+
+def test_serve_options_come_from_settings() -> None:
+    settings = Settings(server_workers=4, server_port=9000, server_loop="uvloop", log_level="INFO")
+    options = cli.uvicorn_options(_serve_args(), settings)
+    assert options["factory"] is True
+    assert options["workers"] == 4
+    assert options["port"] == 9000
+    assert options["loop"] == "uvloop"
+    assert options["timeout_graceful_shutdown"] == settings.server_graceful_shutdown_seconds
+    assert options["log_level"] == "info"
+    assert "limit_concurrency" not in options
+
+
+def test_serve_flags_override_settings() -> None:
+    settings = Settings(server_workers=4, server_limit_concurrency=100)
+    options = cli.uvicorn_options(
+        _serve_args("--workers", "2", "--http", "h11", "--port", "8001"), settings
+    )
+    assert options["workers"] == 2
+    assert options["http"] == "h11"
+    assert options["port"] == 8001
+    assert options["limit_concurrency"] == 100
+
+
+def test_zero_workers_means_one_per_cpu(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cli, "available_cpus", lambda: 6)
+    options = cli.uvicorn_options(_serve_args("--workers", "0"), Settings())
+    assert options["workers"] == 6
+
+
+def test_reload_runs_single_worker() -> None:
+    options = cli.uvicorn_options(_serve_args("--reload"), Settings(server_workers=8))
+    assert options["workers"] == 1
+    assert options["reload"] is True
+
+
+def test_no_command_prints_version(capsys: pytest.CaptureFixture[str]) -> None:
+    cli.main([])
+    assert capsys.readouterr().out.startswith("RelRAG v")
+
+
+def test_per_worker_warnings() -> None:
+    assert cli.per_worker_warnings(1, Settings(profiling_enabled=True)) == []
+    assert len(cli.per_worker_warnings(4, Settings())) == 1
+    warnings = cli.per_worker_warnings(4, Settings(profiling_slow_request_ms=500))
+    assert len(warnings) == 2
+    assert "profiles are stored per worker" in warnings[1]
+
+
+def test_build_indexes_command() -> None:
+    args = cli.build_parser().parse_args(["build-indexes", "--database-url", "postgresql://x"])
+    assert args.handler is cli.build_indexes
+    assert args.database_url == "postgresql://x"
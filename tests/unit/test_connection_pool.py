@@ -0,0 +1,37 @@
+"""Unit tests for the PostgreSQL pool factory."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from relrag.infrastructure.persistence.postgres import connection
+from relrag.infrastructure.persistence.postgres.connection import create_pool
+
+
+@pytest.mark.asyncio
+async def test_pool_configures_each_connection_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    register = AsyncMock()
+    monkeypatch.setattr(connection, "register_vector_async", register)
+    pool = create_pool(
+        "postgresql://localhost/relrag",
+        min_size=1,
+        max_size=4,
+        timeout=2.5,
+        prepare_threshold=0,
+        prepared_max=50,
+    )
+    assert (pool.min_size, pool.max_size, pool.timeout) == (1, 4, 2.5)
+    assert pool.kwargs["prepare_threshold"] == 0
+
+    conn = AsyncMock()
+    conn.prepared_max = 100
+    await pool._configure(conn)
+    register.assert_awaited_once_with(conn)
+    conn.commit.assert_awaited_once()
+    assert conn.prepared_max == 50
+
+
+@pytest.mark.asyncio
+async def test_pool_can_disable_prepared_statements() -> None:
+    pool = create_pool("postgresql://localhost/relrag", prepare_threshold=None)
+    assert pool.kwargs["prepare_threshold"] is None
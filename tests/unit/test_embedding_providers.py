@@ -0,0 +1,58 @@
+"""Unit tests for local and hashing embedding providers and provider selection."""
+
+import math
+
+import pytest
+
+from relrag.config import Settings
+from relrag.infrastructure.embedding.factory import create_embedding_provider
+from relrag.infrastructure.embedding.hashing_provider import HashingEmbeddingProvider
+from relrag.infrastructure.embedding.local_provider import SentenceTransformerEmbeddingProvider
+
+
+@pytest.mark.asyncio
+async def test_hashing_provider_is_deterministic_and_normalized() -> None:
+    """Same text gives the same unit vector; dimensions can be overridden per call."""
+    provider = HashingEmbeddingProvider(dimensions=64)
+    a, b, empty = await provider.embed(["Hello world", "hello WORLD", ""])
+    assert a == b
+    assert len(a) == 64
+    assert math.isclose(sum(v * v for v in a), 1.0)
+    assert math.isclose(sum(v * v for v in empty), 1.0)
+    (short,) = await provider.embed(["hello"], dimensions=16)
+    assert len(short) == 16
+
+
+@pytest.mark.asyncio
+async def test_local_provider_batches_in_executor() -> None:
+    """encode() gets the whole list with the configured batch size and truncate_dim."""
+    calls = []
+
+    class _Array(list):
+        def tolist(self) -> list:
+            return list(self)
+
+    class _FakeModel:
+        def encode(self, texts, **kwargs):
+            calls.append((list(texts), kwargs))
+            return _Array([1.0] * (kwargs["truncate_dim"] or 4) for _ in texts)
+
+    provider = SentenceTransformerEmbeddingProvider("m", batch_size=8)
+    provider._model = _FakeModel()
+    vectors = await provider.embed(["a", "b", "c"], dimensions=2)
+    provider.close()
+
+    assert vectors == [[1.0, 1.0]] * 3
+    assert calls[0][0] == ["a", "b", "c"]
+    assert calls[0][1]["batch_size"] == 8
+    assert await provider.embed([]) == []
+
+
+def test_factory_selects_provider() -> None:
+    """embedding_provider setting picks the implementation."""
+    provider = create_embedding_provider(
+        Settings(embedding_provider="hashing", hashing_embedding_dimensions=32)
+    )
+    assert isinstance(provider, HashingEmbeddingProvider)
+    local = create_embedding_provider(Settings(embedding_provider="local"))
+    assert isinstance(local, SentenceTransformerEmbeddingProvider)
@@ -0,0 +1,50 @@
+"""Unit tests for the orjson media handler."""
+
+from datetime import UTC, datetime
+from uuid import UUID
+
+import falcon
+import falcon.asgi
+import orjson
+from falcon.testing import TestClient
+
+from relrag.interfaces.api.media import dumps, install_json_handler
+from relrag.interfaces.api.resources.documents import _sse_event
+
+_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+def test_dumps_serializes_uuid_datetime_and_int_keys() -> None:
+    payload = {"id": _ID, "at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC), "counts": {7: 2}}
+    assert orjson.loads(dumps(payload)) == {
+        "id": "12345678-1234-5678-1234-567812345678",
+        "at": "2024-01-02T03:04:05+00:00",
+        "counts": {"7": 2},
+    }
+
+
+def test_sse_event_keeps_utf8() -> None:
+    assert _sse_event("done", {"title": "Отчёт"}) == (
+        'event: done\ndata: {"title":"Отчёт"}\n\n'.encode()
+    )
+
+
+class _EchoResource:
+    async def on_post(self, req: falcon.asgi.Request, resp: falcon.asgi.Response) -> None:
+        body = await req.get_media()
+        resp.media = {"id": _ID, "echo": body}
+
+
+def test_installed_handler_reads_and_writes_json() -> None:
+    app = falcon.asgi.App()
+    install_json_handler(app)
+    app.add_route("/echo", _EchoResource())
+
+    result = TestClient(app).simulate_post("/echo", json={"query": "ä"})
+    assert result.status_code == 200
+    assert result.json == {"id": str(_ID), "echo": {"query": "ä"}}
+
+    invalid = TestClient(app).simulate_post(
+        "/echo", body="{not json", headers={"Content-Type": "application/json"}
+    )
+    assert invalid.status_code == 400
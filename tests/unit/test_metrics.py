@@ -0,0 +1,53 @@
+"""Unit tests for the metrics registry and instruments."""
+
+import pytest
+
+from relrag.infrastructure.cache.memory_cache import InMemorySearchCache
+from relrag.infrastructure.observability.metrics import (
+    EMBEDDING_BATCH_SIZE,
+    SEARCH_CACHE_REQUESTS,
+    Counter,
+    Histogram,
+    MeteredEmbeddingProvider,
+    MetricsRegistry,
+)
+
+
+def test_render_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    hits = registry.register(Counter("app_hits", "Hits", labels=("route",)))
+    latency = registry.register(Histogram("app_latency_seconds", "Latency", buckets=(0.1, 1.0)))
+    hits.inc(route='/a"b')
+    hits.inc(2, route='/a"b')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    registry.add_collector(lambda: ["app_up 1"])
+
+    text = registry.render()
+    assert "# TYPE app_hits counter" in text
+    assert 'app_hits_total{route="/a\\"b"} 3' in text
+    assert 'app_latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'app_latency_seconds_bucket{le="1"} 2' in text
+    assert 'app_latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "app_latency_seconds_count 2" in text
+    assert text.endswith("app_up 1\n")
+
+
+@pytest.mark.asyncio
+async def test_metered_embedding_provider_records_batch_size(mock_embedding_provider) -> None:
+    _, _, before = EMBEDDING_BATCH_SIZE.cumulative()
+    await MeteredEmbeddingProvider(mock_embedding_provider).embed(["a", "b", "c"])
+    counts, total, count = EMBEDDING_BATCH_SIZE.cumulative()
+    assert count == before + 1
+
+
+@pytest.mark.asyncio
+async def test_search_cache_counts_hits_and_misses() -> None:
+    hits = SEARCH_CACHE_REQUESTS.value(result="hit")
+    misses = SEARCH_CACHE_REQUESTS.value(result="miss")
+    cache = InMemorySearchCache()
+    await cache.get("k")
+    await cache.set("k", 1)
+    await cache.get("k")
+    assert SEARCH_CACHE_REQUESTS.value(result="hit") == hits + 1
+    assert SEARCH_CACHE_REQUESTS.value(result="miss") == misses + 1
@@ -0,0 +1,31 @@
+"""Unit tests for OpenAIEmbeddingProvider."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from relrag.infrastructure.embedding.openai_provider import OpenAIEmbeddingProvider
+
+
+def _provider(model: str) -> tuple[OpenAIEmbeddingProvider, AsyncMock]:
+    provider = OpenAIEmbeddingProvider(base_url="http://localhost", api_key="k", model=model)
+    create = AsyncMock(return_value=SimpleNamespace(data=[SimpleNamespace(embedding=[0.1, 0.2])]))
+    provider._client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+    return provider, create
+
+
+@pytest.mark.asyncio
+async def test_embed_passes_dimensions_for_matryoshka_models() -> None:
+    """text-embedding-3-* models receive the requested dimensions."""
+    provider, create = _provider("text-embedding-3-large")
+    assert await provider.embed(["x"], dimensions=256) == [[0.1, 0.2]]
+    create.assert_awaited_once_with(model="text-embedding-3-large", input=["x"], dimensions=256)
+
+
+@pytest.mark.asyncio
+async def test_embed_omits_dimensions_for_other_models() -> None:
+    """Models without shortened-embedding support never get the dimensions parameter."""
+    provider, create = _provider("text-embedding-ada-002")
+    await provider.embed(["x"], dimensions=1536)
+    create.assert_awaited_once_with(model="text-embedding-ada-002", input=["x"])
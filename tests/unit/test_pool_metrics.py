@@ -0,0 +1,121 @@
+"""Unit tests for connection pool metrics."""
+
+import pytest
+from psycopg_pool import PoolTimeout
+
+from relrag.infrastructure.observability.metrics import (
+    PoolMetrics,
+    begin_request_pool_wait,
+    collect_pools,
+    request_pool_wait,
+)
+from relrag.infrastructure.persistence.postgres.unit_of_work import PostgresUnitOfWork
+
+
+class _FakePool:
+    def __init__(self, stats: dict | None = None) -> None:
+        self._stats = stats or {}
+
+    def get_stats(self) -> dict:
+        return self._stats
+
+    def connection(self):
+        return _ExhaustedCheckout()
+
+
+class _ExhaustedCheckout:
+    async def __aenter__(self):
+        raise PoolTimeout("couldn't get a connection after 5.00 sec")
+
+    async def __aexit__(self, *exc):
+        return None
+
+
+def test_snapshot_reports_occupancy_and_cumulative_histogram() -> None:
+    pool = _FakePool(
+        {"pool_min": 2, "pool_max": 10, "pool_size": 6, "pool_available": 1, "requests_waiting": 3}
+    )
+    metrics = PoolMetrics(pool, buckets=(0.01, 0.1))
+    for seconds in (0.001, 0.05, 0.05, 2.0):
+        metrics.observe_wait(seconds)
+
+    snap = metrics.snapshot()
+    assert snap["in_use"] == 5
+    assert snap["waiting"] == 3
+    assert snap["wait_seconds"]["buckets"] == {"0.01": 1, "0.1": 3, "+Inf": 4}
+    assert snap["wait_seconds"]["count"] == 4
+    assert snap["wait_seconds"]["sum"] == pytest.approx(2.101)
+
+
+def test_request_pool_wait_accumulates_per_request() -> None:
+    metrics = PoolMetrics(_FakePool())
+    metrics.observe_wait(1.0)  # outside a request: histogram only
+    begin_request_pool_wait()
+    metrics.observe_wait(0.002)
+    metrics.observe_wait(0.003)
+    assert request_pool_wait() == pytest.approx(0.005)
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_counts_pool_timeouts() -> None:
+    pool = _FakePool()
+    metrics = PoolMetrics(pool)
+    with pytest.raises(PoolTimeout):
+        async with PostgresUnitOfWork(pool, metrics):
+            pass
+    assert metrics.timeouts == 1
+    assert metrics.wait_count == 0
+
+
+def test_pools_are_exported_per_pool_label() -> None:
+    primary = PoolMetrics(_FakePool({"pool_size": 4, "pool_available": 1}))
+    replica = PoolMetrics(_FakePool({"pool_size": 2, "pool_available": 2}), name="replica0")
+    replica.observe_wait(0.002)
+    replica.observe_timeout()
+
+    lines = list(collect_pools([primary, replica]))
+    assert lines.count("# TYPE relrag_db_pool_in_use gauge") == 1
+    assert 'relrag_db_pool_in_use{pool="primary"} 3' in lines
+    assert 'relrag_db_pool_in_use{pool="replica0"} 0' in lines
+    assert 'relrag_db_pool_timeouts_total{pool="replica0"} 1' in lines
+    assert 'relrag_db_pool_wait_seconds_count{pool="replica0"} 1' in lines
+    assert primary.wait_count == 0
+
+
+class _Connection:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+
+    async def execute(self, query: str) -> None:
+        self.executed.append(query)
+
+
+class _IdlePool(_FakePool):
+    def __init__(self) -> None:
+        super().__init__()
+        self.conn = _Connection()
+
+    def connection(self):
+        pool = self
+
+        class _Checkout:
+            async def __aenter__(self):
+                return pool.conn
+
+            async def __aexit__(self, *exc):
+                return None
+
+        return _Checkout()
+
+
+@pytest.mark.asyncio
+async def test_read_only_unit_of_work_opens_read_only_transaction() -> None:
+    pool = _IdlePool()
+    async with PostgresUnitOfWork(pool, read_only=True):
+        pass
+    assert pool.conn.executed == ["SET TRANSACTION READ ONLY"]
+
+    pool = _IdlePool()
+    async with PostgresUnitOfWork(pool):
+        pass
+    assert pool.conn.executed == []
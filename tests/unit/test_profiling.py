@@ -0,0 +1,109 @@
+"""Unit tests for request profiling."""
+
+import pytest
+
+from relrag.infrastructure.observability.profiling import (
+    CpuProfiler,
+    ProfiledConnection,
+    ProfileStore,
+    RequestProfile,
+    activate_profile,
+    deactivate_profile,
+)
+from relrag.infrastructure.persistence.postgres.chunk_repository import PostgresChunkRepository
+
+
+class _FakeCursor:
+    def __init__(self, rows: list) -> None:
+        self._rows = rows
+        self.executed: list[str] = []
+
+    async def execute(self, query, params=None, **kwargs):
+        self.executed.append(query)
+        return self
+
+    async def fetchall(self) -> list:
+        return self._rows
+
+
+class _FakeConnection:
+    def __init__(self, rows: list | None = None, plan: list | None = None) -> None:
+        self._rows = rows or []
+        self._plan = plan or []
+        self.executed: list[str] = []
+
+    async def execute(self, query, params=None, **kwargs):
+        self.executed.append(query)
+        return _FakeCursor(self._plan)
+
+    def cursor(self, **kwargs) -> _FakeCursor:
+        return _FakeCursor(self._rows)
+
+
+@pytest.mark.asyncio
+async def test_profiled_connection_times_execute_and_cursor_execute() -> None:
+    profile = RequestProfile(method="GET", path="/x", trigger="header")
+    conn = ProfiledConnection(_FakeConnection(rows=[{"a": 1}]), profile)
+
+    await conn.execute("SELECT   1")
+    cur = conn.cursor()
+    await cur.execute("SELECT 2")
+    assert await cur.fetchall() == [{"a": 1}]
+
+    assert [q.sql for q in profile.queries] == ["SELECT 1", "SELECT 2"]
+    assert all(q.duration_ms >= 0 for q in profile.queries)
+    assert profile.summary()["query_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_statement_is_explained_only_when_requested() -> None:
+    plan = [("Limit  (actual time=0.1..0.2 rows=10 loops=1)",), ("  Buffers: shared hit=42",)]
+    raw = _FakeConnection(rows=[], plan=plan)
+    profile = RequestProfile(method="POST", path="/search", trigger="slow")
+    repo = PostgresChunkRepository(ProfiledConnection(raw, profile))
+
+    token = activate_profile(profile)
+    try:
+        await repo._fetch_dicts("SELECT * FROM chunk", [])
+        assert profile.plans == []
+        profile.explain = True
+        await repo._fetch_dicts("SELECT * FROM chunk", [])
+    finally:
+        deactivate_profile(token)
+
+    assert raw.executed == ["EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM chunk"]
+    assert profile.plans[0].plan.endswith("Buffers: shared hit=42")
+
+
+def test_profile_store_keeps_newest() -> None:
+    store = ProfileStore(max_size=2)
+    profiles = [RequestProfile(method="GET", path=f"/{i}", trigger="slow") for i in range(3)]
+    for p in profiles:
+        store.add(p)
+    assert [p.path for p in store.list()] == ["/2", "/1"]
+    assert store.get(profiles[0].id) is None
+
+
+def _busy() -> int:
+    return sum(i * i for i in range(2000))
+
+
+def test_cpu_profiler_reports_called_functions() -> None:
+    profiler = CpuProfiler()
+    assert profiler.start()
+    _busy()
+    report = profiler.stop()
+    assert profiler.name in ("pyinstrument", "cProfile")
+    assert "_busy" in report
+
+
+def test_cpu_profiler_runs_one_at_a_time() -> None:
+    first, second = CpuProfiler(), CpuProfiler()
+    assert first.start()
+    try:
+        assert not second.start()
+        assert second.stop() is None
+    finally:
+        first.stop()
+    assert second.start()
+    second.stop()
@@ -0,0 +1,48 @@
+"""Unit tests for property_repository._schema_items_from_facet_rows."""
+
+from relrag.domain.value_objects import PropertyType
+from relrag.infrastructure.persistence.postgres.property_repository import (
+    _schema_items_from_facet_rows,
+)
+
+
+def test_empty_rows() -> None:
+    assert _schema_items_from_facet_rows([]) == []
+
+
+def test_string_values_grouped_with_counts() -> None:
+    items = _schema_items_from_facet_rows(
+        [
+            ("author", "string", "Alice", 2, 3),
+            ("author", "string", "Bob", 1, 3),
+        ]
+    )
+    assert len(items) == 1
+    assert items[0].key == "author"
+    assert items[0].property_type == PropertyType.STRING
+    assert items[0].values == ["Alice", "Bob"]
+    assert items[0].counts == {"Alice": 2, "Bob": 1}
+    assert items[0].document_count == 3
+
+
+def test_numeric_key_has_count_but_no_values() -> None:
+    items = _schema_items_from_facet_rows([("page_count", "int", "10", 4, 9)])
+    assert items[0].values == []
+    assert items[0].counts == {}
+    assert items[0].document_count == 9
+
+
+def test_same_key_different_types_are_separate_items() -> None:
+    items = _schema_items_from_facet_rows(
+        [
+            ("flag", "bool", "true", 1, 1),
+            ("flag", "string", "yes", 2, 2),
+            ("lang", "string", "en", 5, 5),
+        ]
+    )
+    assert [(i.key, i.property_type) for i in items] == [
+        ("flag", PropertyType.BOOL),
+        ("flag", PropertyType.STRING),
+        ("lang", PropertyType.STRING),
+    ]
+    assert items[0].counts == {"true": 1}
@@ -0,0 +1,116 @@
+"""Unit tests for read replica routing."""
+
+import pytest
+from psycopg import OperationalError
+from psycopg_pool import PoolTimeout
+
+from relrag.infrastructure.observability.metrics import PoolMetrics
+from relrag.infrastructure.persistence.postgres.replicas import ReplicaSet
+
+
+class _FakeCursor:
+    def __init__(self, lag: float) -> None:
+        self._lag = lag
+
+    async def fetchone(self):
+        return (self._lag,)
+
+
+class _FakeConn:
+    def __init__(self, pool: "_FakeReplicaPool") -> None:
+        self._pool = pool
+
+    async def execute(self, query: str):
+        self._pool.lag_queries += 1
+        if self._pool.lag_error is not None:
+            raise self._pool.lag_error
+        return _FakeCursor(self._pool.lag)
+
+    async def rollback(self) -> None:
+        pass
+
+
+class _FakeReplicaPool:
+    def __init__(self, lag: float = 0.0, down: bool = False) -> None:
+        self.lag = lag
+        self.down = down
+        self.lag_queries = 0
+        self.checkouts = 0
+        self.returned = 0
+        self.lag_error: Exception | None = None
+
+    def connection(self, timeout: float | None = None):
+        pool = self
+
+        class _Checkout:
+            async def __aenter__(self):
+                if pool.down:
+                    raise PoolTimeout("replica down")
+                pool.checkouts += 1
+                return _FakeConn(pool)
+
+            async def __aexit__(self, *exc):
+                pool.returned += 1
+
+        return _Checkout()
+
+
+@pytest.mark.asyncio
+async def test_up_to_date_replica_is_used() -> None:
+    replica = _FakeReplicaPool(lag=0.5)
+    replicas = ReplicaSet([replica], max_lag_seconds=5, lag_check_interval=60)
+
+    assert await replicas.checkout() is not None
+    assert await replicas.checkout() is not None
+    assert replica.lag_queries == 1  # lag is cached for lag_check_interval
+
+
+@pytest.mark.asyncio
+async def test_lagging_replica_falls_back_to_primary() -> None:
+    replica = _FakeReplicaPool(lag=30)
+    replicas = ReplicaSet([replica], max_lag_seconds=5, lag_check_interval=60)
+
+    assert await replicas.checkout() is None
+    assert replica.returned == 1
+    assert await replicas.checkout() is None
+    assert replica.checkouts == 1  # known to lag: not even checked out again
+
+
+@pytest.mark.asyncio
+async def test_unavailable_replica_is_skipped() -> None:
+    down = _FakeReplicaPool(down=True)
+    healthy = _FakeReplicaPool()
+    replicas = ReplicaSet([down, healthy], unavailable_backoff=60)
+
+    for _ in range(3):
+        assert await replicas.checkout() is not None
+    assert healthy.checkouts == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_lag_check_returns_connection() -> None:
+    broken = _FakeReplicaPool()
+    broken.lag_error = OperationalError("connection lost")
+    healthy = _FakeReplicaPool()
+    replicas = ReplicaSet([broken, healthy], unavailable_backoff=60)
+
+    assert await replicas.checkout() is not None
+    assert broken.checkouts == broken.returned == 1
+
+    broken.lag_error = RuntimeError("unexpected")
+    replicas = ReplicaSet([broken])
+    with pytest.raises(RuntimeError):
+        await replicas.checkout()
+    assert broken.checkouts == broken.returned == 2
+
+
+@pytest.mark.asyncio
+async def test_replica_checkouts_are_metered_per_pool() -> None:
+    down = _FakeReplicaPool(down=True)
+    healthy = _FakeReplicaPool()
+    metrics = [PoolMetrics(down, name="replica0"), PoolMetrics(healthy, name="replica1")]
+    replicas = ReplicaSet([down, healthy], unavailable_backoff=60, metrics=metrics)
+
+    assert await replicas.checkout() is not None
+    assert metrics[0].timeouts == 1
+    assert metrics[1].wait_count == 1
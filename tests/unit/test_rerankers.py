@@ -0,0 +1,115 @@
+"""Unit tests for reranker implementations."""
+
+import json
+
+import httpx
+import pytest
+
+from relrag.infrastructure.reranking.cross_encoder_reranker import CrossEncoderReranker
+from relrag.infrastructure.reranking.http_reranker import HttpReranker
+
+
+@pytest.mark.asyncio
+async def test_http_reranker_maps_scores_to_input_order() -> None:
+    """Results come back sorted by relevance; scores are returned in input order."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.update(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"index": 1, "relevance_score": 0.9},
+                    {"index": 0, "relevance_score": 0.2},
+                ]
+            },
+        )
+
+    reranker = HttpReranker("http://rerank.local/rerank", model="bge-reranker")
+    reranker._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scores = await reranker.rerank("q", ["a", "b"])
+    await reranker.close()
+
+    assert scores == [0.2, 0.9]
+    assert seen == {"query": "q", "texts": ["a", "b"], "model": "bge-reranker"}
+
+
+@pytest.mark.asyncio
+async def test_http_reranker_texts_field_is_configurable() -> None:
+    """TEI-style list responses are accepted; the texts key follows texts_field."""
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.update(json.loads(request.content))
+        return httpx.Response(200, json=[{"index": 0, "score": 0.7}])
+
+    reranker = HttpReranker("http://rerank.local/rerank", texts_field="documents")
+    reranker._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    scores = await reranker.rerank("q", ["a"])
+    await reranker.close()
+
+    assert scores == [0.7]
+    assert seen == {"query": "q", "documents": ["a"]}
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_reranker_predicts_pairs() -> None:
+    """Each text is scored as a (query, text) pair."""
+
+    class _FakeModel:
+        def predict(self, pairs, **kwargs):
+            return [len(t) for _, t in pairs]
+
+    reranker = CrossEncoderReranker("m")
+    reranker._model = _FakeModel()
+    assert await reranker.rerank("q", ["a", "bbb"]) == [1.0, 3.0]
+    reranker.close()
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_reranker_sheds_load_while_predicting() -> None:
+    """A timed-out prediction keeps its worker; new calls fail fast until it finishes."""
+    import asyncio
+    import threading
+
+    from relrag.application.ports import RerankerBusy
+
+    release = threading.Event()
+
+    class _SlowModel:
+        def predict(self, pairs, **kwargs):
+            release.wait(timeout=5)
+            return [1.0 for _ in pairs]
+
+    reranker = CrossEncoderReranker("m")
+    reranker._model = _SlowModel()
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(reranker.rerank("q", ["a"]), timeout=0.05)
+    with pytest.raises(RerankerBusy):
+        await reranker.rerank("q", ["a"])
+
+    release.set()
+    for _ in range(100):
+        if reranker._slots.acquire(blocking=False):
+            reranker._slots.release()
+            break
+        await asyncio.sleep(0.01)
+    assert await reranker.rerank("q", ["a", "b"]) == [1.0, 1.0]
+    reranker.close()
+
+
+@pytest.mark.asyncio
+async def test_cross_encoder_reranker_warmup_runs_one_prediction() -> None:
+    calls = []
+
+    class _FakeModel:
+        def predict(self, pairs, **kwargs):
+            calls.append(pairs)
+            return [0.0 for _ in pairs]
+
+    reranker = CrossEncoderReranker("m")
+    reranker._model = _FakeModel()
+    await reranker.warmup()
+    assert calls == [[("warmup", "warmup")]]
+    reranker.close()
@@ -0,0 +1,26 @@
+"""Unit tests for the in-process search cache."""
+
+import pytest
+
+from relrag.infrastructure.cache.memory_cache import InMemorySearchCache
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used() -> None:
+    cache = InMemorySearchCache(max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_dropped() -> None:
+    cache = InMemorySearchCache(ttl_seconds=-1)
+    await cache.set("a", 1)
+    assert await cache.get("a") is None
+    assert "a" not in cache._entries
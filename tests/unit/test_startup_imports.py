@@ -0,0 +1,81 @@
+"""Startup import cost of the composition root (python -X importtime)."""
+
+import os
+import subprocess
+import sys
+
+# Cumulative import time of relrag.main; generous for slow CI runners
+STARTUP_IMPORT_BUDGET_MS = 2500
+
+# Loaded on first use only: file parsers, Keycloak client, OpenAI SDK, tracing SDK
+DEFERRED_MODULES = (
+    "pypdf",
+    "openpyxl",
+    "docx",
+    "pptx",
+    "ebooklib",
+    "keycloak",
+    "openai",
+    "opentelemetry.sdk",
+)
+
+# Imported only when settings enable them (or, for batch and federated search, on first request)
+OPTIONAL_MODULES = (
+    "relrag.application.use_cases.search.federated_search",
+    "relrag.infrastructure.reranking.factory",
+    "relrag.interfaces.api.middleware.profiling",
+    "relrag.interfaces.api.middleware.tracing",
+    "relrag.interfaces.api.middleware.warmup",
+    "relrag.interfaces.api.resources.batch_search",
+    "relrag.interfaces.api.resources.debug",
+    "relrag.interfaces.api.resources.federated_search",
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Cumulative import time (us) per module from python -X importtime."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_app_module_defers_heavy_dependencies() -> None:
+    times = _import_times("relrag.main")
+    loaded = [m for m in DEFERRED_MODULES if m in times]
+    assert loaded == []
+    assert times["relrag.main"] / 1000 < STARTUP_IMPORT_BUDGET_MS
+
+
+def test_building_the_app_defers_heavy_dependencies() -> None:
+    # Pools open on startup, so the app builds without a database
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(sys.path),
+        "DATABASE_URL": "postgresql://relrag@localhost:1/relrag",
+        "EMBEDDING_PROVIDER": "openai",
+        "EMBEDDING_API_KEY": "key",
+        "KEYCLOAK_CLIENT_SECRET": "secret",
+        "TRACING_EXPORTER": "none",
+    }
+    code = (
+        "import sys\n"
+        "from relrag.main import create_relrag_app\n"
+        "create_relrag_app()\n"
+        f"print(','.join(m for m in {DEFERRED_MODULES + OPTIONAL_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+    )
+    assert result.stdout.strip() == ""
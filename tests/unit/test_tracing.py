@@ -0,0 +1,83 @@
+"""Unit tests for tracing wrappers."""
+
+import falcon.asgi
+import pytest
+from falcon.testing import TestClient
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from relrag.application.dto.chunking_config import ChunkingConfig
+from relrag.domain.value_objects import ChunkingStrategy
+from relrag.infrastructure.chunking.recursive_chunker import RecursiveChunker
+from relrag.infrastructure.observability import tracing
+from relrag.infrastructure.observability.tracing import (
+    TracedChunker,
+    TracedEmbeddingProvider,
+    TracedRepository,
+)
+from relrag.interfaces.api.middleware.tracing import TracingMiddleware
+
+
+@pytest.fixture
+def spans(monkeypatch: pytest.MonkeyPatch) -> InMemorySpanExporter:
+    """Route the module tracer to an in-memory exporter (no global provider change)."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(tracing, "tracer", provider.get_tracer("relrag"))
+    return exporter
+
+
+class _Repo:
+    async def list_things(self, n: int) -> tuple[list[int], str | None]:
+        return list(range(n)), None
+
+    def sync_helper(self) -> str:
+        return "plain"
+
+
+@pytest.mark.asyncio
+async def test_traced_repository_records_result_count(spans: InMemorySpanExporter) -> None:
+    repo = TracedRepository(_Repo(), "things")
+    assert await repo.list_things(3) == ([0, 1, 2], None)
+    assert repo.sync_helper() == "plain"
+
+    (span,) = spans.get_finished_spans()
+    assert span.name == "things.list_things"
+    assert span.attributes["relrag.result_count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_traced_embedding_and_chunking(
+    spans: InMemorySpanExporter, mock_embedding_provider
+) -> None:
+    config = ChunkingConfig(chunk_size=100, chunk_overlap=0, strategy=ChunkingStrategy.RECURSIVE)
+    chunks = TracedChunker(RecursiveChunker()).chunk("word " * 100, config)
+    await TracedEmbeddingProvider(mock_embedding_provider).embed(chunks, dimensions=1536)
+
+    chunk_span, embed_span = spans.get_finished_spans()
+    assert chunk_span.attributes["relrag.chunk_count"] == len(chunks)
+    assert chunk_span.attributes["relrag.text_bytes"] == 500
+    assert embed_span.attributes["relrag.text_count"] == len(chunks)
+    assert embed_span.attributes["relrag.dimensions"] == 1536
+
+
+def test_tracing_middleware_names_span_by_route(
+    spans: InMemorySpanExporter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from relrag.interfaces.api.middleware import tracing as tracing_middleware
+
+    monkeypatch.setattr(tracing_middleware, "tracer", tracing.tracer)
+
+    class _Item:
+        async def on_get(self, req, resp, item_id):
+            resp.media = {"id": item_id}
+
+    app = falcon.asgi.App(middleware=[TracingMiddleware()])
+    app.add_route("/v1/items/{item_id}", _Item())
+    assert TestClient(app).simulate_get("/v1/items/42").status_code == 200
+
+    (span,) = spans.get_finished_spans()
+    assert span.name == "GET /v1/items/{item_id}"
+    assert span.attributes["http.response.status_code"] == 200
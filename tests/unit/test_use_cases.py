@@ -13,6 +13,7 @@ from relrag.application.use_cases.collection.create_collection import (
 from relrag.application.use_cases.collection.migrate_collection import (
     MigrateCollectionUseCase,
 )
+from relrag.application.use_cases.document.delete_document import DeleteDocumentUseCase
 from relrag.application.use_cases.document.get_document import GetDocumentUseCase
 from relrag.application.use_cases.document.load_document import LoadDocumentUseCase
 from relrag.application.use_cases.permission.assign_permission import (
@@ -33,11 +34,11 @@ from relrag.domain.entities import (
     Permission,
     Role,
 )
-from relrag.domain.exceptions import NotFound, PermissionDenied
-from relrag.domain.value_objects import ChunkingStrategy
+from relrag.domain.exceptions import NotFound, PermissionDenied, ValidationError
+from relrag.domain.value_objects import ChunkingStrategy, PermissionAction
 from relrag.infrastructure.chunking.recursive_chunker import RecursiveChunker
 
-from tests.conftest import FakeUnitOfWork
+from tests.conftest import FakeUnitOfWork, fake_uow_factory
 
 
 # --- CreateCollectionUseCase ---
@@ -102,9 +103,7 @@ async def test_create_collection_not_found_config() -> None:
 async def test_create_collection_not_found_admin_role() -> None:
     """CreateCollectionUseCase raises NotFound when admin role does not exist."""
     config_id = uuid4()
-    factory = _make_create_collection_factory(
-        config_id=config_id, has_admin_role=False
-    )
+    factory = _make_create_collection_factory(config_id=config_id, has_admin_role=False)
     use_case = CreateCollectionUseCase(unit_of_work_factory=factory)
 
     with pytest.raises(NotFound, match="admin"):
@@ -194,6 +193,34 @@ async def test_load_document_success(
     assert result.deleted_at is None
 
 
+@pytest.mark.asyncio
+async def test_load_document_rejects_wrong_embedding_dimensions(
+    mock_permission_checker,
+) -> None:
+    """LoadDocumentUseCase refuses embeddings whose length differs from the configuration."""
+    from unittest.mock import AsyncMock
+
+    from relrag.domain.exceptions import ValidationError
+
+    factory, collection_id = _load_document_uow_factory()
+    provider = AsyncMock()
+    provider.embed.side_effect = lambda texts, dimensions=None: [[0.1] * 1024 for _ in texts]
+    use_case = LoadDocumentUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        chunker=RecursiveChunker(),
+        embedding_provider=provider,
+    )
+
+    with pytest.raises(ValidationError, match="1024 dimensions"):
+        await use_case.execute(
+            user_id="user-1",
+            input_data=DocumentCreateInput(
+                collection_id=collection_id, content="test content", properties={}
+            ),
+        )
+
+
 @pytest.mark.asyncio
 async def test_load_document_deduplication(
     mock_permission_checker,
@@ -268,12 +295,63 @@ async def test_load_document_deduplication(
     mock_embedding_provider.embed.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_load_document_counts_properties_into_facets(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """LoadDocumentUseCase adds document properties to collection facets once per collection."""
+    collection_id = uuid4()
+    other_collection_id = uuid4()
+    uow = FakeUnitOfWork()
+    config = Configuration(
+        id=uuid4(),
+        chunking_strategy=ChunkingStrategy.RECURSIVE,
+        embedding_model="text-embedding-3-small",
+        embedding_dimensions=1536,
+        chunk_size=100,
+        chunk_overlap=20,
+    )
+    uow.configurations.add_for_collection(collection_id, config)
+    uow.configurations.add_for_collection(other_collection_id, config)
+
+    @asynccontextmanager
+    async def factory():
+        yield uow
+
+    use_case = LoadDocumentUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        chunker=RecursiveChunker(),
+        embedding_provider=mock_embedding_provider,
+    )
+
+    def _input(coll_id):
+        return DocumentCreateInput(
+            collection_id=coll_id,
+            content="Faceted content",
+            properties={"author": ("Alice", "string")},
+        )
+
+    await use_case.execute(user_id="user-1", input_data=_input(collection_id))
+    # Same document again into the same collection - must not be counted twice
+    await use_case.execute(user_id="user-1", input_data=_input(collection_id))
+    # Deduplicated into another collection - counted there
+    await use_case.execute(user_id="user-1", input_data=_input(other_collection_id))
+
+    schema = await uow.properties.list_schema_by_collection(collection_id)
+    assert len(schema) == 1
+    assert schema[0].key == "author"
+    assert schema[0].counts == {"Alice": 1}
+    assert schema[0].document_count == 1
+    other = await uow.properties.list_schema_by_collection(other_collection_id)
+    assert other[0].counts == {"Alice": 1}
+
+
 # --- GetDocumentUseCase ---
 
 
-def _get_document_uow_factory(
-    document_id=None, collection_id=None, has_pack_in_collection=True
-):
+def _get_document_uow_factory(document_id=None, collection_id=None, has_pack_in_collection=True):
     """Build UoW factory with document and pack for GetDocumentUseCase."""
     doc_id = document_id or uuid4()
     coll_id = collection_id or uuid4()
@@ -369,6 +447,120 @@ async def test_get_document_not_found(
         )
 
 
+@pytest.mark.asyncio
+async def test_delete_document_removes_it_from_facets(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """DeleteDocumentUseCase soft deletes the document and decrements its facets."""
+    collection_id = uuid4()
+    uow = FakeUnitOfWork()
+    config = Configuration(
+        id=uuid4(),
+        chunking_strategy=ChunkingStrategy.RECURSIVE,
+        embedding_model="text-embedding-3-small",
+        embedding_dimensions=1536,
+        chunk_size=100,
+        chunk_overlap=20,
+    )
+    uow.configurations.add_for_collection(collection_id, config)
+
+    @asynccontextmanager
+    async def factory():
+        yield uow
+
+    load = LoadDocumentUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        chunker=RecursiveChunker(),
+        embedding_provider=mock_embedding_provider,
+    )
+    kept = await load.execute(
+        "user-1",
+        DocumentCreateInput(
+            collection_id=collection_id, content="Kept", properties={"author": ("Alice", "string")}
+        ),
+    )
+    deleted = await load.execute(
+        "user-1",
+        DocumentCreateInput(
+            collection_id=collection_id, content="Gone", properties={"author": ("Bob", "string")}
+        ),
+    )
+
+    use_case = DeleteDocumentUseCase(
+        unit_of_work_factory=factory, permission_checker=mock_permission_checker
+    )
+    await use_case.execute("user-1", deleted.id, collection_id)
+
+    schema = await uow.properties.list_schema_by_collection(collection_id)
+    assert schema[0].counts == {"Alice": 1}
+    assert await uow.documents.get_by_id(deleted.id) is None
+    assert await uow.documents.get_by_id(kept.id) is not None
+    packs, _ = await uow.packs.list(document_id=deleted.id)
+    assert packs == []
+    with pytest.raises(NotFound, match="Document"):
+        await use_case.execute("user-1", deleted.id, collection_id)
+
+
+@pytest.mark.asyncio
+async def test_delete_shared_document_needs_delete_on_every_collection(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """A document deduplicated into two collections is deleted from both, or not at all."""
+    uow = FakeUnitOfWork()
+    config = Configuration(
+        id=uuid4(),
+        chunking_strategy=ChunkingStrategy.RECURSIVE,
+        embedding_model="text-embedding-3-small",
+        embedding_dimensions=1536,
+        chunk_size=100,
+        chunk_overlap=20,
+    )
+    now = datetime.now(UTC)
+    first, second = uuid4(), uuid4()
+    for coll_id in (first, second):
+        await uow.collections.create(
+            Collection(id=coll_id, configuration_id=config.id, created_at=now, updated_at=now)
+        )
+        uow.configurations.add_for_collection(coll_id, config)
+
+    @asynccontextmanager
+    async def factory():
+        yield uow
+
+    load = LoadDocumentUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        chunker=RecursiveChunker(),
+        embedding_provider=mock_embedding_provider,
+    )
+    for coll_id in (first, second):
+        doc = await load.execute(
+            "user-1", DocumentCreateInput(collection_id=coll_id, content="Shared", properties={})
+        )
+    versions = {c: await uow.collections.get_version(c) for c in (first, second)}
+
+    async def check(user_id, collection_id, action):
+        assert action == PermissionAction.DELETE
+        return collection_id == first
+
+    mock_permission_checker.check.side_effect = check
+    use_case = DeleteDocumentUseCase(
+        unit_of_work_factory=factory, permission_checker=mock_permission_checker
+    )
+    with pytest.raises(PermissionDenied):
+        await use_case.execute("user-1", doc.id, first)
+    assert await uow.documents.get_by_id(doc.id) is not None
+
+    mock_permission_checker.check.side_effect = None
+    await use_case.execute("user-1", doc.id, first)
+    assert await uow.documents.get_by_id(doc.id) is None
+    for coll_id in (first, second):
+        assert await uow.collections.get_version(coll_id) == versions[coll_id] + 1
+
+
 # --- HybridSearchUseCase ---
 
 
@@ -451,11 +643,13 @@ async def test_hybrid_search_success(
         embedding_provider=mock_embedding_provider,
     )
 
-    results = await use_case.execute(
+    output = await use_case.execute(
         user_id="user-1",
         input_data=HybridSearchInput(collection_id=coll_id, query="search"),
     )
+    results = output.results
 
+    assert output.facets == {}
     assert len(results) == 1
     assert results[0].chunk_id == chunk_id
     assert results[0].pack_id == pack_id
@@ -468,118 +662,868 @@ async def test_hybrid_search_success(
     assert results[0].metadata == {"author": "Tester"}
 
 
-# --- MigrateCollectionUseCase ---
+@pytest.mark.asyncio
+async def test_hybrid_search_with_facets(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """HybridSearchUseCase returns facet counts for requested keys."""
+    factory, coll_id = _hybrid_search_uow_factory()
 
+    @asynccontextmanager
+    async def factory_with_facets():
+        async with factory() as uow:
+            uow.chunks.set_search_facets({"author": {"Alice": 2, "Bob": 1}, "language": {"en": 3}})
+            yield uow
 
-def _migrate_uow_factory(collection_id, new_config_id, packs_with_docs):
-    """Build UoW with collection, configs, packs, documents for migrate."""
-    now = datetime.now(UTC)
-    coll = Collection(
-        id=collection_id,
-        configuration_id=uuid4(),  # old config
-        created_at=now,
-        updated_at=now,
-        deleted_at=None,
-    )
-    new_config = Configuration(
-        id=new_config_id,
-        chunking_strategy=ChunkingStrategy.RECURSIVE,
-        embedding_model="text-embedding-3-small",
-        embedding_dimensions=1536,
-        chunk_size=50,
-        chunk_overlap=10,
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory_with_facets,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
     )
 
-    @asynccontextmanager
-    async def factory():
-        uow = FakeUnitOfWork()
-        uow.collections._by_id[collection_id] = coll
-        uow.configurations._by_id[new_config_id] = new_config
-        for doc, pack in packs_with_docs:
-            await uow.documents.create(doc)
-            await uow.packs.create(pack)
-            await uow.packs.add_to_collection(pack.id, collection_id)
-        yield uow
+    output = await use_case.execute(
+        user_id="user-1",
+        input_data=HybridSearchInput(collection_id=coll_id, query="q", facets=["author"]),
+    )
 
-    return factory
+    assert len(output.results) == 1
+    assert output.facets == {"author": {"Alice": 2, "Bob": 1}}
 
 
 @pytest.mark.asyncio
-async def test_migrate_collection_permission_denied(
+async def test_hybrid_search_cursor_pagination(
+    mock_permission_checker,
     mock_embedding_provider,
 ) -> None:
-    """MigrateCollectionUseCase raises PermissionDenied when user has no migrate access."""
+    """HybridSearchUseCase pages through results with next_cursor without repeats."""
+    rows = [
+        {
+            "chunk_id": uuid4(),
+            "pack_id": uuid4(),
+            "document_id": uuid4(),
+            "content": f"chunk {i}",
+            "vector_score": 0.5,
+            "fts_score": 0.0,
+            "score": score,
+            "doc_props": None,
+        }
+        for i, score in enumerate([0.9, 0.8, 0.8, 0.1, 0.05])
+    ]
+    factory, coll_id = _hybrid_search_uow_factory(search_results=rows)
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+    )
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        output = await use_case.execute(
+            user_id="user-1",
+            input_data=HybridSearchInput(collection_id=coll_id, query="q", limit=2, cursor=cursor),
+        )
+        pages += 1
+        seen.extend(r.chunk_id for r in output.results)
+        cursor = output.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert sorted(seen) == sorted(r["chunk_id"] for r in rows)
+    assert len(set(seen)) == len(rows)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_cursor_pages_reuse_query_embedding(
+    mock_permission_checker,
+) -> None:
+    """Later pages rank with the first page's embedding, not a fresh (different) one."""
     from unittest.mock import AsyncMock
 
-    coll_id = uuid4()
-    config_id = uuid4()
-    now = datetime.now(UTC)
-    doc = Document(
-        id=uuid4(),
-        content="x",
-        source_hash=b"a" * 16,
-        created_at=now,
-        updated_at=now,
-        deleted_at=None,
-    )
-    pack = Pack(
-        id=uuid4(),
-        document_id=doc.id,
-        created_at=now,
-        updated_at=now,
-        deleted_at=None,
-    )
-    factory = _migrate_uow_factory(coll_id, config_id, [(doc, pack)])
-    perm_checker = AsyncMock()
-    perm_checker.check.return_value = False
+    from relrag.infrastructure.cache.memory_cache import InMemorySearchCache
 
-    use_case = MigrateCollectionUseCase(
+    rows = [
+        {
+            "chunk_id": uuid4(),
+            "pack_id": uuid4(),
+            "document_id": uuid4(),
+            "content": f"chunk {i}",
+            "vector_score": 0.5,
+            "fts_score": 0.0,
+            "score": 1 - i / 10,
+            "doc_props": None,
+        }
+        for i in range(5)
+    ]
+    factory, coll_id = _hybrid_search_uow_factory(search_results=rows)
+    calls = 0
+
+    async def _embed(texts: list[str], dimensions: int | None = None) -> list[list[float]]:
+        nonlocal calls
+        calls += 1
+        return [[0.1 * calls] * (dimensions or 1536) for _ in texts]
+
+    provider = AsyncMock()
+    provider.embed = AsyncMock(side_effect=_embed)
+    use_case = HybridSearchUseCase(
         unit_of_work_factory=factory,
-        permission_checker=perm_checker,
-        chunker=RecursiveChunker(),
-        embedding_provider=mock_embedding_provider,
+        permission_checker=mock_permission_checker,
+        embedding_provider=provider,
+        cursor_cache=InMemorySearchCache(),
     )
 
-    with pytest.raises(PermissionDenied, match="migrate"):
-        await use_case.execute("user-1", coll_id, config_id)
+    cursor, pages = None, 0
+    while True:
+        output = await use_case.execute(
+            user_id="user-1",
+            input_data=HybridSearchInput(collection_id=coll_id, query="q", limit=2, cursor=cursor),
+        )
+        pages += 1
+        cursor = output.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert calls == 1
 
 
 @pytest.mark.asyncio
-async def test_migrate_collection_success(
+async def test_hybrid_search_rejects_non_positive_limit(
     mock_permission_checker,
     mock_embedding_provider,
 ) -> None:
-    """MigrateCollectionUseCase re-chunks and re-embeds documents."""
-    coll_id = uuid4()
-    config_id = uuid4()
-    now = datetime.now(UTC)
-    doc = Document(
-        id=uuid4(),
-        content="Hello world test content for chunking.",
-        source_hash=b"a" * 16,
-        created_at=now,
-        updated_at=now,
-        deleted_at=None,
-    )
-    pack = Pack(
-        id=uuid4(),
-        document_id=doc.id,
-        created_at=now,
-        updated_at=now,
-        deleted_at=None,
-    )
-    factory = _migrate_uow_factory(coll_id, config_id, [(doc, pack)])
+    """limit < 1 is a validation error, not an empty page with a cursor."""
+    from relrag.domain.exceptions import ValidationError
 
-    use_case = MigrateCollectionUseCase(
+    rows = [
+        {
+            "chunk_id": uuid4(),
+            "pack_id": uuid4(),
+            "document_id": uuid4(),
+            "content": "c",
+            "vector_score": 0.5,
+            "fts_score": 0.0,
+            "score": 0.5,
+            "doc_props": None,
+        }
+    ]
+    factory, coll_id = _hybrid_search_uow_factory(search_results=rows)
+    use_case = HybridSearchUseCase(
         unit_of_work_factory=factory,
         permission_checker=mock_permission_checker,
-        chunker=RecursiveChunker(),
         embedding_provider=mock_embedding_provider,
     )
 
-    count = await use_case.execute("user-1", coll_id, config_id)
-
-    assert count == 1
+    with pytest.raises(ValidationError, match="limit"):
+        await use_case.execute(
+            user_id="user-1",
+            input_data=HybridSearchInput(collection_id=coll_id, query="q", limit=0),
+        )
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_cursor_rejected_for_other_query(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """A cursor from one query cannot be replayed against different parameters."""
+    from relrag.domain.exceptions import ValidationError
+
+    rows = [
+        {
+            "chunk_id": uuid4(),
+            "pack_id": uuid4(),
+            "document_id": uuid4(),
+            "content": "c",
+            "vector_score": 0.5,
+            "fts_score": 0.0,
+            "score": 0.5,
+            "doc_props": None,
+        }
+        for _ in range(3)
+    ]
+    factory, coll_id = _hybrid_search_uow_factory(search_results=rows)
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+    )
+    first = await use_case.execute(
+        user_id="user-1",
+        input_data=HybridSearchInput(collection_id=coll_id, query="q", limit=1),
+    )
+    assert first.next_cursor
+
+    with pytest.raises(ValidationError, match="does not match"):
+        await use_case.execute(
+            user_id="user-1",
+            input_data=HybridSearchInput(
+                collection_id=coll_id, query="other", limit=1, cursor=first.next_cursor
+            ),
+        )
+    with pytest.raises(ValidationError, match="Invalid cursor"):
+        await use_case.execute(
+            user_id="user-1",
+            input_data=HybridSearchInput(collection_id=coll_id, query="q", cursor="garbage"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_group_by_document(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """group_by=document returns top documents with at most chunks_per_document chunks each."""
+    doc_a, doc_b, doc_c = uuid4(), uuid4(), uuid4()
+    rows = [
+        {
+            "chunk_id": uuid4(),
+            "pack_id": uuid4(),
+            "document_id": doc_id,
+            "content": f"chunk {i}",
+            "vector_score": 0.5,
+            "fts_score": 0.0,
+            "score": score,
+            "doc_props": {"title": f"Doc {i}"},
+        }
+        for i, (doc_id, score) in enumerate(
+            [(doc_a, 0.9), (doc_a, 0.85), (doc_a, 0.8), (doc_b, 0.7), (doc_c, 0.6)]
+        )
+    ]
+    factory, coll_id = _hybrid_search_uow_factory(search_results=rows)
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+    )
+
+    first = await use_case.execute(
+        user_id="user-1",
+        input_data=HybridSearchInput(
+            collection_id=coll_id, query="q", limit=2, group_by="document", chunks_per_document=2
+        ),
+    )
+    assert first.documents is not None
+    assert [d.document_id for d in first.documents] == [doc_a, doc_b]
+    assert [c.score for c in first.documents[0].chunks] == [0.9, 0.85]
+    assert first.documents[0].score == 0.9
+    assert len(first.results) == 3
+    assert first.next_cursor
+
+    second = await use_case.execute(
+        user_id="user-1",
+        input_data=HybridSearchInput(
+            collection_id=coll_id,
+            query="q",
+            limit=2,
+            group_by="document",
+            chunks_per_document=2,
+            cursor=first.next_cursor,
+        ),
+    )
+    assert [d.document_id for d in second.documents] == [doc_c]
+    assert second.next_cursor is None
+
+    with pytest.raises(ValidationError, match="limit"):
+        await use_case.execute(
+            user_id="user-1",
+            input_data=HybridSearchInput(
+                collection_id=coll_id, query="q", limit=0, group_by="document"
+            ),
+        )
+    empty = HybridSearchUseCase._grouped_output(rows, {}, 0, "fingerprint")
+    assert empty.documents == []
+    assert empty.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_group_by_invalid(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """Unknown group_by values are rejected."""
+    from relrag.domain.exceptions import ValidationError
+
+    factory, coll_id = _hybrid_search_uow_factory(search_results=[])
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+    )
+    with pytest.raises(ValidationError, match="group_by"):
+        await use_case.execute(
+            user_id="user-1",
+            input_data=HybridSearchInput(collection_id=coll_id, query="q", group_by="pack"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_execute_batch(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """execute_batch embeds all queries in one call and issues one repository batch."""
+    from relrag.application.use_cases.search.hybrid_search import BatchSearchQuery
+
+    uow = FakeUnitOfWork()
+    uow.chunks.set_search_results(
+        [
+            {
+                "chunk_id": uuid4(),
+                "pack_id": uuid4(),
+                "document_id": uuid4(),
+                "content": "c",
+                "vector_score": 0.5,
+                "fts_score": 0.0,
+                "score": score,
+                "doc_props": None,
+            }
+            for score in (0.9, 0.8, 0.7)
+        ]
+    )
+
+    @asynccontextmanager
+    async def factory():
+        yield uow
+
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+    )
+    batches = await use_case.execute_batch(
+        "user-1", uuid4(), [BatchSearchQuery(query="a", limit=1), BatchSearchQuery(query="b")]
+    )
+
+    assert [len(b) for b in batches] == [1, 3]
+    mock_embedding_provider.embed.assert_awaited_once_with(["a", "b"], dimensions=None)
+    assert mock_permission_checker.check.await_count == 1
+    assert uow.chunks.search_many_calls == 1
+
+
+def _rerank_rows(n: int) -> list[dict]:
+    return [
+        {
+            "chunk_id": uuid4(),
+            "pack_id": uuid4(),
+            "document_id": uuid4(),
+            "content": f"chunk {i}",
+            "vector_score": 0.5,
+            "fts_score": 0.0,
+            "score": 1.0 - i / 10,
+            "doc_props": None,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_rerank_reorders_top_k(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """rerank=True scores top-K candidates with the reranker and returns the best limit."""
+    from unittest.mock import AsyncMock
+
+    factory, coll_id = _hybrid_search_uow_factory(search_results=_rerank_rows(5))
+    reranker = AsyncMock()
+    reranker.rerank.side_effect = lambda query, texts: [float(i) for i in range(len(texts))]
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+        reranker=reranker,
+        rerank_top_k=4,
+    )
+    output = await use_case.execute(
+        user_id="user-1",
+        input_data=HybridSearchInput(collection_id=coll_id, query="q", limit=2, rerank=True),
+    )
+
+    assert output.reranked
+    assert [r.content for r in output.results] == ["chunk 3", "chunk 2"]
+    assert output.results[0].rerank_score == 3.0
+    assert output.next_cursor is None
+    assert len(reranker.rerank.await_args.args[1]) == 4
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_rerank_bypassed_over_budget(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """A reranker slower than the budget is bypassed and retrieval order is kept."""
+    import asyncio
+
+    class _SlowReranker:
+        async def rerank(self, query: str, texts: list[str]) -> list[float]:
+            await asyncio.sleep(1)
+            return [0.0] * len(texts)
+
+    factory, coll_id = _hybrid_search_uow_factory(search_results=_rerank_rows(3))
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+        reranker=_SlowReranker(),
+        rerank_timeout=0.01,
+    )
+    output = await use_case.execute(
+        user_id="user-1",
+        input_data=HybridSearchInput(collection_id=coll_id, query="q", limit=2, rerank=True),
+    )
+
+    assert not output.reranked
+    assert [r.content for r in output.results] == ["chunk 0", "chunk 1"]
+    assert output.results[0].rerank_score is None
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_rerank_skipped_when_busy(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """A reranker at capacity is skipped without waiting for the budget."""
+    from relrag.application.ports import RerankerBusy
+
+    class _BusyReranker:
+        async def rerank(self, query: str, texts: list[str]) -> list[float]:
+            raise RerankerBusy("busy")
+
+    factory, coll_id = _hybrid_search_uow_factory(search_results=_rerank_rows(3))
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+        reranker=_BusyReranker(),
+    )
+    output = await use_case.execute(
+        user_id="user-1",
+        input_data=HybridSearchInput(collection_id=coll_id, query="q", limit=2, rerank=True),
+    )
+
+    assert not output.reranked
+    assert [r.content for r in output.results] == ["chunk 0", "chunk 1"]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_rerank_rejects_cursor(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """Reranked results are a single page, so a cursor is rejected."""
+    from relrag.domain.exceptions import ValidationError
+
+    factory, coll_id = _hybrid_search_uow_factory()
+    use_case = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+    )
+    with pytest.raises(ValidationError, match="rerank"):
+        await use_case.execute(
+            user_id="user-1",
+            input_data=HybridSearchInput(
+                collection_id=coll_id, query="q", rerank=True, cursor="abc"
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_cache_invalidated_by_load(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """Repeated searches are served from cache until a document load bumps the version."""
+    from datetime import UTC, datetime
+
+    from relrag.domain.entities import Collection
+    from relrag.infrastructure.cache.memory_cache import InMemorySearchCache
+
+    uow = FakeUnitOfWork()
+    now = datetime.now(UTC)
+    coll_id = uuid4()
+    await uow.collections.create(
+        Collection(id=coll_id, configuration_id=uuid4(), created_at=now, updated_at=now)
+    )
+    uow.configurations.add_for_collection(
+        coll_id,
+        Configuration(
+            id=uuid4(),
+            chunking_strategy=ChunkingStrategy.RECURSIVE,
+            embedding_model="text-embedding-3-small",
+            embedding_dimensions=1536,
+            chunk_size=100,
+            chunk_overlap=20,
+        ),
+    )
+
+    @asynccontextmanager
+    async def factory():
+        yield uow
+
+    search = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+        search_cache=InMemorySearchCache(),
+    )
+    query = HybridSearchInput(collection_id=coll_id, query="q", limit=2)
+    uow.chunks.set_search_results(_rerank_rows(1))
+    first = await search.execute(user_id="user-1", input_data=query)
+
+    uow.chunks.set_search_results(_rerank_rows(2))
+    assert await search.execute(user_id="user-1", input_data=query) is first
+    other = await search.execute(
+        user_id="user-1", input_data=HybridSearchInput(collection_id=coll_id, query="q", limit=3)
+    )
+    assert len(other.results) == 2
+
+    loader = LoadDocumentUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        chunker=RecursiveChunker(),
+        embedding_provider=mock_embedding_provider,
+    )
+    await loader.execute(
+        user_id="user-1",
+        input_data=DocumentCreateInput(collection_id=coll_id, content="new text", properties={}),
+    )
+    after_load = await search.execute(user_id="user-1", input_data=query)
+    assert len(after_load.results) == 2
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_caches_under_version_of_searching_connection(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """A search on a lagging replica is cached under that replica's (older) version."""
+    from datetime import UTC, datetime
+
+    from relrag.domain.entities import Collection
+    from relrag.infrastructure.cache.memory_cache import InMemorySearchCache
+
+    now = datetime.now(UTC)
+    coll_id = uuid4()
+    fresh, lagging = FakeUnitOfWork(), FakeUnitOfWork()
+    for uow, version in ((fresh, 5), (lagging, 4)):
+        await uow.collections.create(
+            Collection(
+                id=coll_id,
+                configuration_id=uuid4(),
+                created_at=now,
+                updated_at=now,
+                version=version,
+            )
+        )
+    lagging.chunks.set_search_results(_rerank_rows(1))
+    replicas = iter([fresh, lagging])
+
+    @asynccontextmanager
+    async def factory():
+        yield next(replicas)
+
+    cache = InMemorySearchCache()
+    search = HybridSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        embedding_provider=mock_embedding_provider,
+        search_cache=cache,
+    )
+    await search.execute(
+        user_id="user-1", input_data=HybridSearchInput(collection_id=coll_id, query="q")
+    )
+
+    assert [key.split(":")[2] for key in cache._entries] == ["4"]
+
+
+# --- FederatedSearchUseCase ---
+
+
+@pytest.mark.asyncio
+async def test_federated_search_fuses_allowed_collections(mock_embedding_provider) -> None:
+    """FederatedSearchUseCase embeds once and searches only readable, compatible collections."""
+    from unittest.mock import AsyncMock
+
+    from relrag.application.use_cases.search.federated_search import (
+        FederatedSearchInput,
+        FederatedSearchUseCase,
+    )
+
+    coll_a, coll_b, coll_c = uuid4(), uuid4(), uuid4()
+    rows = [
+        {
+            "chunk_id": uuid4(),
+            "pack_id": uuid4(),
+            "document_id": uuid4(),
+            "collection_id": coll_id,
+            "content": "chunk",
+            "vector_score": 0.5,
+            "fts_score": 0.0,
+            "score": score,
+            "doc_props": None,
+        }
+        for coll_id, score in [(coll_a, 0.9), (coll_c, 0.8), (coll_a, 0.7)]
+    ]
+    uow = FakeUnitOfWork()
+    uow.chunks.set_search_results(rows)
+    for coll_id, dims in [(coll_a, 1536), (coll_b, 768), (coll_c, 1536)]:
+        uow.configurations._by_collection[coll_id] = Configuration(
+            id=uuid4(),
+            chunking_strategy=ChunkingStrategy.RECURSIVE,
+            embedding_model="text-embedding-3-small",
+            embedding_dimensions=dims,
+            chunk_size=500,
+            chunk_overlap=50,
+        )
+
+    @asynccontextmanager
+    async def factory():
+        yield uow
+
+    perm_checker = AsyncMock()
+    perm_checker.filter_allowed.return_value = [coll_a, coll_b]
+    use_case = FederatedSearchUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=perm_checker,
+        embedding_provider=mock_embedding_provider,
+    )
+    output = await use_case.execute(
+        user_id="user-1",
+        input_data=FederatedSearchInput(
+            collection_ids=[coll_a, coll_b, coll_c, coll_a], query="q", limit=5
+        ),
+    )
+
+    assert [r.score for r in output.results] == [0.9, 0.7]
+    assert {r.collection_id for r in output.results} == {coll_a}
+    assert output.skipped_collection_ids == [coll_b, coll_c]
+    perm_checker.filter_allowed.assert_awaited_once()
+    assert mock_embedding_provider.embed.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_federated_search_no_access(mock_embedding_provider) -> None:
+    """FederatedSearchUseCase raises PermissionDenied when no collection is readable."""
+    from unittest.mock import AsyncMock
+
+    from relrag.application.use_cases.search.federated_search import (
+        FederatedSearchInput,
+        FederatedSearchUseCase,
+    )
+
+    perm_checker = AsyncMock()
+    perm_checker.filter_allowed.return_value = []
+    use_case = FederatedSearchUseCase(
+        unit_of_work_factory=fake_uow_factory,
+        permission_checker=perm_checker,
+        embedding_provider=mock_embedding_provider,
+    )
+    with pytest.raises(PermissionDenied):
+        await use_case.execute(
+            user_id="user-1",
+            input_data=FederatedSearchInput(collection_ids=[uuid4()], query="q"),
+        )
+    mock_embedding_provider.embed.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_permission_checker_filter_allowed() -> None:
+    """RelRAGPermissionChecker.filter_allowed honours role actions and overrides."""
+    from relrag.domain.value_objects import PermissionAction
+    from relrag.infrastructure.permission.permission_checker import RelRAGPermissionChecker
+
+    uow = FakeUnitOfWork()
+    viewer = Role(id=uuid4(), name="viewer", description="Viewer")
+    uow.roles.add_role(viewer)
+    now = datetime.now(UTC)
+    coll_role, coll_override, coll_none = uuid4(), uuid4(), uuid4()
+    for coll_id, override in [(coll_role, None), (coll_override, ["write"])]:
+        await uow.permissions.create(
+            Permission(
+                id=uuid4(),
+                collection_id=coll_id,
+                subject="user-1",
+                role_id=viewer.id,
+                actions_override=override,
+                created_at=now,
+                created_by="admin",
+            )
+        )
+
+    @asynccontextmanager
+    async def factory():
+        yield uow
+
+    checker = RelRAGPermissionChecker(factory)
+    allowed = await checker.filter_allowed(
+        "user-1", [coll_none, coll_override, coll_role], PermissionAction.READ
+    )
+    assert allowed == [coll_role]
+
+
+# --- MigrateCollectionUseCase ---
+
+
+def _migrate_uow_factory(collection_id, new_config_id, packs_with_docs):
+    """Build UoW with collection, configs, packs, documents for migrate."""
+    now = datetime.now(UTC)
+    coll = Collection(
+        id=collection_id,
+        configuration_id=uuid4(),  # old config
+        created_at=now,
+        updated_at=now,
+        deleted_at=None,
+    )
+    new_config = Configuration(
+        id=new_config_id,
+        chunking_strategy=ChunkingStrategy.RECURSIVE,
+        embedding_model="text-embedding-3-small",
+        embedding_dimensions=1536,
+        chunk_size=50,
+        chunk_overlap=10,
+    )
+
+    @asynccontextmanager
+    async def factory():
+        uow = FakeUnitOfWork()
+        uow.collections._by_id[collection_id] = coll
+        uow.configurations._by_id[new_config_id] = new_config
+        for doc, pack in packs_with_docs:
+            await uow.documents.create(doc)
+            await uow.packs.create(pack)
+            await uow.packs.add_to_collection(pack.id, collection_id)
+        yield uow
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_migrate_collection_permission_denied(
+    mock_embedding_provider,
+) -> None:
+    """MigrateCollectionUseCase raises PermissionDenied when user has no migrate access."""
+    from unittest.mock import AsyncMock
+
+    coll_id = uuid4()
+    config_id = uuid4()
+    now = datetime.now(UTC)
+    doc = Document(
+        id=uuid4(),
+        content="x",
+        source_hash=b"a" * 16,
+        created_at=now,
+        updated_at=now,
+        deleted_at=None,
+    )
+    pack = Pack(
+        id=uuid4(),
+        document_id=doc.id,
+        created_at=now,
+        updated_at=now,
+        deleted_at=None,
+    )
+    factory = _migrate_uow_factory(coll_id, config_id, [(doc, pack)])
+    perm_checker = AsyncMock()
+    perm_checker.check.return_value = False
+
+    use_case = MigrateCollectionUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=perm_checker,
+        chunker=RecursiveChunker(),
+        embedding_provider=mock_embedding_provider,
+    )
+
+    with pytest.raises(PermissionDenied, match="migrate"):
+        await use_case.execute("user-1", coll_id, config_id)
+
+
+@pytest.mark.asyncio
+async def test_migrate_collection_success(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """MigrateCollectionUseCase re-chunks and re-embeds documents."""
+    coll_id = uuid4()
+    config_id = uuid4()
+    now = datetime.now(UTC)
+    doc = Document(
+        id=uuid4(),
+        content="Hello world test content for chunking.",
+        source_hash=b"a" * 16,
+        created_at=now,
+        updated_at=now,
+        deleted_at=None,
+    )
+    pack = Pack(
+        id=uuid4(),
+        document_id=doc.id,
+        created_at=now,
+        updated_at=now,
+        deleted_at=None,
+    )
+    factory = _migrate_uow_factory(coll_id, config_id, [(doc, pack)])
+
+    use_case = MigrateCollectionUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        chunker=RecursiveChunker(),
+        embedding_provider=mock_embedding_provider,
+    )
+
+    count = await use_case.execute("user-1", coll_id, config_id)
+
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_migrate_collection_bumps_collections_sharing_its_packs(
+    mock_permission_checker,
+    mock_embedding_provider,
+) -> None:
+    """Re-chunked packs shared with another collection invalidate its cached searches too."""
+    now = datetime.now(UTC)
+    uow = FakeUnitOfWork()
+    migrated, sharing = uuid4(), uuid4()
+    for coll_id in (migrated, sharing):
+        await uow.collections.create(
+            Collection(id=coll_id, configuration_id=uuid4(), created_at=now, updated_at=now)
+        )
+    config = Configuration(
+        id=uuid4(),
+        chunking_strategy=ChunkingStrategy.RECURSIVE,
+        embedding_model="text-embedding-3-small",
+        embedding_dimensions=1536,
+        chunk_size=50,
+        chunk_overlap=10,
+    )
+    uow.configurations._by_id[config.id] = config
+    doc = Document(
+        id=uuid4(), content="Shared text", source_hash=b"s" * 16, created_at=now, updated_at=now
+    )
+    pack = Pack(id=uuid4(), document_id=doc.id, created_at=now, updated_at=now)
+    await uow.documents.create(doc)
+    await uow.packs.create(pack)
+    for coll_id in (migrated, sharing):
+        await uow.packs.add_to_collection(pack.id, coll_id)
+
+    @asynccontextmanager
+    async def factory():
+        yield uow
+
+    use_case = MigrateCollectionUseCase(
+        unit_of_work_factory=factory,
+        permission_checker=mock_permission_checker,
+        chunker=RecursiveChunker(),
+        embedding_provider=mock_embedding_provider,
+    )
+    await use_case.execute("user-1", migrated, config.id)
+
+    assert await uow.collections.get_version(sharing) == 1
 
 
 # --- AssignPermissionUseCase ---
@@ -672,9 +1616,7 @@ async def test_assign_permission_update_existing(
 ) -> None:
     """AssignPermissionUseCase updates existing permission."""
     coll_id = uuid4()
-    factory, _, viewer_role = _assign_permission_uow_factory(
-        coll_id, has_existing=True
-    )
+    factory, _, viewer_role = _assign_permission_uow_factory(coll_id, has_existing=True)
 
     use_case = AssignPermissionUseCase(
         unit_of_work_factory=factory,
@@ -691,6 +1633,7 @@ async def test_assign_permission_update_existing(
 
 def _revoke_permission_uow_factory(collection_id, has_permission=True):
     """Build UoW for RevokePermissionUseCase."""
+
     @asynccontextmanager
     async def factory():
         uow = FakeUnitOfWork()